@@ -0,0 +1,125 @@
+"""
+Optional compiled kernels for the clinical statistical engine.
+
+The kernels are only used when numba is installed and the data is large
+enough for compilation and dispatch overhead to pay off; otherwise the
+engine falls back to its NumPy implementation.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum number of rows before the compiled kernels are used
+NUMBA_MIN_ROWS = 10_000
+
+# Column order of the continuous_group_stats result
+CONTINUOUS_GROUP_STATS_FIELDS = (
+    "N",
+    "Mean",
+    "SD",
+    "Variance",
+    "Median",
+    "Min",
+    "Max",
+    "Q1",
+    "Q3",
+)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nogil=True, cache=True)
+    def _sorted_quantile(sorted_values, q):
+        position = q * (sorted_values.shape[0] - 1)
+        lower = int(position)
+        fraction = position - lower
+        if fraction == 0.0:
+            return sorted_values[lower]
+        low = sorted_values[lower]
+        high = sorted_values[lower + 1]
+        return low + (high - low) * fraction
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _continuous_group_stats(values, codes, n_groups):
+        # Bucket non-missing values by group (rows with code -1 are skipped)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(values.shape[0]):
+            if codes[i] >= 0 and not np.isnan(values[i]):
+                counts[codes[i]] += 1
+
+        offsets = np.zeros(n_groups + 1, dtype=np.int64)
+        for g in range(n_groups):
+            offsets[g + 1] = offsets[g] + counts[g]
+
+        buffer = np.empty(offsets[n_groups], dtype=np.float64)
+        fill = offsets[:n_groups].copy()
+        for i in range(values.shape[0]):
+            if codes[i] >= 0 and not np.isnan(values[i]):
+                buffer[fill[codes[i]]] = values[i]
+                fill[codes[i]] += 1
+
+        result = np.full((n_groups, 9), np.nan)
+        for g in prange(n_groups):
+            n = counts[g]
+            result[g, 0] = n
+            if n == 0:
+                continue
+
+            group = np.sort(buffer[offsets[g] : offsets[g + 1]])
+            median = _sorted_quantile(group, 0.5)
+
+            # Mean and variance from one pass of sums centred on the median
+            total = 0.0
+            total_sq = 0.0
+            for x in group:
+                total += x - median
+                total_sq += (x - median) * (x - median)
+            result[g, 1] = median + total / n
+            if n > 1:
+                variance = max((total_sq - total * total / n) / (n - 1), 0.0)
+                result[g, 2] = np.sqrt(variance)
+                result[g, 3] = variance
+            result[g, 4] = median
+            result[g, 5] = group[0]
+            result[g, 6] = group[-1]
+            result[g, 7] = _sorted_quantile(group, 0.25)
+            result[g, 8] = _sorted_quantile(group, 0.75)
+
+        return result
+
+
+def continuous_group_stats(
+    values: np.ndarray, codes: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """
+    Compute continuous summary statistics for every group in one pass.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float values; NaN values are ignored
+    codes : np.ndarray
+        Integer group code of each value (-1 for rows without a group)
+    n_groups : int
+        Number of groups
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_groups, 9) with columns in
+        ``CONTINUOUS_GROUP_STATS_FIELDS`` order
+    """
+    if not NUMBA_AVAILABLE:
+        raise ImportError("numba is required for compiled statistics kernels")
+
+    return _continuous_group_stats(
+        np.ascontiguousarray(values, dtype=np.float64),
+        np.ascontiguousarray(codes, dtype=np.int64),
+        n_groups,
+    )
@@ -7,8 +7,8 @@ by accumulating variables and generating comprehensive statistical reports.
 
 import warnings
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -17,6 +17,43 @@ from .enhanced_rtf_formatter import EnhancedClinicalRTFFormatter
 from .pdf_formatter import REPORTLAB_AVAILABLE, ClinicalPDFFormatter
 from .statistical_engine import ClinicalStatisticalEngine
 
+# Buffer size used when writing finalized RTF output (1 MiB)
+_RTF_WRITE_BUFFER = 1024 * 1024
+
+# Fallback column headers for common treatment codes when treatment_info
+# has no entry for a column
+_FALLBACK_TREATMENT_HEADERS = {
+    0.0: ("Placebo", 86),
+    54.0: ("Xanomeline Low Dose", 84),
+    81.0: ("Xanomeline High Dose", 84),
+}
+
+
+def _format_treatment_header(col: Any, treatment_info: Dict[str, Dict]) -> str:
+    """Build the RTF column header ("name\\n(N=n)") for a treatment column."""
+    trt_info = treatment_info.get(str(col))
+    if trt_info is not None:
+        return f"{trt_info['name']}\n(N={trt_info['n']})"
+
+    try:
+        col_val = float(col)
+    except (TypeError, ValueError):
+        return f"{col}\n(N=?)"
+
+    fallback = _FALLBACK_TREATMENT_HEADERS.get(col_val)
+    if fallback is None:
+        return f"Treatment {col}\n(N=?)"
+    return f"{fallback[0]}\n(N={fallback[1]})"
+
+
+@lru_cache(maxsize=64)
+def _display_row_template(
+    treatments: Tuple[str, ...], fill_value: str
+) -> Dict[str, str]:
+    # Blank display-row cells of one table shape; callers copy them into rows
+    # with dict.update and never modify the template itself
+    return dict.fromkeys(treatments, fill_value)
+
 
 class ClinicalSession:
     """
@@ -906,65 +943,69 @@ class ClinicalSession:
         # Process each variable
         all_results = []
 
-        for i, variable in enumerate(self.variables, 1):
-            print(f"  {i}/{len(self.variables)}: Processing {variable['name']}...")
+        # Variables share filters and treatment groupings for this run only
+        with self.stats_engine.cached_groupings():
+            for i, variable in enumerate(self.variables, 1):
+                print(f"  {i}/{len(self.variables)}: Processing {variable['name']}...")
 
-            try:
-                if variable["type"] == "continuous":
-                    result = self.stats_engine.calculate_continuous_stats(
-                        filtered_data,
-                        variable["name"],
-                        treatment_var,
-                        variable["stats"],
-                        variable.get("where", ""),
-                        variable.get("basedec", 0),
-                    )
-                elif variable["type"] == "condition":
-                    # Handle condition-based rows (add_cond)
-                    result = self.stats_engine.calculate_condition_stats(
-                        filtered_data,
-                        treatment_var,
-                        variable.get("where", "1==1"),
-                        variable.get("stats", "n"),
-                        variable.get(
-                            "subjid", self.report_config.get("subjid", "usubjid")
-                        ),
-                        variable.get("denomwhere", ""),
-                        variable.get("countwhat", "subjid"),
-                    )
-                elif is_shift_table and variable["type"] == "categorical":
-                    # Handle shift table (cross-tabulation)
-                    result = self._process_shift_table(
-                        filtered_data, variable, across_group, treatment_var
-                    )
-                else:  # categorical (regular)
-                    result = self.stats_engine.calculate_categorical_stats(
-                        filtered_data,
-                        variable["name"],
-                        treatment_var,
-                        variable["stats"],
-                        variable.get("where", ""),
-                        variable.get("decode", variable["name"]),
-                        variable.get("showmissing", "Y"),
+                try:
+                    if variable["type"] == "continuous":
+                        result = self.stats_engine.calculate_continuous_stats(
+                            filtered_data,
+                            variable["name"],
+                            treatment_var,
+                            variable["stats"],
+                            variable.get("where", ""),
+                            variable.get("basedec", 0),
+                        )
+                    elif variable["type"] == "condition":
+                        # Handle condition-based rows (add_cond)
+                        result = self.stats_engine.calculate_condition_stats(
+                            filtered_data,
+                            treatment_var,
+                            variable.get("where", "1==1"),
+                            variable.get("stats", "n"),
+                            variable.get(
+                                "subjid", self.report_config.get("subjid", "usubjid")
+                            ),
+                            variable.get("denomwhere", ""),
+                            variable.get("countwhat", "subjid"),
+                        )
+                    elif is_shift_table and variable["type"] == "categorical":
+                        # Handle shift table (cross-tabulation)
+                        result = self._process_shift_table(
+                            filtered_data, variable, across_group, treatment_var
+                        )
+                    else:  # categorical (regular)
+                        result = self.stats_engine.calculate_categorical_stats(
+                            filtered_data,
+                            variable["name"],
+                            treatment_var,
+                            variable["stats"],
+                            variable.get("where", ""),
+                            variable.get("decode", variable["name"]),
+                            variable.get("showmissing", "Y"),
+                        )
+
+                    # Add variable metadata
+                    result["variable_id"] = variable["id"]
+                    result["variable_label"] = variable["label"]
+                    result["variable_type"] = variable["type"]
+                    result["indent"] = variable.get("indent", 0)
+
+                    # Collect p-values for this variable
+                    self._collect_p_values(
+                        variable, result, filtered_data, treatment_var
                     )
 
-                # Add variable metadata
-                result["variable_id"] = variable["id"]
-                result["variable_label"] = variable["label"]
-                result["variable_type"] = variable["type"]
-                result["indent"] = variable.get("indent", 0)
+                    all_results.append(result)
 
-                # Collect p-values for this variable
-                self._collect_p_values(variable, result, filtered_data, treatment_var)
+                except Exception as e:
+                    warnings.warn(f"Failed to process variable {variable['name']}: {e}")
+                    import traceback
 
-                all_results.append(result)
-
-            except Exception as e:
-                warnings.warn(f"Failed to process variable {variable['name']}: {e}")
-                import traceback
-
-                traceback.print_exc()
-                continue
+                    traceback.print_exc()
+                    continue
 
         # Combine all results
         if all_results:
@@ -1459,66 +1500,77 @@ class ClinicalSession:
         display_rows = []
 
         # Process by variable order
-        for var_id in sorted(stats_data["variable_id"].unique()):
-            var_data = stats_data[stats_data["variable_id"] == var_id]
+        for var_id, var_data in stats_data.groupby("variable_id", sort=True):
             var_label = var_data["variable_label"].iloc[0]
             var_type = var_data["variable_type"].iloc[0]
             indent = var_data["indent"].iloc[0]
 
             indent_str = "  " * indent
+            trt_values = var_data["treatment"].tolist()
+            fmt_values = var_data["formatted_value"].tolist()
 
             if var_type == "continuous":
-                # Group by statistic
-                for stat in var_data["statistic"].unique():
-                    stat_data = var_data[var_data["statistic"] == stat]
+                # Group by statistic, keeping first-seen statistic order
+                stat_cells = self._collect_display_cells(
+                    var_data["statistic"].tolist(), trt_values, fmt_values
+                )
+                template = self._get_display_row_template(treatments, "")
 
+                for stat, cells in stat_cells.items():
                     row = {"Parameter": f"{indent_str}{var_label}"}
                     if stat != "N":  # Don't repeat variable name for non-N stats
                         row["Parameter"] = f"{indent_str}  {stat}"
-
-                    for treatment in treatments:
-                        trt_data = stat_data[stat_data["treatment"] == treatment]
-                        if not trt_data.empty:
-                            row[treatment] = trt_data["formatted_value"].iloc[0]
-                        else:
-                            row[treatment] = ""
-
+                    row.update(template)
+                    row.update(cells)
                     display_rows.append(row)
 
             elif var_type == "condition":
                 # For condition variables, create a single row with the label
+                cells = self._collect_display_cells(
+                    [None] * len(trt_values), trt_values, fmt_values
+                ).get(None, {})
                 row = {"Parameter": f"{indent_str}{var_label}"}
-                for treatment in treatments:
-                    trt_data = var_data[var_data["treatment"] == treatment]
-                    if not trt_data.empty:
-                        row[treatment] = trt_data["formatted_value"].iloc[0]
-                    else:
-                        row[treatment] = "0"
+                row.update(self._get_display_row_template(treatments, "0"))
+                row.update(cells)
                 display_rows.append(row)
 
             else:  # categorical
                 # Add variable header
                 header_row = {"Parameter": f"{indent_str}{var_label}"}
-                for treatment in treatments:
-                    header_row[treatment] = ""
+                header_row.update(self._get_display_row_template(treatments, ""))
                 display_rows.append(header_row)
 
                 # Add categories
-                for category in sorted(var_data["category"].unique()):
-                    cat_data = var_data[var_data["category"] == category]
+                cat_cells = self._collect_display_cells(
+                    var_data["category"].tolist(), trt_values, fmt_values
+                )
+                template = self._get_display_row_template(treatments, "0 (0.0%)")
 
+                for category in sorted(cat_cells):
                     row = {"Parameter": f"{indent_str}  {category}"}
-                    for treatment in treatments:
-                        trt_data = cat_data[cat_data["treatment"] == treatment]
-                        if not trt_data.empty:
-                            row[treatment] = trt_data["formatted_value"].iloc[0]
-                        else:
-                            row[treatment] = "0 (0.0%)"
-
+                    row.update(template)
+                    row.update(cat_cells[category])
                     display_rows.append(row)
 
         return pd.DataFrame(display_rows)
 
+    @staticmethod
+    def _collect_display_cells(
+        row_keys: List[Any], treatments: List[str], values: List[Any]
+    ) -> Dict[Any, Dict[str, Any]]:
+        """Map each row key to its treatment cells, keeping the first value seen."""
+        cells: Dict[Any, Dict[str, Any]] = {}
+        for key, treatment, value in zip(row_keys, treatments, values):
+            cells.setdefault(key, {}).setdefault(treatment, value)
+        return cells
+
+    @staticmethod
+    def _get_display_row_template(
+        treatments: List[str], fill_value: str
+    ) -> Dict[str, str]:
+        """Return the cached blank treatment cells for a given table shape."""
+        return _display_row_template(tuple(treatments), fill_value)
+
     def _apply_statsacross(self, table: pd.DataFrame) -> pd.DataFrame:
         """
         Apply statsacross transformation - simplified version.
@@ -1620,8 +1672,11 @@ class ClinicalSession:
             p_values=self.p_values,
         )
 
-        # Save to file
-        Path(output_file).write_text(rtf_content, encoding="utf-8")
+        # Save to file with a single buffered write (no newline translation)
+        with open(
+            output_file, "w", encoding="utf-8", newline="", buffering=_RTF_WRITE_BUFFER
+        ) as f:
+            f.write(rtf_content)
 
     def _save_clinical_pdf(self, output_file: str):
         """Save table as PDF using Clinical PDF formatter."""
@@ -1689,8 +1744,7 @@ class ClinicalSession:
         if self.generated_table is None:
             return pd.DataFrame()
 
-        # Make a copy for modification
-        display_table = self.generated_table.copy()
+        display_table = self.generated_table
 
         # Identify the parameter column (first column, or one with 'Parameter' in name)
         param_col = None
@@ -1710,50 +1764,22 @@ class ClinicalSession:
                         param_col = col
                         break
 
-        # Check if this is a shift table (columns contain '|' separator)
-        is_shift_table = any(
-            "|" in str(col) for col in display_table.columns if col != param_col
-        )
-
-        # Map treatment column names to proper treatment names
-        new_columns = {}
-        for col in display_table.columns:
-            # Skip the parameter column
-            if col == param_col:
-                continue
+        treatment_cols = [col for col in display_table.columns if col != param_col]
 
-            # For shift tables, don't add N counts - columns represent categories, not treatments
-            if is_shift_table:
-                # Keep column name as is (it's already formatted like "Baseline Status|Normal")
-                continue
+        # For shift tables (columns contain '|' separator), columns represent
+        # categories rather than treatments, so keep their names as is
+        if any("|" in str(col) for col in treatment_cols):
+            return display_table.copy()
 
-            # Try to get treatment name from treatment_info
-            if str(col) in self.treatment_info:
-                trt_info = self.treatment_info[str(col)]
-                trt_name = trt_info["name"]
-                n_count = trt_info["n"]
-                new_name = f"{trt_name}\n(N={n_count})"
-                new_columns[col] = new_name
-                print(f"  Mapped column '{col}' -> '{new_name}'")
-            else:
-                # Fallback mapping for common treatment values
-                try:
-                    col_val = float(col)
-                    if col_val == 0.0:
-                        new_columns[col] = "Placebo\n(N=86)"
-                    elif col_val == 54.0:
-                        new_columns[col] = "Xanomeline Low Dose\n(N=84)"
-                    elif col_val == 81.0:
-                        new_columns[col] = "Xanomeline High Dose\n(N=84)"
-                    else:
-                        new_columns[col] = f"Treatment {col}\n(N=?)"
-                except:
-                    new_columns[col] = f"{col}\n(N=?)"
-                print(f"  Fallback mapping column '{col}' -> '{new_columns[col]}'")
+        # Map treatment column names to proper treatment names in one pass
+        new_columns = {
+            col: _format_treatment_header(col, self.treatment_info)
+            for col in treatment_cols
+        }
 
-        # Rename columns
+        # Rename columns (returns a new frame, leaving generated_table untouched)
+        display_table = display_table.rename(columns=new_columns)
         if new_columns:
-            display_table = display_table.rename(columns=new_columns)
             print(f"  Final columns: {list(display_table.columns)}")
 
         return display_table
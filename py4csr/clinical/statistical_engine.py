@@ -6,12 +6,237 @@ categorical variables, equivalent to the SAS statistical processing engines.
 """
 
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from scipy import stats
 
+from ._stats_kernels import (
+    CONTINUOUS_GROUP_STATS_FIELDS as _CONTINUOUS_SUMMARY_FIELDS,
+    NUMBA_AVAILABLE,
+    NUMBA_MIN_ROWS,
+    continuous_group_stats,
+)
+
+if TYPE_CHECKING:
+    from pandas.core.groupby import DataFrameGroupBy
+
+# Number of (dataset, treatment, where clause) groupings kept by
+# ClinicalStatisticalEngine.cached_groupings
+_GROUP_CACHE_SIZE = 4
+
+# Statistics displayed as a single formatted number
+_SINGLE_CONTINUOUS_STATS = frozenset(
+    ["Mean", "SD", "Variance", "Median", "Q1", "Q3", "Min", "Max"]
+)
+
+# Statistics displayed as a pair: name -> (first, second, separator, suffix)
+_COMBINED_CONTINUOUS_STATS = {
+    "Mean (SD)": ("Mean", "SD", " (", ")"),
+    "Q1, Q3": ("Q1", "Q3", ", ", ""),
+    "Q1Q3": ("Q1", "Q3", ", ", ""),
+    "Min, Max": ("Min", "Max", ", ", ""),
+    "Min+Max": ("Min", "Max", ", ", ""),
+}
+
+
+# Display names for race categories (keys upper-cased)
+_RACE_DISPLAY_NAMES = {
+    "AMERICAN INDIAN OR ALASKA NATIVE": "American Indian or Alaska Native",
+    "BLACK OR AFRICAN AMERICAN": "Black or African American",
+    "WHITE": "White",
+    "ASIAN": "Asian",
+    "NATIVE HAWAIIAN OR OTHER PACIFIC ISLANDER": "Native Hawaiian or Other Pacific Islander",
+    "MULTIPLE": "Multiple",
+    "OTHER": "Other",
+    "UNKNOWN": "Unknown",
+}
+
+# Words kept lowercase in proper-cased names (articles, conjunctions, prepositions)
+_LOWERCASE_WORDS = frozenset(
+    ["of", "or", "and", "the", "in", "on", "at", "to", "for", "with"]
+)
+
+
+@lru_cache(maxsize=1024)
+def _proper_case_category(category_str: str) -> str:
+    """Convert a stripped category value to its proper-case display name."""
+    # Check if it's a known race category
+    race_name = _RACE_DISPLAY_NAMES.get(category_str.upper())
+    if race_name is not None:
+        return race_name
+
+    # For other categories, use title case with minor words kept lowercase
+    words = category_str.title().split()
+    return " ".join(
+        word.lower() if i > 0 and word.lower() in _LOWERCASE_WORDS else word
+        for i, word in enumerate(words)
+    )
+
+
+# Continuous statistics specification keywords -> statistic names
+_STAT_MAP = {
+    "n": "N",
+    "mean": "Mean",
+    "sd": "SD",
+    "mean+sd": "Mean (SD)",
+    "median": "Median",
+    "q1": "Q1",
+    "q3": "Q3",
+    "q1q3": "Q1, Q3",
+    "q1q3.q1q3": "Q1, Q3",
+    "min": "Min",
+    "max": "Max",
+    "min+max": "Min, Max",
+    "std": "SD",
+    "var": "Variance",
+}
+
+# Categorical statistics specification keywords -> statistic names
+_CAT_STAT_MAP = {
+    "n": "n",
+    "pct": "pct",
+    "npct": "n_pct",
+    "nnpct": "nn_pct",
+    "n+pct": "n_pct",
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_stats_spec_cached(stats_spec: str) -> Tuple[str, ...]:
+    """Parse a continuous statistics specification (cached per spec string)."""
+    parts = stats_spec.lower().replace(",", " ").split()
+    parsed_stats = []
+
+    for part in parts:
+        part = part.strip()
+        if part in _STAT_MAP:
+            parsed_stats.append(_STAT_MAP[part])
+        elif "+" in part:
+            # Handle combined statistics by splitting and adding individually
+            for sub_part in part.split("+"):
+                if sub_part in _STAT_MAP:
+                    parsed_stats.append(_STAT_MAP[sub_part])
+        else:
+            # Add as-is if not found in mapping
+            parsed_stats.append(part.title())
+
+    # Default statistics if none specified
+    if not parsed_stats:
+        return ("N", "Mean (SD)", "Median", "Min, Max")
+
+    return tuple(parsed_stats)
+
+
+@lru_cache(maxsize=256)
+def _parse_categorical_stats_spec_cached(stats_spec: str) -> Tuple[str, ...]:
+    """Parse a categorical statistics specification (cached per spec string)."""
+    parts = stats_spec.lower().replace(",", " ").split()
+    parsed_stats = tuple(_CAT_STAT_MAP.get(part.strip(), "n_pct") for part in parts)
+    return parsed_stats or ("n_pct",)
+
+
+def _summarize_values(values: np.ndarray) -> np.ndarray:
+    """
+    Compute the continuous summary statistics of a float array, ignoring NaN.
+
+    The result holds one value per field of ``_CONTINUOUS_SUMMARY_FIELDS``.
+    """
+    # Boolean indexing always copies, so sorting in place is safe
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n == 0:
+        summary = np.full(len(_CONTINUOUS_SUMMARY_FIELDS), np.nan)
+        summary[0] = 0
+        return summary
+
+    # One sort gives min, max and the (linearly interpolated) quantiles
+    values.sort()
+    q1, median, q3 = (_sorted_quantile(values, q) for q in (0.25, 0.5, 0.75))
+    mean, variance = _mean_variance(values, median)
+    return np.array(
+        [
+            n,
+            mean,
+            np.sqrt(variance),
+            variance,
+            median,
+            values[0],
+            values[-1],
+            q1,
+            q3,
+        ]
+    )
+
+
+def _mean_variance(values: np.ndarray, shift: float) -> Tuple[float, float]:
+    """
+    Mean and sample variance of a non-empty array from one sum and sum of squares.
+
+    Values are centred on ``shift`` (any typical value, e.g. the median) so
+    the sum-of-squares formula stays numerically stable.
+    """
+    n = len(values)
+    deviations = values - shift
+    total = deviations.sum()
+    mean = shift + total / n
+    if n < 2:
+        return mean, np.nan
+    variance = (np.dot(deviations, deviations) - total * total / n) / (n - 1)
+    return mean, max(variance, 0.0)
+
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Linearly interpolated quantile of a sorted, non-empty array."""
+    position = q * (len(sorted_values) - 1)
+    lower = int(position)
+    fraction = position - lower
+    if fraction == 0:
+        return sorted_values[lower]
+    low, high = sorted_values[lower], sorted_values[lower + 1]
+    return low + (high - low) * fraction
+
+
+def _sorted_unique(series: pd.Series) -> list:
+    """Return the sorted unique values of a series in a single C-level pass."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Observed categories, in category order
+        codes = np.unique(series.cat.codes.to_numpy())
+        return series.cat.categories[codes[codes >= 0]].tolist()
+    return np.unique(series.to_numpy()).tolist()
+
+
+def _contingency_table(rows: pd.Series, columns: pd.Series) -> np.ndarray:
+    """
+    Count (row, column) value pairs with a single bincount over factorized codes.
+
+    Pairs with a missing value are ignored and, as with ``pd.crosstab``, rows
+    and columns left without any count are dropped. Row and column order
+    follow first appearance rather than sorted values.
+    """
+    row_codes, row_values = pd.factorize(rows)
+    column_codes, column_values = pd.factorize(columns)
+    n_columns = len(column_values)
+
+    present = (row_codes >= 0) & (column_codes >= 0)
+    table = np.bincount(
+        row_codes[present] * n_columns + column_codes[present],
+        minlength=len(row_values) * n_columns,
+    ).reshape(len(row_values), n_columns)
+
+    return table[table.any(axis=1)][:, table.any(axis=0)]
+
+
+def _as_categorical(series: pd.Series) -> pd.Series:
+    """Return the series as a categorical (sorted categories) if it is not one."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype("category")
+
 
 class ClinicalStatisticalEngine:
     """
@@ -37,6 +262,12 @@ class ClinicalStatisticalEngine:
             "default": 1,
         }
 
+        # Filtered data and treatment groupings of recently analysed datasets,
+        # keyed by (id(data), treatment_var, where_clause); only filled inside
+        # cached_groupings
+        self._group_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_groupings = False
+
     def calculate_continuous_stats(
         self,
         data: pd.DataFrame,
@@ -45,6 +276,7 @@ class ClinicalStatisticalEngine:
         stats_spec: str,
         where_clause: str = "",
         base_decimals: int = 1,
+        return_format: str = "long",
     ) -> pd.DataFrame:
         """
         Calculate statistics for continuous variables.
@@ -63,79 +295,169 @@ class ClinicalStatisticalEngine:
             Additional filter condition
         base_decimals : int
             Base number of decimal places
+        return_format : str
+            "long" for one row per (treatment, statistic), or "wide" for the
+            formatted values with one row per treatment (plus Total) and one
+            column per statistic
 
         Returns
         -------
         pd.DataFrame
             Statistical results with formatted values
         """
-        # Apply additional filter if specified
-        filtered_data = data.copy()
-        if where_clause and where_clause.strip():
-            try:
-                filtered_data = filtered_data.query(where_clause)
-            except Exception as e:
-                warnings.warn(f"Where clause failed for {variable}: {e}")
+        if return_format not in ("long", "wide"):
+            raise ValueError(
+                f"return_format must be 'long' or 'wide', got '{return_format}'"
+            )
 
         # Ensure variable exists and is numeric
-        if variable not in filtered_data.columns:
+        if variable not in data.columns:
             raise ValueError(f"Variable '{variable}' not found in dataset")
 
-        # Convert to numeric, coercing errors to NaN
-        filtered_data[variable] = pd.to_numeric(
-            filtered_data[variable], errors="coerce"
+        # Apply additional filter if specified (input data is never modified)
+        filtered_data, treatment_key, grouped_data = self._get_grouped_data(
+            data, treatment_var, where_clause, variable
         )
 
+        # Convert to numeric only when needed, coercing errors to NaN
+        var_series = filtered_data[variable]
+        if not pd.api.types.is_numeric_dtype(var_series):
+            var_series = pd.to_numeric(var_series, errors="coerce")
+        var_values = var_series.to_numpy(dtype=float, na_value=np.nan)
+
         # Parse statistics specification
         requested_stats = self._parse_stats_spec(stats_spec)
 
         # Get decimal places for this variable
         decimals = self.decimal_places.get(variable.lower(), base_decimals)
 
-        results = []
+        # Calculate for each observed treatment group (sorted category order)
+        treatment_groups = grouped_data.size().index.tolist()
 
-        # Calculate for each treatment group
-        treatment_groups = sorted(filtered_data[treatment_var].unique())
+        # Summarize each treatment group, then add the Total column -
+        # statistics across all treatment groups
+        if NUMBA_AVAILABLE and len(var_values) >= NUMBA_MIN_ROWS:
+            # Compiled single pass over the treatment category codes
+            categories = treatment_key.cat.categories
+            group_stats = continuous_group_stats(
+                var_values, treatment_key.cat.codes.to_numpy(), len(categories)
+            )
+            group_rows = group_stats[categories.get_indexer(treatment_groups)]
+        else:
+            # Reduce each group's slice taken from the shared grouping indices
+            group_indices = grouped_data.indices
+            group_rows = [
+                _summarize_values(var_values[group_indices[treatment]])
+                for treatment in treatment_groups
+            ]
+        summary = pd.DataFrame(
+            np.vstack([*group_rows, _summarize_values(var_values)]),
+            columns=list(_CONTINUOUS_SUMMARY_FIELDS),
+        )
+        labels = treatment_groups + ["Total"]
 
-        for treatment in treatment_groups:
-            trt_data = filtered_data[filtered_data[treatment_var] == treatment]
-            var_data = trt_data[variable].dropna()
+        # Format each requested statistic for all columns at once
+        values, formatted = self._format_continuous_summary(
+            summary, requested_stats, decimals
+        )
 
-            # Calculate each requested statistic
-            for stat_name in requested_stats:
-                stat_result = self._calculate_single_continuous_stat(
-                    var_data, stat_name, decimals
-                )
+        if return_format == "wide":
+            return pd.DataFrame(
+                formatted,
+                index=pd.Index(labels, dtype=object, name="treatment"),
+                columns=requested_stats,
+            )
 
-                results.append(
-                    {
-                        "treatment": treatment,
-                        "variable": variable,
-                        "statistic": stat_result["name"],
-                        "value": stat_result["value"],
-                        "formatted_value": stat_result["formatted"],
-                    }
-                )
+        n_stats = len(requested_stats)
+        results = {
+            "treatment": [label for label in labels for _ in range(n_stats)],
+            "variable": [variable] * values.size,
+            "statistic": requested_stats * len(labels),
+            "value": values.ravel().tolist(),
+            "formatted_value": formatted.ravel().tolist(),
+        }
 
-        # Add Total column - statistics across all treatment groups
-        all_var_data = filtered_data[variable].dropna()
+        return pd.DataFrame(results)
 
-        for stat_name in requested_stats:
-            stat_result = self._calculate_single_continuous_stat(
-                all_var_data, stat_name, decimals
-            )
+    def _get_grouped_data(
+        self, data: pd.DataFrame, treatment_var: str, where_clause: str, variable: str
+    ) -> Tuple[pd.DataFrame, pd.Series, "DataFrameGroupBy"]:
+        """
+        Apply the where clause and group the result by treatment.
 
-            results.append(
-                {
-                    "treatment": "Total",
-                    "variable": variable,
-                    "statistic": stat_result["name"],
-                    "value": stat_result["value"],
-                    "formatted_value": stat_result["formatted"],
-                }
+        Inside ``cached_groupings`` results are cached per (dataset, treatment
+        variable, where clause) so the many variables of one table share a
+        single filter and grouping.
+        """
+        key = (id(data), treatment_var, where_clause)
+        entry = self._group_cache.get(key) if self._cache_groupings else None
+        if entry is not None and entry[0] is data:
+            self._group_cache.move_to_end(key)
+            return entry[1:]
+
+        filtered_data = data
+        if where_clause and where_clause.strip():
+            try:
+                filtered_data = data.query(where_clause)
+            except Exception as e:
+                warnings.warn(f"Where clause failed for {variable}: {e}")
+                return (data, *self._group_by_treatment(data, treatment_var))
+
+        treatment_key, grouped_data = self._group_by_treatment(
+            filtered_data, treatment_var
+        )
+        if self._cache_groupings:
+            self._group_cache[key] = (
+                data, filtered_data, treatment_key, grouped_data
             )
+            if len(self._group_cache) > _GROUP_CACHE_SIZE:
+                self._group_cache.popitem(last=False)
 
-        return pd.DataFrame(results)
+        return filtered_data, treatment_key, grouped_data
+
+    def _group_by_treatment(
+        self, data: pd.DataFrame, treatment_var: str
+    ) -> Tuple[pd.Series, "DataFrameGroupBy"]:
+        """
+        Group data by treatment using categorical codes.
+
+        The treatment column is converted to a categorical once, so grouping
+        works on integer codes; ``observed=True`` keeps only treatments that
+        are present in the data.
+        """
+        treatment_key = _as_categorical(data[treatment_var])
+        grouped_data = data.groupby(treatment_key, observed=True, sort=True)
+        return treatment_key, grouped_data
+
+    @contextmanager
+    def cached_groupings(self) -> Iterator["ClinicalStatisticalEngine"]:
+        """
+        Share filters and treatment groupings between calls within a block.
+
+        Use this around the calculations of one table. The datasets passed in
+        must not be modified inside the block; the cache is dropped when the
+        outermost block exits.
+
+        Examples
+        --------
+        >>> with engine.cached_groupings():
+        ...     age = engine.calculate_continuous_stats(adsl, "AGE", "TRT01P")
+        ...     wgt = engine.calculate_continuous_stats(adsl, "WEIGHT", "TRT01P")
+        """
+        if self._cache_groupings:
+            yield self
+            return
+
+        self._cache_groupings = True
+        try:
+            yield self
+        finally:
+            self._cache_groupings = False
+            self.clear_cache()
+
+    def clear_cache(self):
+        """Drop cached filtered datasets and treatment groupings."""
+        self._group_cache.clear()
 
     def calculate_shift_table_stats(
         self,
@@ -206,7 +528,7 @@ class ClinicalStatisticalEngine:
         # Check if we have row grouping variables (e.g., TRT01AN for treatment groups)
         if row_grouping_vars and len(row_grouping_vars) > 0:
             # Get treatment groups (for header - typically PARAM)
-            treatment_groups = sorted(filtered_data[treatment_var].unique())
+            treatment_groups = _sorted_unique(filtered_data[treatment_var])
 
             # For each treatment (e.g., PARAM='ECG')
             for treatment in treatment_groups:
@@ -232,7 +554,7 @@ class ClinicalStatisticalEngine:
         else:
             # Original logic for shift tables without row grouping
             # Get treatment groups
-            treatment_groups = sorted(filtered_data[treatment_var].unique())
+            treatment_groups = _sorted_unique(filtered_data[treatment_var])
 
             # For each treatment group
             for treatment in treatment_groups:
@@ -436,7 +758,7 @@ class ClinicalStatisticalEngine:
         group_decode = group_var.get("decode", group_name)
 
         # Get unique group values at this level
-        group_values = sorted(data[group_name].dropna().unique())
+        group_values = _sorted_unique(data[group_name].dropna())
 
         # For each group value at this level
         for group_val in group_values:
@@ -503,18 +825,15 @@ class ClinicalStatisticalEngine:
         pd.DataFrame
             Statistical results with formatted values
         """
-        # Apply additional filter if specified
-        filtered_data = data.copy()
-        if where_clause and where_clause.strip():
-            try:
-                filtered_data = filtered_data.query(where_clause)
-            except Exception as e:
-                warnings.warn(f"Where clause failed for {variable}: {e}")
-
         # Ensure variable exists
-        if variable not in filtered_data.columns:
+        if variable not in data.columns:
             raise ValueError(f"Variable '{variable}' not found in dataset")
 
+        # Apply additional filter if specified (input data is never modified)
+        filtered_data, treatment_key, grouped_data = self._get_grouped_data(
+            data, treatment_var, where_clause, variable
+        )
+
         # Use decode variable if specified and exists
         if decode_var and decode_var in filtered_data.columns:
             category_var = decode_var
@@ -524,41 +843,64 @@ class ClinicalStatisticalEngine:
         # Parse statistics specification
         requested_stats = self._parse_categorical_stats_spec(stats_spec)
 
-        results = []
-
-        # Get treatment groups and categories
-        treatment_groups = sorted(filtered_data[treatment_var].unique())
-
-        # Get all categories (including missing if requested)
-        if show_missing.upper() == "Y":
-            categories = filtered_data[category_var].fillna("Missing").unique()
-        else:
-            categories = filtered_data[category_var].dropna().unique()
-
-        categories = sorted([str(cat) for cat in categories])
-
-        # Apply proper case formatting to categories
-        categories = [self._format_category_name(cat) for cat in categories]
-
-        # Calculate for each treatment and category combination
-        for treatment in treatment_groups:
-            trt_data = filtered_data[filtered_data[treatment_var] == treatment]
+        # Get treatment groups (observed, in sorted category order) and categories
+        group_sizes = grouped_data.size().to_dict()
+        treatment_groups = list(group_sizes)
+
+        # Count every (category, treatment) combination in a single pass over
+        # categorical codes (including missing if requested)
+        category_values = _as_categorical(filtered_data[category_var])
+        if show_missing.upper() == "Y" and category_values.hasnans:
+            if "Missing" not in category_values.cat.categories:
+                category_values = category_values.cat.add_categories("Missing")
+            category_values = category_values.fillna("Missing")
+
+        counts = pd.crosstab(category_values, treatment_key, dropna=True).to_dict()
+        total_counts = category_values.value_counts()
+
+        # Observed categories, sorted as text, with proper case formatting
+        observed = total_counts.index[total_counts.to_numpy() > 0]
+        categories = [
+            self._format_category_name(cat)
+            for cat in np.unique(observed.astype(str).to_numpy())
+        ]
+        total_counts = total_counts.to_dict()
 
-            # Calculate denominator (total subjects in treatment group)
-            total_n = len(trt_data)
+        # Map formatted categories back to original values (first match wins)
+        formatted_to_original = {}
+        for original_val in filtered_data[category_var].dropna().unique():
+            formatted_to_original.setdefault(
+                self._format_category_name(str(original_val)), original_val
+            )
+        original_categories = {
+            category: (
+                category
+                if category == "Missing"
+                else formatted_to_original.get(category, category)
+            )
+            for category in categories
+        }
 
+        # Per-column count and denominator for every treatment plus Total
+        columns = [
+            (treatment, counts.get(treatment, {}), group_sizes.get(treatment, 0))
+            for treatment in treatment_groups
+        ]
+        columns.append(("Total", total_counts, len(filtered_data)))
+
+        # Accumulate output columns directly rather than one dict per row
+        treatment_col: List[Any] = []
+        category_col: List[str] = []
+        statistic_col: List[str] = []
+        n_col: List[int] = []
+        percentage_col: List[float] = []
+        total_n_col: List[int] = []
+        formatted_col: List[str] = []
+
+        for treatment, column_counts, total_n in columns:
             for category in categories:
                 # Count subjects in this category
-                if category == "Missing":
-                    cat_data = trt_data[trt_data[category_var].isna()]
-                else:
-                    # Match against original category (before formatting)
-                    original_cat = self._get_original_category(
-                        category, filtered_data[category_var]
-                    )
-                    cat_data = trt_data[trt_data[category_var] == original_cat]
-
-                category_n = len(cat_data)
+                category_n = column_counts.get(original_categories[category], 0)
 
                 # Calculate percentage
                 if total_n > 0:
@@ -568,206 +910,101 @@ class ClinicalStatisticalEngine:
 
                 # Format according to requested statistics
                 for stat_name in requested_stats:
-                    formatted_value = self._format_categorical_stat(
-                        category_n, percentage, total_n, stat_name
-                    )
-
-                    results.append(
-                        {
-                            "treatment": treatment,
-                            "variable": variable,
-                            "category": category,
-                            "statistic": stat_name,
-                            "n": category_n,
-                            "percentage": percentage,
-                            "total_n": total_n,
-                            "formatted_value": formatted_value,
-                        }
+                    treatment_col.append(treatment)
+                    category_col.append(category)
+                    statistic_col.append(stat_name)
+                    n_col.append(category_n)
+                    percentage_col.append(percentage)
+                    total_n_col.append(total_n)
+                    formatted_col.append(
+                        self._format_categorical_stat(
+                            category_n, percentage, total_n, stat_name
+                        )
                     )
 
-        # Add Total column - statistics across all treatment groups
-        all_total_n = len(filtered_data)
-
-        for category in categories:
-            # Count subjects in this category across all treatments
-            if category == "Missing":
-                cat_data = filtered_data[filtered_data[category_var].isna()]
-            else:
-                # Match against original category (before formatting)
-                original_cat = self._get_original_category(
-                    category, filtered_data[category_var]
-                )
-                cat_data = filtered_data[filtered_data[category_var] == original_cat]
-
-            category_n = len(cat_data)
-
-            # Calculate percentage
-            if all_total_n > 0:
-                percentage = (category_n / all_total_n) * 100
-            else:
-                percentage = 0.0
-
-            # Format according to requested statistics
-            for stat_name in requested_stats:
-                formatted_value = self._format_categorical_stat(
-                    category_n, percentage, all_total_n, stat_name
-                )
-
-                results.append(
-                    {
-                        "treatment": "Total",
-                        "variable": variable,
-                        "category": category,
-                        "statistic": stat_name,
-                        "n": category_n,
-                        "percentage": percentage,
-                        "total_n": all_total_n,
-                        "formatted_value": formatted_value,
-                    }
-                )
+        results = {
+            "treatment": treatment_col,
+            "variable": [variable] * len(treatment_col),
+            "category": category_col,
+            "statistic": statistic_col,
+            "n": n_col,
+            "percentage": percentage_col,
+            "total_n": total_n_col,
+            "formatted_value": formatted_col,
+        }
 
         return pd.DataFrame(results)
 
     def _parse_stats_spec(self, stats_spec: str) -> List[str]:
         """Parse continuous statistics specification."""
-        # Common statistics mappings
-        stat_map = {
-            "n": "N",
-            "mean": "Mean",
-            "sd": "SD",
-            "mean+sd": "Mean (SD)",
-            "median": "Median",
-            "q1": "Q1",
-            "q3": "Q3",
-            "q1q3": "Q1, Q3",
-            "q1q3.q1q3": "Q1, Q3",
-            "min": "Min",
-            "max": "Max",
-            "min+max": "Min, Max",
-            "std": "SD",
-            "var": "Variance",
-        }
-
-        # Parse the specification
-        parts = stats_spec.lower().replace(",", " ").split()
-        parsed_stats = []
-
-        for part in parts:
-            part = part.strip()
-            if part in stat_map:
-                parsed_stats.append(stat_map[part])
-            elif "+" in part:
-                # Handle combined statistics like mean+sd
-                if part in stat_map:
-                    parsed_stats.append(stat_map[part])
-                else:
-                    # Split and add individually
-                    sub_parts = part.split("+")
-                    for sub_part in sub_parts:
-                        if sub_part in stat_map:
-                            parsed_stats.append(stat_map[sub_part])
-            else:
-                # Add as-is if not found in mapping
-                parsed_stats.append(part.title())
-
-        # Default statistics if none specified
-        if not parsed_stats:
-            parsed_stats = ["N", "Mean (SD)", "Median", "Min, Max"]
-
-        return parsed_stats
+        return list(_parse_stats_spec_cached(stats_spec))
 
     def _parse_categorical_stats_spec(self, stats_spec: str) -> List[str]:
         """Parse categorical statistics specification."""
-        stat_map = {
-            "n": "n",
-            "pct": "pct",
-            "npct": "n_pct",
-            "nnpct": "nn_pct",
-            "n+pct": "n_pct",
-        }
-
-        parts = stats_spec.lower().replace(",", " ").split()
-        parsed_stats = []
-
-        for part in parts:
-            part = part.strip()
-            if part in stat_map:
-                parsed_stats.append(stat_map[part])
-            else:
-                parsed_stats.append("n_pct")  # Default
-
-        if not parsed_stats:
-            parsed_stats = ["n_pct"]
-
-        return parsed_stats
+        return list(_parse_categorical_stats_spec_cached(stats_spec))
 
     def _calculate_single_continuous_stat(
         self, data: pd.Series, stat_name: str, decimals: int
     ) -> Dict[str, Any]:
         """Calculate a single continuous statistic."""
-        if len(data) == 0:
-            return {"name": stat_name, "value": None, "formatted": ""}
-
-        if stat_name == "N":
-            value = len(data)
-            formatted = str(value)
-
-        elif stat_name == "Mean":
-            value = data.mean()
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name == "SD":
-            value = data.std()
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name == "Mean (SD)":
-            mean_val = data.mean()
-            sd_val = data.std()
-            value = (mean_val, sd_val)
-            formatted = f"{mean_val:.{decimals}f} ({sd_val:.{decimals}f})"
-
-        elif stat_name == "Median":
-            value = data.median()
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name == "Q1":
-            value = data.quantile(0.25)
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name == "Q3":
-            value = data.quantile(0.75)
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name in ["Q1, Q3", "Q1Q3"]:
-            q1 = data.quantile(0.25)
-            q3 = data.quantile(0.75)
-            value = (q1, q3)
-            formatted = f"{q1:.{decimals}f}, {q3:.{decimals}f}"
-
-        elif stat_name == "Min":
-            value = data.min()
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name == "Max":
-            value = data.max()
-            formatted = f"{value:.{decimals}f}"
-
-        elif stat_name in ["Min, Max", "Min+Max"]:
-            min_val = data.min()
-            max_val = data.max()
-            value = (min_val, max_val)
-            formatted = f"{min_val:.{decimals}f}, {max_val:.{decimals}f}"
-
-        elif stat_name == "Variance":
-            value = data.var()
-            formatted = f"{value:.{decimals}f}"
+        summary = pd.DataFrame(
+            [_summarize_values(data.to_numpy(dtype=float, na_value=np.nan))],
+            columns=list(_CONTINUOUS_SUMMARY_FIELDS),
+        )
+        values, formatted = self._format_continuous_summary(
+            summary, [stat_name], decimals
+        )
+        return {"name": stat_name, "value": values[0, 0], "formatted": formatted[0, 0]}
 
-        else:
-            # Unknown statistic
-            value = None
-            formatted = "N/A"
+    def _format_continuous_summary(
+        self, summary: pd.DataFrame, requested_stats: List[str], decimals: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Format the requested statistics for every row of a summary frame.
 
-        return {"name": stat_name, "value": value, "formatted": formatted}
+        Returns object arrays of values and formatted text with one row per
+        summary row and one column per requested statistic. Each statistic
+        is formatted as a whole column rather than cell by cell.
+        """
+        shape = (len(summary), len(requested_stats))
+        values = np.full(shape, None, dtype=object)
+        formatted = np.full(shape, "N/A", dtype=object)
+
+        number_format = f"{{:.{decimals}f}}".format
+        column_text: Dict[str, np.ndarray] = {}
+
+        def text(name: str) -> np.ndarray:
+            if name not in column_text:
+                column_text[name] = summary[name].map(number_format).to_numpy(
+                    dtype=object
+                )
+            return column_text[name]
+
+        counts = summary["N"].fillna(0).astype(int)
+
+        for j, stat_name in enumerate(requested_stats):
+            if stat_name == "N":
+                values[:, j] = counts.to_numpy(dtype=object)
+                formatted[:, j] = counts.astype(str).to_numpy(dtype=object)
+            elif stat_name in _SINGLE_CONTINUOUS_STATS:
+                values[:, j] = summary[stat_name].to_numpy(dtype=object)
+                formatted[:, j] = text(stat_name)
+            elif stat_name in _COMBINED_CONTINUOUS_STATS:
+                first, second, separator, suffix = _COMBINED_CONTINUOUS_STATS[
+                    stat_name
+                ]
+                values[:, j] = pd.Series(
+                    list(zip(summary[first].tolist(), summary[second].tolist())),
+                    dtype=object,
+                ).to_numpy()
+                formatted[:, j] = text(first) + separator + text(second) + suffix
+            # Unknown statistics keep None / "N/A"
+
+        # Groups without any non-missing values display blank cells
+        empty = (counts == 0).to_numpy()
+        values[empty] = None
+        formatted[empty] = ""
+        return values, formatted
 
     def _format_categorical_stat(
         self, n: int, percentage: float, total_n: int, stat_name: str
@@ -789,62 +1026,7 @@ class ClinicalStatisticalEngine:
         if category == "Missing":
             return category
 
-        # Convert to proper case for common categories
-        category_str = str(category).strip()
-
-        # Handle race categories specifically
-        race_mappings = {
-            "AMERICAN INDIAN OR ALASKA NATIVE": "American Indian or Alaska Native",
-            "BLACK OR AFRICAN AMERICAN": "Black or African American",
-            "WHITE": "White",
-            "ASIAN": "Asian",
-            "NATIVE HAWAIIAN OR OTHER PACIFIC ISLANDER": "Native Hawaiian or Other Pacific Islander",
-            "MULTIPLE": "Multiple",
-            "OTHER": "Other",
-            "UNKNOWN": "Unknown",
-        }
-
-        # Check if it's a known race category
-        if category_str.upper() in race_mappings:
-            return race_mappings[category_str.upper()]
-
-        # For other categories, use title case with some adjustments
-        formatted = category_str.title()
-
-        # Keep some words lowercase (articles, conjunctions, prepositions)
-        lowercase_words = [
-            "of",
-            "or",
-            "and",
-            "the",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "with",
-        ]
-        words = formatted.split()
-
-        for i, word in enumerate(words):
-            if i > 0 and word.lower() in lowercase_words:
-                words[i] = word.lower()
-
-        return " ".join(words)
-
-    def _get_original_category(
-        self, formatted_category: str, original_data: pd.Series
-    ) -> str:
-        """Get the original category value that matches the formatted category."""
-        # Create a mapping of formatted categories back to original values
-        unique_values = original_data.dropna().unique()
-
-        for original_val in unique_values:
-            if self._format_category_name(str(original_val)) == formatted_category:
-                return original_val
-
-        # If no match found, return the formatted category (fallback)
-        return formatted_category
+        return _proper_case_category(str(category).strip())
 
     def perform_anova(
         self, data: pd.DataFrame, variable: str, treatment_var: str
@@ -865,6 +1047,11 @@ class ClinicalStatisticalEngine:
         -------
         dict
             ANOVA results including F-statistic and p-value
+
+        Notes
+        -----
+        Groups are formed with ``observed=True``, so unused categories of a
+        categorical treatment variable are not counted as empty groups.
         """
         # Prepare data
         clean_data = data[[variable, treatment_var]].dropna()
@@ -872,17 +1059,28 @@ class ClinicalStatisticalEngine:
         if len(clean_data) == 0:
             return {"f_stat": None, "p_value": None, "error": "No valid data"}
 
-        # Get treatment groups
-        groups = [
-            group[variable].values for name, group in clean_data.groupby(treatment_var)
-        ]
+        # Per-group sufficient statistics in one grouped pass; only observed
+        # treatments count towards the degrees of freedom
+        grouped = clean_data.groupby(treatment_var, observed=True, sort=False)[variable]
 
-        if len(groups) < 2:
+        if grouped.ngroups < 2:
             return {"f_stat": None, "p_value": None, "error": "Less than 2 groups"}
 
         try:
-            # Perform one-way ANOVA
-            f_stat, p_value = stats.f_oneway(*groups)
+            # One-way ANOVA from between/within sums of squares
+            n_i = grouped.count().to_numpy(dtype=float)
+            mean_i = grouped.mean().to_numpy(dtype=float)
+            var_i = grouped.var(ddof=0).to_numpy(dtype=float)
+
+            n_total = n_i.sum()
+            k = len(n_i)
+            grand_mean = (n_i * mean_i).sum() / n_total
+            ss_between = (n_i * (mean_i - grand_mean) ** 2).sum()
+            ss_within = (n_i * var_i).sum()
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                f_stat = (ss_between / (k - 1)) / (ss_within / (n_total - k))
+            p_value = stats.f.sf(f_stat, k - 1, n_total - k)
 
             return {
                 "f_stat": f_stat,
@@ -915,7 +1113,7 @@ class ClinicalStatisticalEngine:
         """
         # Create contingency table
         try:
-            contingency_table = pd.crosstab(data[variable], data[treatment_var])
+            contingency_table = _contingency_table(data[variable], data[treatment_var])
 
             if contingency_table.size == 0:
                 return {"chi2": None, "p_value": None, "error": "No valid data"}
@@ -1022,7 +1220,7 @@ class ClinicalStatisticalEngine:
         requested_stats = stats_spec.lower().split()
 
         results = []
-        treatment_groups = sorted(data[treatment_var].unique())
+        treatment_groups = _sorted_unique(data[treatment_var])
 
         # Calculate for each treatment group
         for treatment in treatment_groups:
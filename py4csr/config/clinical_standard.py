@@ -5,24 +5,19 @@ This module provides the default configuration for clinical study reports,
 equivalent to the SAS RRG system's config.ini file.
 """
 
-from .report_config import PageSettings, ReportConfig, StatisticConfig
-
+from dataclasses import replace
+from types import MappingProxyType
 
-def get_clinical_standard_config() -> ReportConfig:
-    """
-    Get standard clinical trial configuration.
-
-    This configuration follows ICH E3 and CTD guidelines and provides
-    standard statistical displays and formats used in clinical study reports.
+from .report_config import PageSettings, ReportConfig, StatisticConfig
 
-    Returns
-    -------
-    ReportConfig
-        Standard clinical configuration
-    """
+# The configuration building blocks are created once at import time as
+# read-only mappings; the getters below return configurations holding fresh
+# copies of them, so callers can modify their configuration freely.
+# StatisticConfig instances are immutable and are shared.
 
-    # Statistical definitions (equivalent to [A1] section in SAS RRG)
-    statistics = {
+# Statistical definitions (equivalent to [A1] section in SAS RRG)
+_STATISTICS_TEMPLATE = MappingProxyType(
+    {
         "n": StatisticConfig(
             name="n", display="n", label="Number of subjects", precision=0
         ),
@@ -85,9 +80,11 @@ def get_clinical_standard_config() -> ReportConfig:
             precision=0,
         ),
     }
+)
 
-    # Format definitions (equivalent to [A3], [A4] sections in SAS RRG)
-    formats = {
+# Format definitions (equivalent to [A3], [A4] sections in SAS RRG)
+_FORMATS_TEMPLATE = MappingProxyType(
+    {
         "percent": "({:.1f}%)",
         "percent_no_paren": "{:.1f}%",
         "pvalue": "<.0001",  # for p < 0.0001
@@ -99,18 +96,21 @@ def get_clinical_standard_config() -> ReportConfig:
         "min_max_format": "{:.0f}, {:.0f}",
         "q1_q3_format": "{:.1f}, {:.1f}",
     }
-
-    # Page settings (equivalent to [C1] section in SAS RRG)
-    page_settings = PageSettings(
-        orientation="portrait",
-        margins={"top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
-        font_size=10,
-        font_family="Times New Roman",
-        col_width=6.5,
-    )
-
-    # Template mappings
-    templates = {
+)
+
+# Page settings (equivalent to [C1] section in SAS RRG); copied per config
+# because PageSettings is mutable
+_PAGE_SETTINGS = PageSettings(
+    orientation="portrait",
+    margins={"top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
+    font_size=10,
+    font_family="Times New Roman",
+    col_width=6.5,
+)
+
+# Template mappings
+_TEMPLATES = MappingProxyType(
+    {
         "demographics": "demographics_template",
         "disposition": "disposition_template",
         "ae_summary": "ae_summary_template",
@@ -123,9 +123,11 @@ def get_clinical_standard_config() -> ReportConfig:
         "medical_history": "medical_history_template",
         "exposure": "exposure_template",
     }
+)
 
-    # Standard population definitions
-    populations = {
+# Standard population definitions
+_POPULATIONS = MappingProxyType(
+    {
         "safety": "SAFFL=='Y'",
         "efficacy": "EFFFL=='Y'",
         "itt": "ITTFL=='Y'",
@@ -133,44 +135,23 @@ def get_clinical_standard_config() -> ReportConfig:
         "randomized": "RANDFL=='Y'",
         "treated": "TRTFL=='Y'",
     }
+)
 
-    # Standard treatment definitions
-    treatments = {
+# Standard treatment definitions
+_TREATMENTS = MappingProxyType(
+    {
         "planned_var": "TRT01P",
         "actual_var": "TRT01A",
         "planned_num": "TRT01PN",
         "actual_num": "TRT01AN",
         "decode_var": "TRT01A",
     }
+)
 
-    return ReportConfig(
-        statistics=statistics,
-        formats=formats,
-        page_settings=page_settings,
-        templates=templates,
-        populations=populations,
-        treatments=treatments,
-    )
-
-
-def get_regulatory_submission_config() -> ReportConfig:
-    """
-    Get enhanced configuration for regulatory submissions.
-
-    This configuration includes additional statistical displays and
-    formatting options required for comprehensive regulatory submissions.
-
-    Returns
-    -------
-    ReportConfig
-        Enhanced regulatory submission configuration
-    """
-
-    # Start with clinical standard
-    config = get_clinical_standard_config()
-
-    # Add additional statistics for regulatory submissions
-    additional_stats = {
+# Additional statistics, formats and templates for regulatory submissions
+_REGULATORY_STATISTICS = MappingProxyType(
+    {
+        **_STATISTICS_TEMPLATE,
         "lclm": StatisticConfig(
             name="lclm",
             display="Lower 95% CI",
@@ -204,12 +185,11 @@ def get_regulatory_submission_config() -> ReportConfig:
             format_func="format_range",
         ),
     }
+)
 
-    # Add to existing statistics
-    config.statistics.update(additional_stats)
-
-    # Add additional formats
-    additional_formats = {
+_REGULATORY_FORMATS = MappingProxyType(
+    {
+        **_FORMATS_TEMPLATE,
         "scientific": "{:.2e}",
         "percentage_1dec": "{:.1f}%",
         "percentage_2dec": "{:.2f}%",
@@ -219,11 +199,11 @@ def get_regulatory_submission_config() -> ReportConfig:
         "hazard_ratio": "{:.2f} ({:.2f}, {:.2f})",
         "difference": "{:.2f} ({:.2f}, {:.2f})",
     }
+)
 
-    config.formats.update(additional_formats)
-
-    # Add additional templates for regulatory submissions
-    additional_templates = {
+_REGULATORY_TEMPLATES = MappingProxyType(
+    {
+        **_TEMPLATES,
         "pk_parameters": "pk_parameters_template",
         "immunogenicity": "immunogenicity_template",
         "biomarkers": "biomarkers_template",
@@ -234,30 +214,12 @@ def get_regulatory_submission_config() -> ReportConfig:
         "laboratory_shifts": "laboratory_shifts_template",
         "laboratory_outliers": "laboratory_outliers_template",
     }
+)
 
-    config.templates.update(additional_templates)
-
-    return config
-
-
-def get_oncology_config() -> ReportConfig:
-    """
-    Get specialized configuration for oncology studies.
-
-    This configuration includes oncology-specific statistical displays
-    and analysis templates.
-
-    Returns
-    -------
-    ReportConfig
-        Oncology-specific configuration
-    """
-
-    # Start with regulatory submission config
-    config = get_regulatory_submission_config()
-
-    # Add oncology-specific statistics
-    oncology_stats = {
+# Oncology-specific statistics and templates
+_ONCOLOGY_STATISTICS = MappingProxyType(
+    {
+        **_REGULATORY_STATISTICS,
         "response_rate": StatisticConfig(
             name="response_rate",
             display="Response Rate (%)",
@@ -280,18 +242,76 @@ def get_oncology_config() -> ReportConfig:
             format_func="format_hazard_ratio",
         ),
     }
+)
 
-    config.statistics.update(oncology_stats)
-
-    # Add oncology-specific templates
-    oncology_templates = {
+_ONCOLOGY_TEMPLATES = MappingProxyType(
+    {
+        **_REGULATORY_TEMPLATES,
         "tumor_response": "tumor_response_template",
         "survival_summary": "survival_summary_template",
         "time_to_event": "time_to_event_template",
         "biomarker_efficacy": "biomarker_efficacy_template",
         "dose_limiting_toxicity": "dlt_template",
     }
+)
+
+
+def _build_config(statistics, formats, templates) -> ReportConfig:
+    """Create a configuration with its own copy of every template mapping."""
+    return ReportConfig(
+        statistics=dict(statistics),
+        formats=dict(formats),
+        page_settings=replace(_PAGE_SETTINGS, margins=dict(_PAGE_SETTINGS.margins)),
+        templates=dict(templates),
+        populations=dict(_POPULATIONS),
+        treatments=dict(_TREATMENTS),
+    )
+
+
+def get_clinical_standard_config() -> ReportConfig:
+    """
+    Get standard clinical trial configuration.
+
+    This configuration follows ICH E3 and CTD guidelines and provides
+    standard statistical displays and formats used in clinical study reports.
+
+    Returns
+    -------
+    ReportConfig
+        Standard clinical configuration
+    """
+    return _build_config(_STATISTICS_TEMPLATE, _FORMATS_TEMPLATE, _TEMPLATES)
+
+
+def get_regulatory_submission_config() -> ReportConfig:
+    """
+    Get enhanced configuration for regulatory submissions.
 
-    config.templates.update(oncology_templates)
+    This configuration includes additional statistical displays and
+    formatting options required for comprehensive regulatory submissions.
 
-    return config
+    Returns
+    -------
+    ReportConfig
+        Enhanced regulatory submission configuration
+    """
+    return _build_config(
+        _REGULATORY_STATISTICS, _REGULATORY_FORMATS, _REGULATORY_TEMPLATES
+    )
+
+
+def get_oncology_config() -> ReportConfig:
+    """
+    Get specialized configuration for oncology studies.
+
+    This configuration includes oncology-specific statistical displays
+    and analysis templates.
+
+    Returns
+    -------
+    ReportConfig
+        Oncology-specific configuration
+    """
+    return _build_config(
+        _ONCOLOGY_STATISTICS, _REGULATORY_FORMATS, _ONCOLOGY_TEMPLATES
+    )
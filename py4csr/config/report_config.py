@@ -5,14 +5,27 @@ This module defines the configuration structure for statistical reporting,
 following the SAS RRG system's configuration-driven approach.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-import yaml
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions use regular ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Custom formatting functions referenced by StatisticConfig.format_func;
+# statistics naming an unregistered function are formatted with str()
+FORMAT_FUNCTIONS: Dict[str, Callable[[Any], str]] = {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class StatisticConfig:
     """Configuration for statistical displays"""
 
@@ -21,19 +34,29 @@ class StatisticConfig:
     label: str
     precision: int
     format_func: Optional[str] = None
+    _number_formatter: Callable[[Any], str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Build the number formatter once rather than on every call
+        object.__setattr__(
+            self, "_number_formatter", f"{{:.{self.precision}f}}".format
+        )
 
     def format_value(self, value: Any) -> str:
         """Format a value according to this statistic's configuration"""
         if self.format_func:
-            # Would implement custom formatting functions
-            return str(value)
+            # Looked up per call so functions registered after the config
+            # was built (e.g. for the import-time standard configs) apply
+            return FORMAT_FUNCTIONS.get(self.format_func, str)(value)
 
         if isinstance(value, (int, float)):
-            return f"{value:.{self.precision}f}"
+            return self._number_formatter(value)
         return str(value)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageSettings:
     """Page layout settings"""
 
@@ -46,6 +69,30 @@ class PageSettings:
     col_width: float = 6.5
 
 
+# Population definitions of the form COLUMN=='VALUE' (e.g. SAFFL=='Y'); the
+# value may not contain quotes, so compound expressions such as
+# SAFFL=='Y' and ITTFL=='Y' are left to DataFrame.query
+_SIMPLE_EQUALITY_FILTER = re.compile(r"""^\s*(\w+)\s*==\s*(['"])([^'"]*)\2\s*$""")
+
+
+@lru_cache(maxsize=128)
+def _compile_population_filter(
+    expression: str,
+) -> Callable[["pd.DataFrame"], "pd.DataFrame"]:
+    """
+    Turn a population expression into a callable filtering a DataFrame.
+
+    Simple ``COLUMN=='VALUE'`` expressions are parsed once into a direct
+    column comparison; anything else is evaluated with ``DataFrame.query``.
+    """
+    match = _SIMPLE_EQUALITY_FILTER.match(expression)
+    if match is None:
+        return lambda data: data.query(expression)
+
+    column, _, value = match.groups()
+    return lambda data: data[data[column] == value]
+
+
 @dataclass
 class ReportConfig:
     """Master configuration for report generation"""
@@ -78,12 +125,16 @@ class ReportConfig:
     @classmethod
     def from_yaml(cls, config_path: str) -> "ReportConfig":
         """Load configuration from YAML file"""
+        import yaml
+
         config_file = Path(config_path)
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_file, "r") as f:
-            config_data = yaml.safe_load(f)
+            # libyaml's C loader when available, else the pure-Python one
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            config_data = yaml.load(f, Loader=loader)
 
         return cls._from_dict(config_data)
 
@@ -126,6 +177,19 @@ class ReportConfig:
         """Get format string by name"""
         return self.formats.get(name)
 
+    def get_format_callable(self, name: str) -> Optional[Callable[..., str]]:
+        """Get a format by name as a callable, e.g. ``(n, pct) -> "n (pct%)"``"""
+        format_str = self.formats.get(name)
+        if format_str is None:
+            return None
+        return format_str.format
+
+    def filter_population(self, data: "pd.DataFrame", name: str) -> "pd.DataFrame":
+        """Return the rows of data belonging to the named population"""
+        if name not in self.populations:
+            raise ValueError(f"Unknown population: {name}")
+        return _compile_population_filter(self.populations[name])(data)
+
     def add_statistic(self, stat_config: StatisticConfig) -> None:
         """Add a statistic configuration"""
         self.statistics[stat_config.name] = stat_config
@@ -136,6 +200,8 @@ class ReportConfig:
 
     def to_yaml(self, output_path: str) -> None:
         """Save configuration to YAML file"""
+        import yaml
+
         config_dict = {
             "statistics": {
                 name: {
@@ -160,4 +226,10 @@ class ReportConfig:
         }
 
         with open(output_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+                default_flow_style=False,
+                indent=2,
+            )
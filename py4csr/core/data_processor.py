@@ -1,5 +1,5 @@
 import logging
-from functools import reduce
+from functools import partial, reduce
 from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
@@ -30,9 +30,13 @@ class DataProcessor:
             "summary": {},
         }
 
+        # Look up columns and dtypes once for all checks
+        columns = set(data.columns)
+        dtypes = data.dtypes
+
         # Check required columns
         if "required_columns" in rules:
-            missing_cols = set(rules["required_columns"]) - set(data.columns)
+            missing_cols = set(rules["required_columns"]) - columns
             if missing_cols:
                 validation_results["is_valid"] = False
                 validation_results["errors"].append(f"Missing columns: {missing_cols}")
@@ -40,13 +44,13 @@ class DataProcessor:
         # Check data types
         if "column_types" in rules:
             for col, expected_type in rules["column_types"].items():
-                if col in data.columns and not data[col].dtype == expected_type:
+                if col in columns and not dtypes[col] == expected_type:
                     validation_results["warnings"].append(
-                        f"Column {col} type mismatch: expected {expected_type}, got {data[col].dtype}"
+                        f"Column {col} type mismatch: expected {expected_type}, got {dtypes[col]}"
                     )
 
-        # Check missing values
-        missing_summary = data.isnull().sum()
+        # Check missing values (count() skips NA without building a mask)
+        missing_summary = len(data) - data.count()
         validation_results["summary"]["missing_values"] = missing_summary.to_dict()
 
         return validation_results
@@ -55,7 +59,8 @@ class DataProcessor:
         self, data: pd.DataFrame, cleaning_rules: Dict[str, Any]
     ) -> pd.DataFrame:
         """Clean data using functional composition."""
-        # Create a copy to maintain immutability
+        # Create a single working copy to maintain immutability of the input;
+        # the cleaning steps below modify it in place
         cleaned_data = data.copy()
 
         # Apply cleaning functions in sequence
@@ -66,73 +71,100 @@ class DataProcessor:
             self._apply_filters,
         ]
 
-        # Functional composition using reduce
-        cleaned_data = reduce(
-            lambda df, func: func(df, cleaning_rules), cleaning_functions, cleaned_data
-        )
+        for func in cleaning_functions:
+            cleaned_data = func(cleaned_data, cleaning_rules)
 
         return cleaned_data
 
     def transform_data(
-        self, data: pd.DataFrame, transformations: List[Callable]
+        self, data: pd.DataFrame, transformations: List[Callable], copy: bool = True
     ) -> pd.DataFrame:
-        """Apply transformations using functional composition."""
-        return reduce(lambda df, transform: transform(df), transformations, data.copy())
-
-    # Private helper functions (pure)
+        """
+        Apply transformations using functional composition.
+
+        With ``copy=False`` the input is passed to the first transformation
+        as is, which is only safe when the transformations do not modify
+        their input in place.
+        """
+        base = data.copy() if copy else data
+        return reduce(lambda df, transform: transform(df), transformations, base)
+
+    # Private cleaning steps - each modifies the working copy passed by
+    # clean_data and returns the (possibly new) frame
     def _remove_duplicates(
         self, data: pd.DataFrame, rules: Dict[str, Any]
     ) -> pd.DataFrame:
         """Remove duplicates based on rules."""
-        if "duplicate_subset" in rules:
-            return data.drop_duplicates(subset=rules["duplicate_subset"])
-        return data.drop_duplicates()
+        data.drop_duplicates(subset=rules.get("duplicate_subset"), inplace=True)
+        return data
 
     def _handle_missing_values(
         self, data: pd.DataFrame, rules: Dict[str, Any]
     ) -> pd.DataFrame:
-        """Handle missing values functionally."""
-        result = data.copy()
-
+        """Handle missing values in place."""
         if "fill_values" in rules:
-            for col, fill_value in rules["fill_values"].items():
-                if col in result.columns:
-                    result[col] = result[col].fillna(fill_value)
+            fill_values = {
+                col: fill_value
+                for col, fill_value in rules["fill_values"].items()
+                if col in data.columns
+            }
+            if fill_values:
+                data.fillna(fill_values, inplace=True)
 
         if "drop_missing" in rules:
-            cols_to_check = rules["drop_missing"]
-            result = result.dropna(subset=cols_to_check)
+            data.dropna(subset=rules["drop_missing"], inplace=True)
 
-        return result
+        return data
 
     def _standardize_formats(
         self, data: pd.DataFrame, rules: Dict[str, Any]
     ) -> pd.DataFrame:
-        """Standardize data formats."""
-        result = data.copy()
-
-        if "date_columns" in rules:
-            for col in rules["date_columns"]:
-                if col in result.columns:
-                    result[col] = pd.to_datetime(result[col], errors="coerce")
+        """Standardize data formats in place."""
+        dtypes = data.dtypes
+        is_datetime = pd.api.types.is_datetime64_any_dtype
+        is_numeric = pd.api.types.is_numeric_dtype
+
+        # Convert each group of columns in one call, skipping columns that
+        # already have the target type
+        date_cols = [
+            col
+            for col in dict.fromkeys(rules.get("date_columns", []))
+            if col in dtypes.index and not is_datetime(dtypes[col])
+        ]
+        if date_cols:
+            data[date_cols] = data[date_cols].apply(pd.to_datetime, errors="coerce")
 
-        if "numeric_columns" in rules:
-            for col in rules["numeric_columns"]:
-                if col in result.columns:
-                    result[col] = pd.to_numeric(result[col], errors="coerce")
+        numeric_cols = [
+            col
+            for col in dict.fromkeys(rules.get("numeric_columns", []))
+            if col in dtypes.index and not is_numeric(dtypes[col])
+        ]
+        if numeric_cols:
+            data[numeric_cols] = data[numeric_cols].apply(
+                pd.to_numeric, errors="coerce"
+            )
 
-        return result
+        return data
 
     def _apply_filters(self, data: pd.DataFrame, rules: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters functionally."""
-        result = data.copy()
-
-        if "filters" in rules:
-            for filter_expr in rules["filters"]:
-                try:
-                    result = result.query(filter_expr)
-                except Exception as e:
-                    self.logger.warning(f"Filter '{filter_expr}' failed: {e}")
+        """Apply filters, returning the filtered frame."""
+        filters = rules.get("filters", [])
+
+        # Evaluate all filters as one expression in a single pass; if that
+        # fails, apply them one by one so only the failing filters are skipped
+        if len(filters) > 1:
+            combined = " and ".join(f"({filter_expr})" for filter_expr in filters)
+            try:
+                return data.query(combined)
+            except Exception:
+                pass
+
+        result = data
+        for filter_expr in filters:
+            try:
+                result = result.query(filter_expr)
+            except Exception as e:
+                self.logger.warning(f"Filter '{filter_expr}' failed: {e}")
 
         return result
 
@@ -143,23 +175,45 @@ class DataProcessor:
 
     def create_pipeline(self, operations: List[Dict[str, Any]]) -> Callable:
         """Create a data processing pipeline."""
+        # Resolve each operation to a callable once, when the pipeline is built
+        steps = [
+            step
+            for step in (self._compile_operation(operation) for operation in operations)
+            if step is not None
+        ]
 
         def pipeline(data: pd.DataFrame) -> pd.DataFrame:
             result = data.copy()
-            for operation in operations:
-                op_type = operation.get("type")
-                op_params = operation.get("params", {})
-
-                if op_type == "validate":
-                    validation = self.validate_data(result, op_params)
-                    if not validation["is_valid"]:
-                        raise ValueError(f"Validation failed: {validation['errors']}")
-                elif op_type == "clean":
-                    result = self.clean_data(result, op_params)
-                elif op_type == "transform":
-                    transformations = op_params.get("functions", [])
-                    result = self.transform_data(result, transformations)
-
+            for step in steps:
+                result = step(result)
             return result
 
         return pipeline
+
+    def _compile_operation(
+        self, operation: Dict[str, Any]
+    ) -> Optional[Callable[[pd.DataFrame], pd.DataFrame]]:
+        """Return the pipeline step for an operation (None for unknown types)."""
+        op_type = operation.get("type")
+        op_params = operation.get("params", {})
+
+        if op_type == "validate":
+
+            def validate(data: pd.DataFrame) -> pd.DataFrame:
+                validation = self.validate_data(data, op_params)
+                if not validation["is_valid"]:
+                    raise ValueError(f"Validation failed: {validation['errors']}")
+                return data
+
+            return validate
+        elif op_type == "clean":
+            return partial(self.clean_data, cleaning_rules=op_params)
+        elif op_type == "transform":
+            # The pipeline already works on its own copy of the input data
+            return partial(
+                self.transform_data,
+                transformations=op_params.get("functions", []),
+                copy=op_params.get("copy", False),
+            )
+
+        return None
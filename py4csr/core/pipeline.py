@@ -8,6 +8,28 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 
 
+class _LazyDataset:
+    """Dataset file that is read on first access and then kept in memory."""
+
+    __slots__ = ("filepath", "_df")
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._df: Optional[pd.DataFrame] = None
+
+    def df(self) -> pd.DataFrame:
+        """Return the dataset, reading the file on the first call."""
+        if self._df is None:
+            from ..data.io import load_dataset
+
+            self._df = load_dataset(self.filepath)
+        return self._df
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._df is not None else "not loaded"
+        return f"_LazyDataset({self.filepath!r}, {state})"
+
+
 class CSRPipeline:
     """
     Clinical Study Report generation pipeline.
@@ -25,10 +47,11 @@ class CSRPipeline:
         output_dir : str, default "output"
             Directory for output files
         """
+        # The output directory is created on the first write, not here
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self._output_dir_created = False
 
-        self.datasets = {}
+        self.datasets: Dict[str, _LazyDataset] = {}
         self.tables = {}
         self.config = {}
 
@@ -43,9 +66,9 @@ class CSRPipeline:
         dataset_name : str
             Name to assign to the dataset
         """
-        # This would use the data loading functions
-        # For now, just store the path
-        self.datasets[dataset_name] = {"filepath": filepath}
+        # The file is read on first use (``self.datasets[name].df()``) and
+        # cached, so analyses sharing a dataset parse it only once
+        self.datasets[dataset_name] = _LazyDataset(filepath)
 
     def run_demographics(self, **kwargs) -> None:
         """Run demographics analysis."""
@@ -64,5 +87,13 @@ class CSRPipeline:
 
     def generate_report(self) -> None:
         """Generate the complete CSR."""
+        self._ensure_output_dir()
         # Implementation would orchestrate all analyses
         pass
+
+    def _ensure_output_dir(self) -> Path:
+        """Create the output directory before the first file is written."""
+        if not self._output_dir_created:
+            self.output_dir.mkdir(exist_ok=True)
+            self._output_dir_created = True
+        return self.output_dir
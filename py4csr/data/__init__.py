@@ -5,28 +5,56 @@ This module provides functions for reading, validating, and preprocessing
 CDISC ADaM datasets commonly used in clinical study reports.
 """
 
-from .adam_utils import (
-    apply_cdisc_formats,
-    create_analysis_dataset,
-    create_frequency_table,
-    create_summary_statistics,
-    derive_analysis_flags,
-    derive_demographic_categories,
-    derive_disposition_variables,
-    derive_treatment_variables,
-    format_ae_data,
-    format_lab_data,
-    merge_adam_datasets,
-    validate_adam_structure,
-)
-from .io import load_adam_data, load_dataset, read_sas, read_xpt
-from .preprocessing import (
-    apply_formats,
-    clean_data,
-    derive_variables,
-    handle_missing_data,
-)
-from .validation import validate_adae, validate_adlb, validate_adsl
+import importlib
+from typing import Any, List
+
+# Public names and the submodules defining them; submodules are imported on
+# first attribute access (PEP 562) so importing py4csr.data stays cheap
+_LAZY_IMPORTS = {
+    # I/O functions
+    "read_sas": ".io",
+    "read_xpt": ".io",
+    "load_dataset": ".io",
+    "load_adam_data": ".io",
+    # Validation functions
+    "validate_adsl": ".validation",
+    "validate_adae": ".validation",
+    "validate_adlb": ".validation",
+    "validate_adlb_stream": ".validation",
+    # Preprocessing functions
+    "apply_formats": ".preprocessing",
+    "handle_missing_data": ".preprocessing",
+    "derive_variables": ".preprocessing",
+    "clean_data": ".preprocessing",
+    # ADaM-specific utilities
+    "apply_cdisc_formats": ".adam_utils",
+    "validate_adam_structure": ".adam_utils",
+    "derive_treatment_variables": ".adam_utils",
+    "derive_analysis_flags": ".adam_utils",
+    "derive_disposition_variables": ".adam_utils",
+    "derive_demographic_categories": ".adam_utils",
+    "merge_adam_datasets": ".adam_utils",
+    "create_analysis_dataset": ".adam_utils",
+    "format_ae_data": ".adam_utils",
+    "format_lab_data": ".adam_utils",
+    "create_summary_statistics": ".adam_utils",
+    "create_frequency_table": ".adam_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # I/O functions
@@ -38,6 +66,7 @@ __all__ = [
     "validate_adsl",
     "validate_adae",
     "validate_adlb",
+    "validate_adlb_stream",
     "validate_adam_structure",
     # Preprocessing functions
     "apply_formats",
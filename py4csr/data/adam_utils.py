@@ -12,6 +12,111 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 
+# Optional dependency for multi-key aggregation
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+    pl = None
+
+# Optional dependency for fused evaluation of numeric expressions
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+    numexpr = None
+
+# Minimum number of rows before numexpr is used for derived columns
+NUMEXPR_MIN_ROWS = 10_000
+
+# AEREL values counted as drug-related
+_RELATED_CAUSALITY = frozenset(["POSSIBLE", "PROBABLE", "RELATED"])
+
+# Required variables by dataset type
+_REQUIRED_VARIABLES = {
+    "ADSL": ["USUBJID", "STUDYID", "SUBJID"],
+    "ADAE": ["USUBJID", "AEDECOD"],
+    "ADLB": ["USUBJID", "PARAMCD", "AVAL"],
+    "ADCM": ["USUBJID", "CMDECOD"],
+    "ADVS": ["USUBJID", "PARAMCD", "AVAL"],
+}
+
+
+def _map_values(series: pd.Series, mapping: Dict[Any, Any], default: Any = np.nan):
+    """Map values through a dict using categorical codes instead of per-row lookups."""
+    codes = pd.Categorical(series, categories=list(mapping)).codes
+    lookup = np.array(list(mapping.values()))
+    unmatched = codes == -1
+    if unmatched.any():
+        lookup = np.append(lookup, default)
+        codes = np.where(unmatched, len(lookup) - 1, codes)
+    return pd.Series(lookup[codes], index=series.index, name=series.name)
+
+
+def _check_engine(engine: str) -> None:
+    """Validate an ``engine`` argument and that its backend is installed."""
+    if engine not in ("pandas", "polars"):
+        raise ValueError(f"Unsupported engine: {engine}. Use 'pandas' or 'polars'")
+
+    if engine == "polars" and not HAS_POLARS:
+        raise ImportError(
+            "polars is required for engine='polars'. "
+            "Install it with: pip install polars"
+        )
+
+
+def _evaluate(expression: str, **columns: pd.Series) -> pd.Series:
+    """
+    Evaluate an arithmetic expression over aligned columns.
+
+    Large plain numeric inputs are evaluated in one pass by numexpr when it is
+    installed; anything else goes through pandas operators as usual.
+    """
+    index = next(iter(columns.values())).index
+    if (
+        HAS_NUMEXPR
+        and len(index) >= NUMEXPR_MIN_ROWS
+        and all(
+            isinstance(col.dtype, np.dtype) and col.dtype.kind in "iuf"
+            for col in columns.values()
+        )
+    ):
+        local_dict = {name: col.to_numpy() for name, col in columns.items()}
+        values = numexpr.evaluate(expression, local_dict=local_dict)
+        return pd.Series(values, index=index)
+
+    # Expressions are module constants, so evaluating them with pandas
+    # operators is equivalent to writing the arithmetic out inline
+    return eval(expression, {"__builtins__": {}}, columns)
+
+
+def _map_uniques(series: pd.Series, func, missing: Any = np.nan) -> pd.Series:
+    """
+    Apply a vectorized function to the distinct values of a column.
+
+    The results are broadcast back to every row; missing values get ``missing``.
+    """
+    codes, uniques = pd.factorize(series)
+    values = func(pd.Series(uniques)).to_numpy()
+    if (codes == -1).any():
+        values = np.append(values, missing)
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+def _bucketize(series: pd.Series, edges: List[float], labels: List[str]) -> pd.Series:
+    """
+    Bin values into left-closed intervals, like ``pd.cut(..., right=False)``.
+
+    Values outside ``[edges[0], edges[-1])`` and missing values are left missing.
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes = np.searchsorted(edges, values, side="right") - 1
+    codes[(codes >= len(labels)) | np.isnan(values)] = -1
+    categories = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    return pd.Series(categories, index=series.index, name=series.name)
+
 
 def derive_treatment_variables(adsl: pd.DataFrame) -> pd.DataFrame:
     """
@@ -27,21 +132,23 @@ def derive_treatment_variables(adsl: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         ADSL with derived treatment variables
     """
-    adsl_derived = adsl.copy()
+    new_cols = {}
 
     # Ensure treatment numeric variables exist
-    if "TRT01PN" not in adsl_derived.columns and "TRT01P" in adsl_derived.columns:
+    if "TRT01PN" not in adsl.columns and "TRT01P" in adsl.columns:
         trt_map = {"Placebo": 0, "Xanomeline Low Dose": 54, "Xanomeline High Dose": 81}
-        adsl_derived["TRT01PN"] = adsl_derived["TRT01P"].map(trt_map)
+        new_cols["TRT01PN"] = _map_values(adsl["TRT01P"], trt_map)
 
     # Derive actual treatment from planned if missing
-    if "TRT01A" not in adsl_derived.columns and "TRT01P" in adsl_derived.columns:
-        adsl_derived["TRT01A"] = adsl_derived["TRT01P"]
+    if "TRT01A" not in adsl.columns and "TRT01P" in adsl.columns:
+        new_cols["TRT01A"] = adsl["TRT01P"]
 
-    if "TRT01AN" not in adsl_derived.columns and "TRT01PN" in adsl_derived.columns:
-        adsl_derived["TRT01AN"] = adsl_derived["TRT01PN"]
+    if "TRT01AN" not in adsl.columns:
+        planned = new_cols.get("TRT01PN", adsl.get("TRT01PN"))
+        if planned is not None:
+            new_cols["TRT01AN"] = planned
 
-    return adsl_derived
+    return adsl.assign(**new_cols)
 
 
 def derive_analysis_flags(adsl: pd.DataFrame) -> pd.DataFrame:
@@ -58,24 +165,22 @@ def derive_analysis_flags(adsl: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         ADSL with derived analysis flags
     """
-    adsl_derived = adsl.copy()
+    new_cols = {}
 
     # Safety flag - typically all randomized subjects
-    if "SAFFL" not in adsl_derived.columns:
-        adsl_derived["SAFFL"] = "Y"
+    if "SAFFL" not in adsl.columns:
+        new_cols["SAFFL"] = "Y"
 
     # Efficacy flag - typically excludes major protocol violations
-    if "EFFFL" not in adsl_derived.columns:
+    if "EFFFL" not in adsl.columns:
         # Simple derivation - could be more complex in real studies
-        adsl_derived["EFFFL"] = np.where(
-            adsl_derived.get("DTHFL", "N") == "Y", "N", "Y"
-        )
+        new_cols["EFFFL"] = np.where(adsl.get("DTHFL", "N") == "Y", "N", "Y")
 
     # ITT flag - Intent-to-treat population
-    if "ITTFL" not in adsl_derived.columns:
-        adsl_derived["ITTFL"] = "Y"
+    if "ITTFL" not in adsl.columns:
+        new_cols["ITTFL"] = "Y"
 
-    return adsl_derived
+    return adsl.assign(**new_cols)
 
 
 def derive_disposition_variables(adsl: pd.DataFrame) -> pd.DataFrame:
@@ -92,16 +197,16 @@ def derive_disposition_variables(adsl: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         ADSL with derived disposition variables
     """
-    adsl_derived = adsl.copy()
+    new_cols = {}
 
     # Discontinuation flag
-    if "DISCONFL" not in adsl_derived.columns:
-        adsl_derived["DISCONFL"] = np.where(
-            adsl_derived.get("DCSREAS", "") == "COMPLETED", "N", "Y"
+    if "DISCONFL" not in adsl.columns:
+        new_cols["DISCONFL"] = np.where(
+            adsl.get("DCSREAS", "") == "COMPLETED", "N", "Y"
         )
 
     # Discontinuation reason coded
-    if "DCREASCD" not in adsl_derived.columns and "DCSREAS" in adsl_derived.columns:
+    if "DCREASCD" not in adsl.columns and "DCSREAS" in adsl.columns:
         reason_map = {
             "COMPLETED": "COMPLETED",
             "ADVERSE EVENT": "AE",
@@ -110,11 +215,9 @@ def derive_disposition_variables(adsl: pd.DataFrame) -> pd.DataFrame:
             "LOST TO FOLLOW-UP": "LTFU",
             "PROTOCOL VIOLATION": "PROTOCOL",
         }
-        adsl_derived["DCREASCD"] = (
-            adsl_derived["DCSREAS"].map(reason_map).fillna("OTHER")
-        )
+        new_cols["DCREASCD"] = _map_values(adsl["DCSREAS"], reason_map, "OTHER")
 
-    return adsl_derived
+    return adsl.assign(**new_cols)
 
 
 def derive_demographic_categories(adsl: pd.DataFrame) -> pd.DataFrame:
@@ -131,33 +234,34 @@ def derive_demographic_categories(adsl: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         ADSL with derived demographic categories
     """
-    adsl_derived = adsl.copy()
+    new_cols = {}
 
     # Age categories
-    if "AGEGR1" not in adsl_derived.columns and "AGE" in adsl_derived.columns:
-        adsl_derived["AGEGR1"] = pd.cut(
-            adsl_derived["AGE"],
-            bins=[0, 65, 75, 999],
-            labels=["<65", "65-74", ">=75"],
-            right=False,
+    if "AGEGR1" not in adsl.columns and "AGE" in adsl.columns:
+        new_cols["AGEGR1"] = _bucketize(
+            adsl["AGE"], [0, 65, 75, 999], ["<65", "65-74", ">=75"]
         )
 
     # BMI categories if height and weight available
-    if all(col in adsl_derived.columns for col in ["HEIGHT", "WEIGHT"]):
-        if "BMI" not in adsl_derived.columns:
-            # BMI = weight(kg) / height(m)^2
-            height_m = adsl_derived["HEIGHT"] / 100  # Convert cm to m
-            adsl_derived["BMI"] = adsl_derived["WEIGHT"] / (height_m**2)
-
-        if "BMIGR1" not in adsl_derived.columns:
-            adsl_derived["BMIGR1"] = pd.cut(
-                adsl_derived["BMI"],
-                bins=[0, 18.5, 25, 30, 999],
-                labels=["Underweight", "Normal", "Overweight", "Obese"],
-                right=False,
+    if all(col in adsl.columns for col in ["HEIGHT", "WEIGHT"]):
+        if "BMI" in adsl.columns:
+            bmi = adsl["BMI"]
+        else:
+            # BMI = weight(kg) / height(m)^2, with height converted from cm
+            bmi = new_cols["BMI"] = _evaluate(
+                "WEIGHT / (HEIGHT / 100) ** 2",
+                WEIGHT=adsl["WEIGHT"],
+                HEIGHT=adsl["HEIGHT"],
             )
 
-    return adsl_derived
+        if "BMIGR1" not in adsl.columns:
+            new_cols["BMIGR1"] = _bucketize(
+                bmi,
+                [0, 18.5, 25, 30, 999],
+                ["Underweight", "Normal", "Overweight", "Obese"],
+            )
+
+    return adsl.assign(**new_cols)
 
 
 def merge_adam_datasets(
@@ -184,12 +288,27 @@ def merge_adam_datasets(
     trt_vars = ["TRT01P", "TRT01PN", "TRT01A", "TRT01AN", "SAFFL", "EFFFL", "ITTFL"]
     trt_vars = [var for var in trt_vars if var in adsl.columns]
 
+    # Hash the ADSL subject keys once and keep the treatment variables as
+    # plain arrays, so each domain only needs a positional take per column
+    subjects = None
+    if "USUBJID" in adsl.columns and adsl["USUBJID"].is_unique:
+        subjects = pd.Index(adsl["USUBJID"])
+        trt_arrays = {var: adsl[var].array for var in trt_vars}
+
     for name, dataset in other_datasets.items():
         if "USUBJID" in dataset.columns:
-            # Merge with ADSL to get treatment information
-            merged = dataset.merge(
-                adsl[["USUBJID"] + trt_vars], on="USUBJID", how="left"
-            )
+            if subjects is not None and not dataset.columns.isin(trt_vars).any():
+                positions = subjects.get_indexer(dataset["USUBJID"])
+                treatment = {
+                    var: pd.api.extensions.take(values, positions, allow_fill=True)
+                    for var, values in trt_arrays.items()
+                }
+                merged = dataset.reset_index(drop=True).assign(**treatment)
+            else:
+                # Merge with ADSL to get treatment information
+                merged = dataset.merge(
+                    adsl[["USUBJID"] + trt_vars], on="USUBJID", how="left"
+                )
             merged_datasets[name] = merged
         else:
             merged_datasets[name] = dataset
@@ -202,6 +321,7 @@ def create_analysis_dataset(
     analysis_var: str,
     by_vars: List[str],
     population_flag: str = "SAFFL",
+    engine: str = "pandas",
 ) -> pd.DataFrame:
     """
     Create analysis dataset for TLF generation.
@@ -216,30 +336,48 @@ def create_analysis_dataset(
         Variables to group by
     population_flag : str
         Population flag to filter by
+    engine : str
+        Aggregation engine, "pandas" or "polars" (requires polars). The
+        polars engine only returns observed combinations of categorical
+        grouping variables.
 
     Returns
     -------
     pd.DataFrame
         Analysis dataset
     """
+    _check_engine(engine)
+
     # Filter by population
     if population_flag in data.columns:
-        analysis_data = data[data[population_flag] == "Y"].copy()
+        analysis_data = data[data[population_flag] == "Y"]
     else:
-        analysis_data = data.copy()
+        analysis_data = data
 
     # Create analysis dataset
     if analysis_var in analysis_data.columns:
-        result = (
-            analysis_data.groupby(by_vars + [analysis_var]).size().reset_index(name="n")
-        )
+        keys = by_vars + [analysis_var]
     else:
-        result = analysis_data.groupby(by_vars).size().reset_index(name="n")
+        keys = by_vars
+
+    if engine == "polars":
+        counts = (
+            pl.from_pandas(analysis_data[keys])
+            .drop_nulls()
+            .group_by(keys)
+            .len(name="n")
+            .sort(keys)
+            .to_pandas()
+        )
+        counts["n"] = counts["n"].astype("int64")
+        return counts
 
-    return result
+    return analysis_data.groupby(keys).size().reset_index(name="n")
 
 
-def format_ae_data(adae: pd.DataFrame, adsl: pd.DataFrame) -> pd.DataFrame:
+def format_ae_data(
+    adae: pd.DataFrame, adsl: pd.DataFrame, engine: str = "pandas"
+) -> pd.DataFrame:
     """
     Format adverse events data for analysis.
 
@@ -249,35 +387,76 @@ def format_ae_data(adae: pd.DataFrame, adsl: pd.DataFrame) -> pd.DataFrame:
         ADAE dataset
     adsl : pd.DataFrame
         ADSL dataset
+    engine : str
+        "pandas" or "polars" (requires polars), which runs the merge, filter
+        and derivations as one lazy query
 
     Returns
     -------
     pd.DataFrame
         Formatted AE dataset
     """
-    # Merge with ADSL for treatment information
-    ae_data = adae.merge(
-        adsl[["USUBJID", "TRT01A", "TRT01AN", "SAFFL"]], on="USUBJID", how="left"
-    )
+    _check_engine(engine)
+    if engine == "polars":
+        return _format_ae_data_polars(adae, adsl)
 
-    # Filter safety population
-    ae_data = ae_data[ae_data["SAFFL"] == "Y"]
+    # Filter the safety population on ADSL, then merge for treatment information
+    safety = adsl.loc[adsl["SAFFL"] == "Y", ["USUBJID", "TRT01A", "TRT01AN", "SAFFL"]]
+    ae_data = adae.merge(safety, on="USUBJID", how="inner")
 
-    # Standardize AE terms
-    if "AEDECOD" in ae_data.columns:
-        ae_data["AEDECOD"] = ae_data["AEDECOD"].str.title()
+    # AE columns repeat a small set of terms, so transform distinct values only
+    new_cols = {}
 
-    if "AEBODSYS" in ae_data.columns:
-        ae_data["AEBODSYS"] = ae_data["AEBODSYS"].str.title()
+    # Standardize AE terms
+    for var in ["AEDECOD", "AEBODSYS"]:
+        if var in ae_data.columns:
+            new_cols[var] = _map_uniques(ae_data[var], lambda terms: terms.str.title())
 
     # Derive AE flags
-    ae_data["DRUG_RELATED"] = ae_data.get("AEREL", "").isin(
-        ["POSSIBLE", "PROBABLE", "RELATED"]
+    flag_rules = {
+        "DRUG_RELATED": ("AEREL", lambda rel: rel.isin(_RELATED_CAUSALITY)),
+        "SERIOUS": ("AESER", lambda ser: ser == "Y"),
+        "FATAL": ("AEOUT", lambda out: out == "FATAL"),
+    }
+    for flag, (var, rule) in flag_rules.items():
+        if var in ae_data.columns:
+            new_cols[flag] = _map_uniques(ae_data[var], rule, missing=False)
+        else:
+            new_cols[flag] = False
+
+    return ae_data.assign(**new_cols)
+
+
+def _format_ae_data_polars(adae: pd.DataFrame, adsl: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of format_ae_data, evaluated as a single lazy query."""
+    safety = pl.from_pandas(adsl[["USUBJID", "TRT01A", "TRT01AN", "SAFFL"]]).lazy()
+    query = (
+        pl.from_pandas(adae)
+        .lazy()
+        .join(safety, on="USUBJID", how="inner", maintain_order="left")
+        .filter(pl.col("SAFFL") == "Y")
     )
-    ae_data["SERIOUS"] = ae_data.get("AESER", "N") == "Y"
-    ae_data["FATAL"] = ae_data.get("AEOUT", "") == "FATAL"
 
-    return ae_data
+    # Standardize AE terms
+    terms = [
+        pl.col(var).str.to_titlecase()
+        for var in ["AEDECOD", "AEBODSYS"]
+        if var in adae.columns
+    ]
+
+    # Derive AE flags
+    flag_rules = {
+        "DRUG_RELATED": ("AEREL", lambda rel: rel.is_in(list(_RELATED_CAUSALITY))),
+        "SERIOUS": ("AESER", lambda ser: ser == "Y"),
+        "FATAL": ("AEOUT", lambda out: out == "FATAL"),
+    }
+    flags = [
+        (rule(pl.col(var)).fill_null(False) if var in adae.columns else pl.lit(False))
+        .alias(flag)
+        for flag, (var, rule) in flag_rules.items()
+    ]
+
+    return query.with_columns(terms + flags).collect().to_pandas()
 
 
 def format_lab_data(adlb: pd.DataFrame, adsl: pd.DataFrame) -> pd.DataFrame:
@@ -296,36 +475,45 @@ def format_lab_data(adlb: pd.DataFrame, adsl: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Formatted lab dataset
     """
-    # Merge with ADSL for treatment information
-    lab_data = adlb.merge(
-        adsl[["USUBJID", "TRT01P", "TRT01PN", "EFFFL"]], on="USUBJID", how="left"
-    )
-
-    # Filter efficacy population
-    lab_data = lab_data[lab_data["EFFFL"] == "Y"]
+    # Filter the efficacy population on ADSL, then merge for treatment information
+    efficacy = adsl.loc[adsl["EFFFL"] == "Y", ["USUBJID", "TRT01P", "TRT01PN", "EFFFL"]]
+    lab_data = adlb.merge(efficacy, on="USUBJID", how="inner")
 
     # Ensure numeric analysis values
-    if "AVAL" in lab_data.columns:
-        lab_data["AVAL"] = pd.to_numeric(lab_data["AVAL"], errors="coerce")
+    new_cols = {
+        var: pd.to_numeric(lab_data[var], errors="coerce")
+        for var in ["AVAL", "BASE"]
+        if var in lab_data.columns
+    }
 
-    if "BASE" in lab_data.columns:
-        lab_data["BASE"] = pd.to_numeric(lab_data["BASE"], errors="coerce")
+    # Change and percent change from baseline, if not present
+    if len(new_cols) == 2:
+        # The difference is computed once and shared by CHG and PCHG
+        change = new_cols["AVAL"] - new_cols["BASE"]
 
-    # Calculate change from baseline if not present
-    if "CHG" not in lab_data.columns and all(
-        col in lab_data.columns for col in ["AVAL", "BASE"]
-    ):
-        lab_data["CHG"] = lab_data["AVAL"] - lab_data["BASE"]
+        if "CHG" not in lab_data.columns:
+            new_cols["CHG"] = change
 
-    # Calculate percent change from baseline
-    if "PCHG" not in lab_data.columns and all(
-        col in lab_data.columns for col in ["AVAL", "BASE"]
-    ):
-        lab_data["PCHG"] = (
-            (lab_data["AVAL"] - lab_data["BASE"]) / lab_data["BASE"]
-        ) * 100
+        if "PCHG" not in lab_data.columns:
+            new_cols["PCHG"] = _evaluate(
+                "CHG / BASE * 100", CHG=change, BASE=new_cols["BASE"]
+            )
+
+    return lab_data.assign(**new_cols)
 
-    return lab_data
+
+def _grouped_quantile(
+    sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """Linearly interpolated quantile of contiguous sorted group slices."""
+    result = np.full(len(counts), np.nan)
+    present = counts > 0
+    position = starts[present] + q * (counts[present] - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, starts[present] + counts[present] - 1)
+    low = sorted_values[lower]
+    result[present] = low + (sorted_values[upper] - low) * (position - lower)
+    return result
 
 
 def create_summary_statistics(
@@ -347,29 +535,70 @@ def create_summary_statistics(
     -------
     pd.DataFrame
         Summary statistics
+
+    Notes
+    -----
+    The grouping variable is factorized once and the values are sorted by
+    group and value, so every statistic, including the quartiles, is read
+    from contiguous sorted slices instead of separate groupby passes.
     """
     if analysis_var not in data.columns:
         raise ValueError(f"Analysis variable '{analysis_var}' not found in data")
 
     # Remove missing values
     clean_data = data.dropna(subset=[analysis_var])
+    by_values = clean_data[by_var]
 
-    # Calculate statistics
-    stats = (
-        clean_data.groupby(by_var)[analysis_var]
-        .agg(["count", "mean", "std", "min", "max", "median"])
-        .round(2)
+    # Groups are ordered like groupby: sorted keys, all categories if categorical
+    if isinstance(by_values.dtype, pd.CategoricalDtype):
+        codes = by_values.cat.codes.to_numpy()
+        groups = by_values.cat.categories
+    else:
+        codes, groups = pd.factorize(by_values, sort=True)
+    n_groups = len(groups)
+
+    values = clean_data[analysis_var].to_numpy(dtype=np.float64)
+    keep = codes >= 0
+    codes, values = codes[keep], values[keep]
+
+    # One sort by group then value gives contiguous, ordered group slices
+    order = np.lexsort((values, codes))
+    sorted_values = values[order]
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    ends = starts + counts - 1
+
+    present = counts > 0
+    mean = np.full(n_groups, np.nan)
+    std = np.full(n_groups, np.nan)
+    minimum = np.full(n_groups, np.nan)
+    maximum = np.full(n_groups, np.nan)
+
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    mean[present] = sums[present] / counts[present]
+    squares = np.bincount(
+        codes, weights=(values - mean[codes]) ** 2, minlength=n_groups
     )
+    multiple = counts > 1
+    std[multiple] = np.sqrt(squares[multiple] / (counts[multiple] - 1))
+    minimum[present] = sorted_values[starts[present]]
+    maximum[present] = sorted_values[ends[present]]
+
+    stats = pd.DataFrame(
+        {
+            by_var: groups,
+            "count": counts,
+            "mean": mean,
+            "std": std,
+            "min": minimum,
+            "max": maximum,
+            "median": _grouped_quantile(sorted_values, starts, counts, 0.5),
+        }
+    ).round(2)
 
-    # Calculate quartiles
-    q25 = clean_data.groupby(by_var)[analysis_var].quantile(0.25)
-    q75 = clean_data.groupby(by_var)[analysis_var].quantile(0.75)
-
-    stats["q1"] = q25
-    stats["q3"] = q75
-
-    # Reset index to make treatment a column
-    stats = stats.reset_index()
+    # Quartiles are reported unrounded
+    stats["q1"] = _grouped_quantile(sorted_values, starts, counts, 0.25)
+    stats["q3"] = _grouped_quantile(sorted_values, starts, counts, 0.75)
 
     return stats
 
@@ -402,46 +631,36 @@ def create_frequency_table(
     if analysis_var not in data.columns:
         raise ValueError(f"Analysis variable '{analysis_var}' not found in data")
 
-    # Create frequency table
-    freq_table = pd.crosstab(
-        data[analysis_var], data[by_var], margins=include_total, margins_name="Total"
-    )
-
-    # Calculate percentages
-    pct_table = (
-        pd.crosstab(
-            data[analysis_var],
-            data[by_var],
-            normalize="columns",
-            margins=include_total,
-            margins_name="Total",
-        )
-        * 100
-    )
-
-    # Combine counts and percentages
-    result_data = []
-    for idx in freq_table.index:
-        if idx == "Total" and not include_total:
-            continue
-
-        row_data = {"Category": idx}
-        for col in freq_table.columns:
-            if col == "Total" and not include_total:
-                continue
-
-            try:
-                n = freq_table.loc[idx, col]
-                pct = pct_table.loc[idx, col]
-                row_data[f"{col}_n"] = n
-                row_data[f"{col}_pct"] = f"{pct:.1f}"
-                row_data[f"{col}_npct"] = f"{n} ({pct:.1f}%)"
-            except KeyError:
-                # Handle missing combinations
-                row_data[f"{col}_n"] = 0
-                row_data[f"{col}_pct"] = "0.0"
-                row_data[f"{col}_npct"] = "0 (0.0%)"
-        result_data.append(row_data)
+    # Tabulate factorized codes in one pass, like crosstab without missing keys
+    table = data[[analysis_var, by_var]].dropna()
+    row_codes, categories = pd.factorize(table[analysis_var], sort=True)
+    col_codes, groups = pd.factorize(table[by_var], sort=True)
+    counts = np.bincount(
+        row_codes * len(groups) + col_codes,
+        minlength=len(categories) * len(groups),
+    ).reshape(len(categories), len(groups))
+
+    row_labels = list(categories)
+    col_labels = list(groups)
+    if include_total:
+        counts = np.column_stack([counts, counts.sum(axis=1)])
+        counts = np.vstack([counts, counts.sum(axis=0)])
+        row_labels.append("Total")
+        col_labels.append("Total")
+
+    # Column percentages; the Total row is 100% of each column
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = counts / counts[: len(categories)].sum(axis=0) * 100
+
+    result_data = {"Category": row_labels}
+    for j, col in enumerate(col_labels):
+        n = counts[:, j]
+        pct = [f"{value:.1f}" for value in percentages[:, j].tolist()]
+        result_data[f"{col}_n"] = n
+        result_data[f"{col}_pct"] = pct
+        result_data[f"{col}_npct"] = [
+            f"{count} ({value}%)" for count, value in zip(n.tolist(), pct)
+        ]
 
     return pd.DataFrame(result_data)
 
@@ -462,44 +681,38 @@ def apply_cdisc_formats(data: pd.DataFrame, dataset_type: str) -> pd.DataFrame:
     pd.DataFrame
         Formatted dataset
     """
-    formatted_data = data.copy()
-
     # Standard date formatting
     date_vars = [
-        col
-        for col in formatted_data.columns
-        if col.endswith("DT") or col.endswith("DTM")
+        col for col in data.columns if col.endswith("DT") or col.endswith("DTM")
     ]
-    for var in date_vars:
-        if var in formatted_data.columns:
-            formatted_data[var] = pd.to_datetime(formatted_data[var], errors="coerce")
+    new_cols = {var: pd.to_datetime(data[var], errors="coerce") for var in date_vars}
 
     # Standard numeric formatting
     numeric_vars = [
-        col for col in formatted_data.columns if col in ["AGE", "AVAL", "BASE", "CHG"]
+        col for col in data.columns if col in ["AGE", "AVAL", "BASE", "CHG"]
     ]
     for var in numeric_vars:
-        if var in formatted_data.columns:
-            formatted_data[var] = pd.to_numeric(formatted_data[var], errors="coerce")
+        new_cols[var] = pd.to_numeric(data[var], errors="coerce")
 
     # Dataset-specific formatting
     if dataset_type.upper() == "ADSL":
         # Ensure subject ID is string
-        if "USUBJID" in formatted_data.columns:
-            formatted_data["USUBJID"] = formatted_data["USUBJID"].astype(str)
+        if "USUBJID" in data.columns:
+            new_cols["USUBJID"] = data["USUBJID"].astype(str)
 
         # Standardize flag variables
-        flag_vars = [col for col in formatted_data.columns if col.endswith("FL")]
-        for var in flag_vars:
-            formatted_data[var] = formatted_data[var].fillna("N")
+        flag_vars = [col for col in data.columns if col.endswith("FL")]
+        if flag_vars:
+            new_cols.update(data[flag_vars].fillna("N").items())
 
     elif dataset_type.upper() == "ADAE":
         # Standardize severity
-        if "AESEV" in formatted_data.columns:
+        if "AESEV" in data.columns:
             sev_map = {"1": "MILD", "2": "MODERATE", "3": "SEVERE"}
-            formatted_data["AESEV"] = formatted_data["AESEV"].replace(sev_map)
+            new_cols["AESEV"] = data["AESEV"].replace(sev_map)
 
-    return formatted_data
+    # Assign all converted columns at once on a single copy
+    return data.assign(**new_cols)
 
 
 def validate_adam_structure(data: pd.DataFrame, dataset_type: str) -> Dict[str, Any]:
@@ -527,19 +740,11 @@ def validate_adam_structure(data: pd.DataFrame, dataset_type: str) -> Dict[str,
         "variable_count": len(data.columns),
     }
 
-    # Required variables by dataset type
-    required_vars = {
-        "ADSL": ["USUBJID", "STUDYID", "SUBJID"],
-        "ADAE": ["USUBJID", "AEDECOD"],
-        "ADLB": ["USUBJID", "PARAMCD", "AVAL"],
-        "ADCM": ["USUBJID", "CMDECOD"],
-        "ADVS": ["USUBJID", "PARAMCD", "AVAL"],
-    }
-
-    dataset_required = required_vars.get(dataset_type.upper(), ["USUBJID"])
+    dataset_required = _REQUIRED_VARIABLES.get(dataset_type.upper(), ["USUBJID"])
+    columns = frozenset(data.columns)
 
     # Check required variables
-    missing_vars = [var for var in dataset_required if var not in data.columns]
+    missing_vars = [var for var in dataset_required if var not in columns]
     if missing_vars:
         validation_result["errors"].append(
             f"Missing required variables: {missing_vars}"
@@ -547,8 +752,9 @@ def validate_adam_structure(data: pd.DataFrame, dataset_type: str) -> Dict[str,
         validation_result["valid"] = False
 
     # Check for duplicate keys
-    if dataset_type.upper() == "ADSL" and "USUBJID" in data.columns:
-        duplicates = data["USUBJID"].duplicated().sum()
+    if dataset_type.upper() == "ADSL" and "USUBJID" in columns:
+        # Count duplicates from the number of distinct IDs (missing IDs count once)
+        duplicates = len(data) - data["USUBJID"].nunique(dropna=False)
         if duplicates > 0:
             validation_result["errors"].append(
                 f"Found {duplicates} duplicate subject IDs"
@@ -556,7 +762,7 @@ def validate_adam_structure(data: pd.DataFrame, dataset_type: str) -> Dict[str,
             validation_result["valid"] = False
 
     # Check data types
-    if "USUBJID" in data.columns and not data["USUBJID"].dtype == "object":
+    if "USUBJID" in columns and not data["USUBJID"].dtype == "object":
         validation_result["warnings"].append("USUBJID should be character/string type")
 
     return validation_result
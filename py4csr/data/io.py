@@ -5,9 +5,13 @@ This module provides functions for reading various clinical data formats
 including SAS (.sas7bdat), XPT, and other common formats.
 """
 
+import os
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -19,9 +23,146 @@ except ImportError:
     HAS_PYREADSTAT = False
     pyreadstat = None
 
+# Optional dependency for Arrow-backed DataFrames
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+
+
+def _arrow_table(chunk: pd.DataFrame) -> "pa.Table":
+    return pa.Table.from_pandas(chunk, preserve_index=False)
+
+
+def _arrow_frame(tables: List["pa.Table"]) -> pd.DataFrame:
+    """Combine Arrow tables read chunk by chunk into one pyarrow-backed DataFrame."""
+    # A column can be entirely missing within a chunk and infer a null type
+    # there; promotion lets those chunks combine with the others
+    try:
+        table = pa.concat_tables(tables, promote_options="default")
+    except TypeError:  # pyarrow < 14
+        table = pa.concat_tables(tables, promote=True)
+
+    # Flag variables hold a handful of values; store them dictionary-encoded
+    for i, name in enumerate(table.column_names):
+        column = table.column(i)
+        if str(name).endswith("FL") and pa.types.is_string(column.type):
+            table = table.set_column(i, name, column.dictionary_encode())
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# Frames parsed by read_sas/read_xpt with cache=True, most recently used last;
+# keyed by (reader, path, options) with (mtime_ns, size, frame) values
+_READ_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_READ_CACHE_SIZE = 4
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def _read_cached(
+    reader, filepath: Union[str, Path], cache: bool = False, **options
+) -> pd.DataFrame:
+    """
+    Read a file with ``reader``, optionally reusing the parsed frame.
+
+    Without ``cache`` the file is simply parsed. With it, entries are keyed by
+    path and reader options and reused while the file's modification time and
+    size are unchanged; a private copy is kept so callers may modify the frames
+    they receive. Calls with unhashable options are not cached.
+    """
+    path = str(filepath)
+    if not cache:
+        return reader(path, **options)
+
+    key = (reader, path, tuple(sorted(options.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return reader(path, **options)
+
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(key)
+        if entry is not None and entry[:2] == version:
+            _READ_CACHE.move_to_end(key)
+            return entry[2].copy()
+
+    df = reader(path, **options)
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = (*version, df.copy())
+        _READ_CACHE.move_to_end(key)
+        while len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+    return df
+
+
+def clear_read_cache() -> None:
+    """Discard all frames cached by read_sas and read_xpt."""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def _attach_metadata(df: pd.DataFrame, meta, path: str) -> pd.DataFrame:
+    # Store metadata as DataFrame attributes
+    if hasattr(df, "attrs"):
+        df.attrs["variable_labels"] = meta.column_labels or {}
+        df.attrs["value_labels"] = meta.variable_value_labels or {}
+        df.attrs["source_file"] = path
+    return df
+
+
+def _parse_sas(
+    path: str,
+    encoding: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    dtype_backend: Optional[str] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    # With the pyarrow backend each chunk is converted as soon as it is read,
+    # so only one pandas chunk is alive at a time
+    to_arrow = dtype_backend == "pyarrow"
+
+    if chunksize is None:
+        df, meta = pyreadstat.read_sas7bdat(path, encoding=encoding, **kwargs)
+        chunks = [_arrow_table(df) if to_arrow else df]
+        del df
+    else:
+        chunks = []
+        for chunk, meta in pyreadstat.read_file_in_chunks(
+            pyreadstat.read_sas7bdat,
+            path,
+            chunksize=chunksize,
+            encoding=encoding,
+            **kwargs,
+        ):
+            chunks.append(_arrow_table(chunk) if to_arrow else chunk)
+            del chunk
+
+    if to_arrow:
+        df = _arrow_frame(chunks)
+    elif len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = pd.concat(chunks, ignore_index=True)
+
+    return _attach_metadata(df, meta, path)
+
+
+def _parse_xport(path: str, encoding: Optional[str] = None, **kwargs) -> pd.DataFrame:
+    df, meta = pyreadstat.read_xport(path, encoding=encoding, **kwargs)
+    return _attach_metadata(df, meta, path)
+
 
 def read_sas(
-    filepath: Union[str, Path], encoding: Optional[str] = None, **kwargs
+    filepath: Union[str, Path],
+    encoding: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    dtype_backend: Optional[str] = None,
+    cache: bool = False,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Read a SAS dataset (.sas7bdat) file.
@@ -35,6 +176,14 @@ def read_sas(
         Path to the SAS dataset file
     encoding : str, optional
         Character encoding for the file (default: None for auto-detection)
+    chunksize : int, optional
+        Read the file in chunks of this many rows instead of in one call
+    dtype_backend : str, optional
+        Use "pyarrow" to return a pyarrow-backed DataFrame, with flag
+        variables dictionary-encoded (requires pyarrow)
+    cache : bool
+        Keep the parsed frame and return a copy of it on later reads of the
+        unchanged file (default: False)
     **kwargs
         Additional arguments passed to pyreadstat.read_sas7bdat
 
@@ -43,10 +192,16 @@ def read_sas(
     pd.DataFrame
         DataFrame containing the clinical data
 
+    Notes
+    -----
+    With ``cache=True`` the most recently read files are kept until they
+    change on disk; use ``clear_read_cache`` to release the memory.
+
     Examples
     --------
     >>> adsl = read_sas("data/adsl.sas7bdat")
     >>> adae = read_sas("data/adae.sas7bdat", encoding="utf-8")
+    >>> adlb = read_sas("data/adlb.sas7bdat", chunksize=500_000)
     """
     if not HAS_PYREADSTAT:
         raise ImportError(
@@ -54,6 +209,17 @@ def read_sas(
             "Install it with: pip install py4csr[sas]"
         )
 
+    if dtype_backend not in (None, "pyarrow"):
+        raise ValueError(
+            f"Unsupported dtype_backend: {dtype_backend}. Use None or 'pyarrow'"
+        )
+
+    if dtype_backend == "pyarrow" and not (HAS_PYARROW and hasattr(pd, "ArrowDtype")):
+        raise ImportError(
+            "pyarrow and pandas>=1.5 are required for dtype_backend='pyarrow'. "
+            "Install it with: pip install py4csr[performance]"
+        )
+
     filepath = Path(filepath)
 
     if not filepath.exists():
@@ -63,22 +229,25 @@ def read_sas(
         warnings.warn(f"Expected .sas7bdat file, got {filepath.suffix}")
 
     try:
-        df, meta = pyreadstat.read_sas7bdat(str(filepath), encoding=encoding, **kwargs)
-
-        # Store metadata as DataFrame attributes
-        if hasattr(df, "attrs"):
-            df.attrs["variable_labels"] = meta.column_labels or {}
-            df.attrs["value_labels"] = meta.variable_value_labels or {}
-            df.attrs["source_file"] = str(filepath)
-
-        return df
+        return _read_cached(
+            _parse_sas,
+            filepath,
+            cache,
+            encoding=encoding,
+            chunksize=chunksize,
+            dtype_backend=dtype_backend,
+            **kwargs,
+        )
 
     except Exception as e:
         raise RuntimeError(f"Error reading SAS file {filepath}: {str(e)}")
 
 
 def read_xpt(
-    filepath: Union[str, Path], encoding: Optional[str] = None, **kwargs
+    filepath: Union[str, Path],
+    encoding: Optional[str] = None,
+    cache: bool = False,
+    **kwargs,
 ) -> pd.DataFrame:
     """
     Read an XPT (SAS Transport) file.
@@ -89,6 +258,9 @@ def read_xpt(
         Path to the XPT file
     encoding : str, optional
         Character encoding for the file
+    cache : bool
+        Keep the parsed frame and return a copy of it on later reads of the
+        unchanged file (default: False)
     **kwargs
         Additional arguments passed to pyreadstat.read_xport
 
@@ -109,15 +281,9 @@ def read_xpt(
         raise FileNotFoundError(f"File not found: {filepath}")
 
     try:
-        df, meta = pyreadstat.read_xport(str(filepath), encoding=encoding, **kwargs)
-
-        # Store metadata as DataFrame attributes
-        if hasattr(df, "attrs"):
-            df.attrs["variable_labels"] = meta.column_labels or {}
-            df.attrs["value_labels"] = meta.variable_value_labels or {}
-            df.attrs["source_file"] = str(filepath)
-
-        return df
+        return _read_cached(
+            _parse_xport, filepath, cache, encoding=encoding, **kwargs
+        )
 
     except Exception as e:
         raise RuntimeError(f"Error reading XPT file {filepath}: {str(e)}")
@@ -222,7 +388,7 @@ def get_dataset_info(df: pd.DataFrame) -> Dict[str, Any]:
     return info
 
 
-def read_xpt(file_path: str) -> pd.DataFrame:
+def read_xpt(file_path: str, cache: bool = False) -> pd.DataFrame:
     """
     Read SAS transport (XPT) file.
 
@@ -230,27 +396,115 @@ def read_xpt(file_path: str) -> pd.DataFrame:
     ----------
     file_path : str
         Path to the XPT file
+    cache : bool
+        Keep the parsed frame and return a copy of it on later reads of the
+        unchanged file (default: False)
 
     Returns
     -------
     pd.DataFrame
         Data from XPT file
     """
-    try:
-        import pyreadstat
-
-        df, meta = pyreadstat.read_xport(file_path)
-        return df
-    except ImportError:
+    if not HAS_PYREADSTAT:
         raise ImportError(
             "pyreadstat package is required to read XPT files. Install with: pip install pyreadstat"
         )
+
+    try:
+        return _read_cached(_parse_xport, file_path, cache)
     except Exception as e:
         print(f"Error reading XPT file {file_path}: {e}")
         return pd.DataFrame()
 
 
-def load_adam_data(data_dir: str, datasets: list = None) -> Dict[str, pd.DataFrame]:
+def _find_file(available: Dict[str, str], file_name: str) -> Optional[str]:
+    """
+    Actual name of ``file_name`` in a directory listing.
+
+    ``available`` maps every file name, and its lower-case form, to the file
+    name. Names match case-insensitively (e.g. ``ADSL.sas7bdat`` for "adsl")
+    as on Windows and macOS, preferring an exact match.
+    """
+    return available.get(file_name) or available.get(file_name.lower())
+
+
+def _read_parquet_cache(
+    data_path: Path, dataset: str, available: Dict[str, str]
+) -> Optional[pd.DataFrame]:
+    """Read the Parquet copy of a SAS/XPT dataset if it is newer than the source."""
+    cache_name = _find_file(available, f"{dataset}.parquet")
+    if cache_name is None:
+        return None
+
+    cache_path = data_path / cache_name
+    sources = [
+        _find_file(available, f"{dataset}{ext}") for ext in [".sas7bdat", ".xpt"]
+    ]
+    cache_mtime = cache_path.stat().st_mtime_ns
+    if any(
+        (data_path / name).stat().st_mtime_ns > cache_mtime
+        for name in sources
+        if name is not None
+    ):
+        return None
+
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception as e:
+        print(f"Error loading {cache_path}: {e}")
+        return None
+
+
+def _write_parquet_cache(df: pd.DataFrame, data_path: Path, dataset: str) -> None:
+    cache_path = data_path / f"{dataset}.parquet"
+    try:
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
+    except Exception as e:
+        warnings.warn(f"Could not write Parquet cache {cache_path}: {e}")
+
+
+def _load_adam_dataset(
+    data_path: Path,
+    dataset: str,
+    available: Dict[str, str],
+    parquet_cache: bool = False,
+) -> Optional[pd.DataFrame]:
+    """Load one ADaM dataset, trying each supported extension in turn."""
+    if parquet_cache:
+        df = _read_parquet_cache(data_path, dataset, available)
+        if df is not None and not df.empty:
+            return df
+
+    for ext in [".sas7bdat", ".xpt", ".csv"]:
+        file_name = _find_file(available, f"{dataset}{ext}")
+        if file_name is None:
+            continue
+
+        file_path = data_path / file_name
+        try:
+            if ext == ".sas7bdat":
+                df = read_sas(str(file_path))
+            elif ext == ".xpt":
+                df = read_xpt(str(file_path))
+            elif ext == ".csv":
+                df = pd.read_csv(str(file_path))
+
+            if not df.empty:
+                if parquet_cache and ext != ".csv":
+                    _write_parquet_cache(df, data_path, dataset)
+                return df
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+
+    return None
+
+
+def load_adam_data(
+    data_dir: str,
+    datasets: list = None,
+    max_workers: Optional[int] = None,
+    parquet_cache: bool = False,
+) -> Dict[str, pd.DataFrame]:
     """
     Load multiple ADAM datasets from a directory.
 
@@ -261,13 +515,24 @@ def load_adam_data(data_dir: str, datasets: list = None) -> Dict[str, pd.DataFra
     datasets : list, optional
         List of dataset names to load (e.g., ['adsl', 'adae', 'adlb'])
         If None, attempts to load common ADAM datasets
+    max_workers : int, optional
+        Number of threads used to read datasets concurrently
+        (default: one per dataset, at most 8)
+    parquet_cache : bool
+        Keep a zstd-compressed ``<dataset>.parquet`` copy of each SAS/XPT
+        dataset next to the original and read it instead while it is newer
+        than the source file (requires pyarrow)
 
     Returns
     -------
     dict
         Dictionary of dataset name -> DataFrame
     """
-    from pathlib import Path
+    if parquet_cache and not HAS_PYARROW:
+        raise ImportError(
+            "pyarrow is required for parquet_cache. "
+            "Install it with: pip install py4csr[performance]"
+        )
 
     if datasets is None:
         datasets = ["adsl", "adae", "adlb", "adcm", "adex", "advs"]
@@ -275,25 +540,32 @@ def load_adam_data(data_dir: str, datasets: list = None) -> Dict[str, pd.DataFra
     data_path = Path(data_dir)
     loaded_data = {}
 
-    for dataset in datasets:
-        # Try different file extensions
-        for ext in [".sas7bdat", ".xpt", ".csv"]:
-            file_path = data_path / f"{dataset}{ext}"
-            if file_path.exists():
-                try:
-                    if ext == ".sas7bdat":
-                        df = read_sas(str(file_path))
-                    elif ext == ".xpt":
-                        df = read_xpt(str(file_path))
-                    elif ext == ".csv":
-                        df = pd.read_csv(str(file_path))
-
-                    if not df.empty:
-                        loaded_data[dataset.upper()] = df
-                        print(f"Loaded {dataset.upper()}: {len(df)} records")
-                        break
-                except Exception as e:
-                    print(f"Error loading {file_path}: {e}")
-                    continue
+    # List the directory once instead of probing every candidate path
+    try:
+        with os.scandir(data_path) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return loaded_data
+
+    available = {name: name for name in names}
+    for name in names:
+        available.setdefault(name.lower(), name)
+
+    if not datasets:
+        return loaded_data
+
+    # The readers release the GIL while parsing, so threads overlap the reads
+    workers = max_workers or min(8, len(datasets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda dataset: _load_adam_dataset(
+                data_path, dataset, available, parquet_cache
+            ),
+            datasets,
+        )
+        for dataset, df in zip(datasets, results):
+            if df is not None:
+                loaded_data[dataset.upper()] = df
+                print(f"Loaded {dataset.upper()}: {len(df)} records")
 
     return loaded_data
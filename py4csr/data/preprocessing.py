@@ -5,11 +5,24 @@ This module provides functions for preprocessing and formatting
 clinical data for analysis and reporting.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import ast
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from .adam_utils import HAS_NUMEXPR, NUMEXPR_MIN_ROWS, _check_engine, numexpr, pl
+
+# Row position column used to restore the pandas index after a polars round trip
+_ROW_INDEX = "__py4csr_row__"
+
+# String representations of missing values replaced by clean_data
+_STRING_NA_VALUES = ["", " ", "NA", "N/A", "NULL", "null", ".", "Missing"]
+
+# Maximum ratio of distinct values to rows for the "auto_categorical" format
+AUTO_CATEGORICAL_MAX_RATIO = 0.05
+
 
 def apply_formats(data: pd.DataFrame, format_dict: Dict[str, str]) -> pd.DataFrame:
     """
@@ -20,31 +33,60 @@ def apply_formats(data: pd.DataFrame, format_dict: Dict[str, str]) -> pd.DataFra
     data : pd.DataFrame
         Input dataset
     format_dict : dict
-        Dictionary mapping column names to format strings
+        Dictionary mapping column names to format strings: "date",
+        "numeric", "categorical", or "auto_categorical" (category dtype only
+        for low-cardinality text columns, e.g. SEX, RACE, TRT01P or AESEV)
 
     Returns
     -------
     pd.DataFrame
         Formatted dataset
     """
-    formatted_data = data.copy()
-
+    # Only the formatted columns are rebuilt; the rest are carried over by assign
+    new_cols = {}
     for col, fmt in format_dict.items():
-        if col in formatted_data.columns:
+        if col in data.columns:
             if fmt == "date":
-                formatted_data[col] = pd.to_datetime(formatted_data[col])
+                # Columns that are already datetimes need no parsing
+                if not pd.api.types.is_datetime64_any_dtype(data[col]):
+                    new_cols[col] = pd.to_datetime(data[col])
             elif fmt == "numeric":
-                formatted_data[col] = pd.to_numeric(
-                    formatted_data[col], errors="coerce"
-                )
+                new_cols[col] = pd.to_numeric(data[col], errors="coerce")
             elif fmt == "categorical":
-                formatted_data[col] = formatted_data[col].astype("category")
+                new_cols[col] = data[col].astype("category")
+            elif fmt == "auto_categorical":
+                if _is_low_cardinality_text(data[col]):
+                    new_cols[col] = data[col].astype("category")
+
+    return data.assign(**new_cols)
+
+
+def _is_low_cardinality_text(series: pd.Series) -> bool:
+    """Whether a text column repeats few enough values to store as category."""
+    if len(series) == 0 or not (
+        pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+    ):
+        return False
+    return series.nunique() <= AUTO_CATEGORICAL_MAX_RATIO * len(series)
 
-    return formatted_data
+
+def _to_polars(data: pd.DataFrame) -> "pl.DataFrame":
+    """Convert to polars, keeping row positions in a ``_ROW_INDEX`` column."""
+    return pl.from_pandas(data).with_row_index(_ROW_INDEX)
+
+
+def _from_polars(frame: "pl.DataFrame", index: pd.Index) -> pd.DataFrame:
+    """Convert back to pandas, restoring the labels of the remaining rows."""
+    result = frame.drop(_ROW_INDEX).to_pandas()
+    result.index = index.take(frame[_ROW_INDEX].to_numpy())
+    return result
 
 
 def handle_missing_data(
-    data: pd.DataFrame, strategy: str = "listwise", fill_values: Dict[str, Any] = None
+    data: pd.DataFrame,
+    strategy: str = "listwise",
+    fill_values: Dict[str, Any] = None,
+    engine: str = "pandas",
 ) -> pd.DataFrame:
     """
     Handle missing data in clinical datasets.
@@ -57,13 +99,23 @@ def handle_missing_data(
         Missing data strategy: 'listwise', 'pairwise', 'impute', 'forward_fill'
     fill_values : dict, optional
         Dictionary of column -> fill value for imputation
+    engine : str
+        "pandas" or "polars" (requires polars). The polars engine converts
+        the data to Arrow-backed columns, so column dtypes may differ.
 
     Returns
     -------
     pd.DataFrame
         Dataset with missing data handled
     """
-    result_data = data.copy()
+    _check_engine(engine)
+    if strategy not in ("listwise", "pairwise", "impute", "forward_fill"):
+        raise ValueError(f"Unknown missing data strategy: {strategy}")
+    if engine == "polars":
+        return _handle_missing_data_polars(data, strategy, fill_values)
+
+    # Each strategy builds a new frame, so the input is never copied up front
+    result_data = data
 
     if strategy == "listwise":
         # Remove rows with any missing values
@@ -80,38 +132,107 @@ def handle_missing_data(
         print(
             "Pairwise deletion: keeping all data, missing values handled per analysis"
         )
-        pass
+        result_data = result_data.copy()
 
     elif strategy == "impute":
         if fill_values:
             # Use specified fill values
-            for col, fill_val in fill_values.items():
-                if col in result_data.columns:
-                    result_data[col] = result_data[col].fillna(fill_val)
+            fill_dict = {
+                col: fill_val
+                for col, fill_val in fill_values.items()
+                if col in result_data.columns
+            }
         else:
-            # Use default imputation strategies
-            for col in result_data.columns:
-                if result_data[col].dtype in ["int64", "float64"]:
-                    # Numeric: fill with median
-                    result_data[col] = result_data[col].fillna(
-                        result_data[col].median()
-                    )
-                else:
-                    # Categorical: fill with mode
-                    mode_val = result_data[col].mode()
-                    if len(mode_val) > 0:
-                        result_data[col] = result_data[col].fillna(mode_val[0])
-
-    elif strategy == "forward_fill":
-        # Forward fill missing values
-        result_data = result_data.fillna(method="ffill")
+            # Use default imputation strategies, only for columns with gaps
+            missing = result_data.columns[result_data.isna().any().to_numpy()]
+            numeric = [
+                col for col in missing if result_data[col].dtype in ["int64", "float64"]
+            ]
+            # Numeric: fill with median
+            fill_dict = result_data[numeric].median().to_dict()
+            for col in missing.difference(numeric, sort=False):
+                # Categorical: fill with mode
+                mode_val = result_data[col].mode()
+                if len(mode_val) > 0:
+                    fill_dict[col] = mode_val.iat[0]
+        # One fillna call for all columns instead of one per column
+        if fill_dict:
+            result_data = result_data.fillna(fill_dict)
+        else:
+            result_data = result_data.copy()
 
     else:
-        raise ValueError(f"Unknown missing data strategy: {strategy}")
+        # Forward fill missing values
+        result_data = result_data.assign(
+            **{col: _forward_fill(result_data[col]) for col in result_data.columns}
+        )
 
     return result_data
 
 
+def _forward_fill(series: pd.Series) -> pd.Series:
+    """
+    Forward fill one column.
+
+    NumPy-backed columns take each row's last non-missing position from a
+    running maximum of row positions; extension dtypes use ``Series.ffill``.
+    """
+    if not isinstance(series.dtype, np.dtype):
+        return series.ffill()
+
+    values = series.to_numpy()
+    missing = pd.isna(values)
+    if not missing.any():
+        return series
+
+    positions = np.where(missing, 0, np.arange(len(values)))
+    np.maximum.accumulate(positions, out=positions)
+    return pd.Series(values[positions], index=series.index, name=series.name)
+
+
+def _handle_missing_data_polars(
+    data: pd.DataFrame, strategy: str, fill_values: Optional[Dict[str, Any]]
+) -> pd.DataFrame:
+    """Polars version of handle_missing_data."""
+    if strategy == "pairwise":
+        print(
+            "Pairwise deletion: keeping all data, missing values handled per analysis"
+        )
+        return data.copy()
+
+    frame = _to_polars(data)
+
+    if strategy == "listwise":
+        result = frame.drop_nulls()
+        n_removed = frame.height - result.height
+        if n_removed:
+            print(f"Listwise deletion: removed {n_removed} rows with missing data")
+
+    elif strategy == "impute":
+        if fill_values:
+            fills = [
+                pl.col(col).fill_null(pl.lit(fill_val))
+                for col, fill_val in fill_values.items()
+                if col in data.columns
+            ]
+        else:
+            # Numeric: fill with median; categorical: fill with mode
+            fills = [
+                pl.col(col).fill_null(
+                    pl.col(col).median()
+                    if data[col].dtype in ["int64", "float64"]
+                    else pl.col(col).drop_nulls().mode().sort().first()
+                )
+                for col in data.columns
+            ]
+        result = frame.with_columns(fills)
+
+    else:
+        result = frame.with_columns(pl.exclude(_ROW_INDEX).forward_fill())
+
+    return _from_polars(result, data.index)
+
+
 def derive_variables(data: pd.DataFrame, derivations: Dict[str, str]) -> pd.DataFrame:
     """
     Derive new variables based on existing ones.
@@ -128,19 +249,67 @@ def derive_variables(data: pd.DataFrame, derivations: Dict[str, str]) -> pd.Data
     pd.DataFrame
         Dataset with derived variables
     """
-    derived_data = data.copy()
-
+    # Earlier derivations are resolved ahead of the input columns, so later
+    # expressions can refer to them without writing into a copy of the data
+    new_cols = {}
     for new_var, expression in derivations.items():
         try:
-            derived_data[new_var] = derived_data.eval(expression)
+            new_cols[new_var] = _derive(data, expression, new_cols)
         except Exception as e:
             print(f"Warning: Could not derive {new_var}: {e}")
 
-    return derived_data
+    return data.assign(**new_cols)
+
+
+@lru_cache(maxsize=256)
+def _expression_names(expression: str) -> Optional[FrozenSet[str]]:
+    """Names referenced by an expression, or None if it is not Python syntax."""
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+    return frozenset(
+        node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+    )
+
+
+def _derive(
+    data: pd.DataFrame, expression: str, derived: Dict[str, pd.Series]
+) -> pd.Series:
+    """
+    Evaluate one derivation expression.
+
+    Large inputs whose referenced columns are all plain NumPy numeric or
+    boolean columns go straight to numexpr; anything else, or anything
+    numexpr cannot handle, goes through ``DataFrame.eval``.
+    """
+    names = _expression_names(expression)
+    if HAS_NUMEXPR and names and len(data) >= NUMEXPR_MIN_ROWS:
+        columns = {
+            name: derived[name] if name in derived else data[name]
+            for name in names
+            if name in derived or name in data.columns
+        }
+        if len(columns) == len(names) and all(
+            isinstance(col.dtype, np.dtype) and col.dtype.kind in "biuf"
+            for col in columns.values()
+        ):
+            local_dict = {name: col.to_numpy() for name, col in columns.items()}
+            try:
+                values = numexpr.evaluate(expression, local_dict=local_dict)
+            except (KeyError, NotImplementedError, SyntaxError, TypeError, ValueError):
+                pass
+            else:
+                return pd.Series(values, index=data.index)
+
+    return data.eval(expression, resolvers=(derived,))
 
 
 def clean_data(
-    data: pd.DataFrame, remove_duplicates: bool = True, standardize_columns: bool = True
+    data: pd.DataFrame,
+    remove_duplicates: bool = True,
+    standardize_columns: bool = True,
+    engine: str = "pandas",
 ) -> pd.DataFrame:
     """
     Clean clinical data with standard preprocessing steps.
@@ -153,13 +322,31 @@ def clean_data(
         Whether to remove duplicate rows
     standardize_columns : bool, default True
         Whether to standardize column names
+    engine : str
+        "pandas" or "polars" (requires polars). The polars engine converts
+        the data to Arrow-backed columns, so column dtypes may differ.
 
     Returns
     -------
     pd.DataFrame
         Cleaned dataset
     """
-    cleaned_data = data.copy()
+    _check_engine(engine)
+    if engine == "polars":
+        cleaned_data = _clean_data_polars(data, remove_duplicates)
+    else:
+        cleaned_data = _clean_data_pandas(data, remove_duplicates)
+
+    # Standardize column names
+    if standardize_columns:
+        cleaned_data.columns = cleaned_data.columns.str.upper().str.strip()
+
+    return cleaned_data
+
+
+def _clean_data_pandas(data: pd.DataFrame, remove_duplicates: bool) -> pd.DataFrame:
+    """Remove duplicates and string missing values with pandas."""
+    cleaned_data = data
 
     # Remove duplicates
     if remove_duplicates:
@@ -169,13 +356,33 @@ def clean_data(
         if n_before != n_after:
             print(f"Removed {n_before - n_after} duplicate rows")
 
-    # Standardize column names
-    if standardize_columns:
-        cleaned_data.columns = cleaned_data.columns.str.upper().str.strip()
+    # Convert string representations of missing to actual NaN with one isin
+    # over all object columns; infer_objects keeps the dtype inference that
+    # a per-column replace performs
+    strings = cleaned_data.select_dtypes(include=["object"])
+    strings = strings.mask(strings.isin(_STRING_NA_VALUES)).infer_objects()
+    return cleaned_data.assign(**dict(strings.items()))
 
-    # Convert string representations of missing to actual NaN
-    string_na_values = ["", " ", "NA", "N/A", "NULL", "null", ".", "Missing"]
-    for col in cleaned_data.select_dtypes(include=["object"]).columns:
-        cleaned_data[col] = cleaned_data[col].replace(string_na_values, np.nan)
 
-    return cleaned_data
+def _clean_data_polars(data: pd.DataFrame, remove_duplicates: bool) -> pd.DataFrame:
+    """Polars version of the duplicate and string missing value cleaning."""
+    frame = _to_polars(data)
+
+    if remove_duplicates:
+        n_before = frame.height
+        frame = frame.unique(
+            subset=pl.exclude(_ROW_INDEX), keep="first", maintain_order=True
+        )
+        if n_before != frame.height:
+            print(f"Removed {n_before - frame.height} duplicate rows")
+
+    # Convert string representations of missing to actual nulls
+    strings = pl.col(pl.String)
+    frame = frame.with_columns(
+        pl.when(strings.is_in(_STRING_NA_VALUES))
+        .then(None)
+        .otherwise(strings)
+        .name.keep()
+    )
+
+    return _from_polars(frame, data.index)
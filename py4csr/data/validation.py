@@ -6,11 +6,56 @@ to ensure data quality and compliance with standards.
 """
 
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+from .io import HAS_PYARROW
+
+# Required ADLB variables
+_ADLB_REQUIRED_VARIABLES = [
+    "USUBJID",
+    "PARAMCD",
+    "PARAM",
+    "AVAL",
+    "AVALU",
+    "VISIT",
+    "VISITNUM",
+    "ADT",
+    "ATM",
+    "ATPT",
+]
+
+# ADLB variables with record-level checks
+_ADLB_RECORD_CHECKS = ("USUBJID", "PARAMCD", "AVAL")
+
+# Standard ADLB parameter codes
+_VALID_PARAMCDS = frozenset(
+    ["ALT", "AST", "BILI", "BUN", "CREAT", "GLUC", "HBA1C", "HDL", "LDL", "TRIG"]
+)
+
+# Controlled terminology accepted by the coded-variable checks
+_VALID_SEX_VALUES = frozenset(["M", "F", "Male", "Female", "MALE", "FEMALE"])
+_VALID_FLAG_VALUES = frozenset(["Y", "N", "y", "n"])
+_VALID_SEVERITY_VALUES = frozenset(
+    ["MILD", "MODERATE", "SEVERE", "Mild", "Moderate", "Severe", "1", "2", "3"]
+)
+_VALID_RELATIONSHIP_VALUES = frozenset(
+    [
+        "RELATED",
+        "NOT RELATED",
+        "POSSIBLY RELATED",
+        "PROBABLY RELATED",
+        "Related",
+        "Not Related",
+        "Possibly Related",
+        "Probably Related",
+    ]
+)
+
 
 def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
     """
@@ -28,6 +73,7 @@ def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
     dict
         Validation report with issues and summary
     """
+    columns = frozenset(data.columns)
 
     validation_report = {
         "dataset": "ADSL",
@@ -43,7 +89,7 @@ def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
     recommended_vars = ["TRT01P", "TRT01A", "AGE", "SEX", "RACE", "SAFFL", "EFFFL"]
 
     # Check required variables
-    missing_required = [var for var in required_vars if var not in data.columns]
+    missing_required = [var for var in required_vars if var not in columns]
     if missing_required:
         validation_report["issues"].append(
             f"Missing required variables: {missing_required}"
@@ -51,15 +97,15 @@ def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
         validation_report["passed"] = False
 
     # Check recommended variables
-    missing_recommended = [var for var in recommended_vars if var not in data.columns]
+    missing_recommended = [var for var in recommended_vars if var not in columns]
     if missing_recommended:
         validation_report["warnings"].append(
             f"Missing recommended variables: {missing_recommended}"
         )
 
     # Check for duplicate subjects
-    if "USUBJID" in data.columns:
-        duplicates = data["USUBJID"].duplicated().sum()
+    if "USUBJID" in columns:
+        duplicates = len(data) - data["USUBJID"].nunique(dropna=False)
         if duplicates > 0:
             validation_report["issues"].append(
                 f"Found {duplicates} duplicate subject IDs"
@@ -67,7 +113,7 @@ def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
             validation_report["passed"] = False
 
     # Check treatment variables
-    if "TRT01P" in data.columns:
+    if "TRT01P" in columns:
         trt_missing = data["TRT01P"].isnull().sum()
         if trt_missing > 0:
             validation_report["warnings"].append(
@@ -82,12 +128,12 @@ def validate_adsl(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
             )
 
     # Check age variable
-    if "AGE" in data.columns:
+    if "AGE" in columns:
         age_issues = _validate_age_variable(data["AGE"])
         validation_report["warnings"].extend(age_issues)
 
     # Check sex variable
-    if "SEX" in data.columns:
+    if "SEX" in columns:
         sex_issues = _validate_sex_variable(data["SEX"])
         validation_report["warnings"].extend(sex_issues)
 
@@ -116,11 +162,12 @@ def validate_adae(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
     dict
         Validation report with issues and summary
     """
+    columns = frozenset(data.columns)
 
     validation_report = {
         "dataset": "ADAE",
         "n_records": len(data),
-        "n_subjects": data["USUBJID"].nunique() if "USUBJID" in data.columns else 0,
+        "n_subjects": data["USUBJID"].nunique() if "USUBJID" in columns else 0,
         "n_variables": len(data.columns),
         "issues": [],
         "warnings": [],
@@ -132,7 +179,7 @@ def validate_adae(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
     recommended_vars = ["TRTA", "AESEV", "AEREL", "AEOUT", "AEBODSYS"]
 
     # Check required variables
-    missing_required = [var for var in required_vars if var not in data.columns]
+    missing_required = [var for var in required_vars if var not in columns]
     if missing_required:
         validation_report["issues"].append(
             f"Missing required variables: {missing_required}"
@@ -144,7 +191,7 @@ def validate_adae(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
         var
         for var in recommended_vars
         if var not in recommended_vars
-        if var not in data.columns
+        if var not in columns
     ]
     if missing_recommended:
         validation_report["warnings"].append(
@@ -152,7 +199,7 @@ def validate_adae(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
         )
 
     # Check for missing AE terms
-    if "AEDECOD" in data.columns:
+    if "AEDECOD" in columns:
         missing_terms = data["AEDECOD"].isnull().sum()
         if missing_terms > 0:
             validation_report["issues"].append(
@@ -161,12 +208,12 @@ def validate_adae(data: pd.DataFrame, strict: bool = False) -> Dict[str, Any]:
             validation_report["passed"] = False
 
     # Check severity coding
-    if "AESEV" in data.columns:
+    if "AESEV" in columns:
         sev_issues = _validate_severity_variable(data["AESEV"])
         validation_report["warnings"].extend(sev_issues)
 
     # Check relationship coding
-    if "AEREL" in data.columns:
+    if "AEREL" in columns:
         rel_issues = _validate_relationship_variable(data["AEREL"])
         validation_report["warnings"].extend(rel_issues)
 
@@ -187,79 +234,137 @@ def validate_adlb(data: pd.DataFrame) -> Dict[str, Any]:
     dict
         Validation results with status and details
     """
+    columns = frozenset(data.columns)
+    counts = _count_adlb_records(data, columns)
+    return _adlb_report(columns, len(data.columns), len(data), counts)
+
+
+def validate_adlb_stream(
+    source: Union[str, Path, Iterable[pd.DataFrame]], chunk_rows: int = 200_000
+) -> Dict[str, Any]:
+    """
+    Validate an ADLB dataset chunk by chunk without loading it into memory.
+
+    Parameters
+    ----------
+    source : str, Path or iterable of pd.DataFrame
+        Path to a Parquet file or directory (requires pyarrow), or an
+        iterable of DataFrame chunks, e.g. from ``pd.read_csv(chunksize=...)``
+        or ``pyreadstat.read_file_in_chunks``
+    chunk_rows : int, default 200000
+        Number of rows read per batch from a Parquet source
+
+    Returns
+    -------
+    dict
+        Validation results as returned by :func:`validate_adlb`
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer")
+
+    if isinstance(source, (str, Path)):
+        if not HAS_PYARROW:
+            raise ImportError(
+                "pyarrow is required to stream Parquet files. "
+                "Install it with: pip install py4csr[performance]"
+            )
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(source, format="parquet")
+        column_names = dataset.schema.names
+        checked = [var for var in _ADLB_RECORD_CHECKS if var in column_names]
+        n_records = dataset.count_rows()
+        chunks = (
+            batch.to_pandas()
+            for batch in dataset.to_batches(columns=checked, batch_size=chunk_rows)
+        )
+    else:
+        column_names = None
+        n_records = None
+        chunks = source
+
+    counts = dict.fromkeys(_ADLB_RECORD_CHECKS, 0)
+    n_chunk_records = 0
+    for chunk in chunks:
+        if column_names is None:
+            column_names = list(chunk.columns)
+        n_chunk_records += len(chunk)
+        for var, n in _count_adlb_records(chunk, frozenset(chunk.columns)).items():
+            counts[var] += n
+
+    if column_names is None:
+        column_names = []
+    columns = frozenset(column_names)
+    counts = {var: n for var, n in counts.items() if var in columns}
+    if n_records is None:
+        n_records = n_chunk_records
+
+    return _adlb_report(columns, len(column_names), n_records, counts)
+
+
+def _count_adlb_records(data: pd.DataFrame, columns: FrozenSet) -> Dict[str, int]:
+    """Count the records failing each ADLB record-level check."""
+    counts = {}
+
+    # Check USUBJID format
+    if "USUBJID" in columns:
+        usubjid = data["USUBJID"]
+        counts["USUBJID"] = int((usubjid.isna() | (usubjid == "")).sum())
+
+    # Check PARAMCD values
+    if "PARAMCD" in columns:
+        counts["PARAMCD"] = int(
+            (~data["PARAMCD"].isin(_VALID_PARAMCDS) & data["PARAMCD"].notna()).sum()
+        )
+
+    # Check AVAL (analysis value) is numeric; numeric dtypes need no check
+    if "AVAL" in columns:
+        aval = data["AVAL"]
+        if pd.api.types.is_numeric_dtype(aval):
+            counts["AVAL"] = 0
+        else:
+            coerced = pd.to_numeric(aval, errors="coerce")
+            counts["AVAL"] = int((aval.notna() & coerced.isna()).sum())
+
+    return counts
+
+
+def _adlb_report(
+    columns: FrozenSet, n_variables: int, n_records: int, counts: Dict[str, int]
+) -> Dict[str, Any]:
+    """Build the ADLB validation report from the record-level counts."""
     validation_result = {
         "dataset": "ADLB",
         "passed": True,
         "issues": [],
         "warnings": [],
-        "n_records": len(data),
-        "n_variables": len(data.columns),
+        "n_records": n_records,
+        "n_variables": n_variables,
     }
 
-    # Required ADLB variables
-    required_vars = [
-        "USUBJID",
-        "PARAMCD",
-        "PARAM",
-        "AVAL",
-        "AVALU",
-        "VISIT",
-        "VISITNUM",
-        "ADT",
-        "ATM",
-        "ATPT",
-    ]
-
     # Check required variables
-    missing_vars = [var for var in required_vars if var not in data.columns]
+    missing_vars = [var for var in _ADLB_REQUIRED_VARIABLES if var not in columns]
     if missing_vars:
         validation_result["issues"].append(
             f"Missing required variables: {missing_vars}"
         )
         validation_result["passed"] = False
 
-    if not data.empty:
-        # Check USUBJID format
-        if "USUBJID" in data.columns:
-            invalid_subjects = data[data["USUBJID"].isna() | (data["USUBJID"] == "")]
-            if len(invalid_subjects) > 0:
-                validation_result["issues"].append(
-                    f"Found {len(invalid_subjects)} records with invalid USUBJID"
-                )
-
-        # Check PARAMCD values
-        if "PARAMCD" in data.columns:
-            valid_paramcds = [
-                "ALT",
-                "AST",
-                "BILI",
-                "BUN",
-                "CREAT",
-                "GLUC",
-                "HBA1C",
-                "HDL",
-                "LDL",
-                "TRIG",
-            ]
-            invalid_params = data[
-                ~data["PARAMCD"].isin(valid_paramcds) & data["PARAMCD"].notna()
-            ]
-            if len(invalid_params) > 0:
-                validation_result["warnings"].append(
-                    f"Found {len(invalid_params)} records with non-standard PARAMCD values"
-                )
-
-        # Check AVAL (analysis value) is numeric
-        if "AVAL" in data.columns:
-            non_numeric_aval = data[
-                data["AVAL"].notna()
-                & ~pd.to_numeric(data["AVAL"], errors="coerce").notna()
-            ]
-            if len(non_numeric_aval) > 0:
-                validation_result["issues"].append(
-                    f"Found {len(non_numeric_aval)} records with non-numeric AVAL"
-                )
-                validation_result["passed"] = False
+    if counts.get("USUBJID"):
+        validation_result["issues"].append(
+            f"Found {counts['USUBJID']} records with invalid USUBJID"
+        )
+
+    if counts.get("PARAMCD"):
+        validation_result["warnings"].append(
+            f"Found {counts['PARAMCD']} records with non-standard PARAMCD values"
+        )
+
+    if counts.get("AVAL"):
+        validation_result["issues"].append(
+            f"Found {counts['AVAL']} records with non-numeric AVAL"
+        )
+        validation_result["passed"] = False
 
     return validation_result
 
@@ -283,15 +388,25 @@ def _validate_age_variable(age_series: pd.Series) -> List[str]:
     return issues
 
 
+def _invalid_values(series: pd.Series, valid_values: frozenset) -> Any:
+    """
+    Distinct non-missing values of a series that are not in ``valid_values``.
+
+    Only the distinct values are checked against the valid set, so each
+    column is scanned once however many rows repeat the same code.
+    """
+    uniques = series.unique()
+    invalid = pd.notna(uniques) & ~pd.Index(uniques).isin(list(valid_values))
+    return uniques[invalid]
+
+
 def _validate_sex_variable(sex_series: pd.Series) -> List[str]:
     """Validate sex variable."""
     issues = []
 
-    valid_sex_values = {"M", "F", "Male", "Female", "MALE", "FEMALE"}
-    invalid_sex = sex_series[~sex_series.isin(valid_sex_values) & sex_series.notna()]
-
+    invalid_sex = _invalid_values(sex_series, _VALID_SEX_VALUES)
     if len(invalid_sex) > 0:
-        issues.append(f"Invalid sex values found: {invalid_sex.unique()}")
+        issues.append(f"Invalid sex values found: {invalid_sex}")
 
     missing_sex = sex_series.isnull().sum()
     if missing_sex > 0:
@@ -304,13 +419,9 @@ def _validate_flag_variable(flag_series: pd.Series, var_name: str) -> List[str]:
     """Validate flag variables (should be Y/N)."""
     issues = []
 
-    valid_flag_values = {"Y", "N", "y", "n"}
-    invalid_flags = flag_series[
-        ~flag_series.isin(valid_flag_values) & flag_series.notna()
-    ]
-
+    invalid_flags = _invalid_values(flag_series, _VALID_FLAG_VALUES)
     if len(invalid_flags) > 0:
-        issues.append(f"Invalid {var_name} values found: {invalid_flags.unique()}")
+        issues.append(f"Invalid {var_name} values found: {invalid_flags}")
 
     return issues
 
@@ -319,21 +430,9 @@ def _validate_severity_variable(sev_series: pd.Series) -> List[str]:
     """Validate AE severity variable."""
     issues = []
 
-    valid_severity = {
-        "MILD",
-        "MODERATE",
-        "SEVERE",
-        "Mild",
-        "Moderate",
-        "Severe",
-        "1",
-        "2",
-        "3",
-    }
-    invalid_sev = sev_series[~sev_series.isin(valid_severity) & sev_series.notna()]
-
+    invalid_sev = _invalid_values(sev_series, _VALID_SEVERITY_VALUES)
     if len(invalid_sev) > 0:
-        issues.append(f"Invalid severity values found: {invalid_sev.unique()}")
+        issues.append(f"Invalid severity values found: {invalid_sev}")
 
     return issues
 
@@ -342,20 +441,9 @@ def _validate_relationship_variable(rel_series: pd.Series) -> List[str]:
     """Validate AE relationship variable."""
     issues = []
 
-    valid_relationship = {
-        "RELATED",
-        "NOT RELATED",
-        "POSSIBLY RELATED",
-        "PROBABLY RELATED",
-        "Related",
-        "Not Related",
-        "Possibly Related",
-        "Probably Related",
-    }
-    invalid_rel = rel_series[~rel_series.isin(valid_relationship) & rel_series.notna()]
-
+    invalid_rel = _invalid_values(rel_series, _VALID_RELATIONSHIP_VALUES)
     if len(invalid_rel) > 0:
-        issues.append(f"Invalid relationship values found: {invalid_rel.unique()}")
+        issues.append(f"Invalid relationship values found: {invalid_rel}")
 
     return issues
 
@@ -375,7 +463,9 @@ def _validate_analysis_values(aval_series: pd.Series) -> List[str]:
     return issues
 
 
-def run_full_validation(datasets: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+def run_full_validation(
+    datasets: Dict[str, pd.DataFrame], max_workers: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Run validation on multiple datasets.
 
@@ -383,6 +473,9 @@ def run_full_validation(datasets: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
     ----------
     datasets : dict
         Dictionary with dataset names as keys and DataFrames as values
+    max_workers : int, optional
+        Number of threads used to validate datasets concurrently
+        (default: one per dataset, at most 8)
 
     Returns
     -------
@@ -397,27 +490,37 @@ def run_full_validation(datasets: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         "dataset_reports": {},
     }
 
+    if not datasets:
+        return full_report
+
+    # Validators only read the data, so threads share the frames without
+    # copying or pickling them
+    workers = max_workers or min(8, len(datasets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        reports = executor.map(_validate_dataset, datasets.keys(), datasets.values())
+        for dataset_name, report in zip(datasets, reports):
+            full_report["dataset_reports"][dataset_name] = report
+
+            if not report["passed"]:
+                full_report["overall_passed"] = False
+
+    return full_report
+
+
+def _validate_dataset(dataset_name: str, dataset: pd.DataFrame) -> Dict[str, Any]:
+    """Validate one dataset with the validator for its type."""
     validation_functions = {
         "adsl": validate_adsl,
         "adae": validate_adae,
         "adlb": validate_adlb,
     }
 
-    for dataset_name, dataset in datasets.items():
-        dataset_lower = dataset_name.lower()
+    dataset_lower = dataset_name.lower()
+    if dataset_lower in validation_functions:
+        return validation_functions[dataset_lower](dataset)
 
-        if dataset_lower in validation_functions:
-            report = validation_functions[dataset_lower](dataset)
-        else:
-            # Generic validation for unknown datasets
-            report = _generic_validation(dataset, dataset_name)
-
-        full_report["dataset_reports"][dataset_name] = report
-
-        if not report["passed"]:
-            full_report["overall_passed"] = False
-
-    return full_report
+    # Generic validation for unknown datasets
+    return _generic_validation(dataset, dataset_name)
 
 
 def _generic_validation(data: pd.DataFrame, dataset_name: str) -> Dict[str, Any]:
@@ -31,16 +31,41 @@ Example Usage:
     ...     .finalize())
 """
 
-from .config import (
-    FormatDefinition,
-    FunctionalConfig,
-    StatisticDefinition,
-    TableTemplate,
-)
-from .output_generators import HTMLGenerator, PDFGenerator, RTFGenerator
-from .session import ReportSession
-from .statistical_templates import StatisticalTemplates
-from .table_builder import TableBuilder
+import importlib
+from typing import Any, List
+
+# Public names and the submodules defining them; submodules are imported on
+# first attribute access (PEP 562) so importing py4csr.functional stays cheap
+_LAZY_IMPORTS = {
+    # Main classes
+    "ReportSession": ".session",
+    "FunctionalConfig": ".config",
+    "TableBuilder": ".table_builder",
+    "StatisticalTemplates": ".statistical_templates",
+    # Configuration
+    "StatisticDefinition": ".config",
+    "FormatDefinition": ".config",
+    "TableTemplate": ".config",
+    # Output generators
+    "RTFGenerator": ".output_generators",
+    "HTMLGenerator": ".output_generators",
+    "PDFGenerator": ".output_generators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Main classes
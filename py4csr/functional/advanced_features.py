@@ -5,19 +5,145 @@ This module provides advanced functionality equivalent to SAS RRG advanced featu
 like grouping variables, conditional formatting, custom code injection, etc.
 """
 
+import ast
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from .config import FunctionalConfig
 
+# Slotted dataclasses need Python 3.10+; older versions use regular ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Context names bound for every row, with their defaults for missing columns
+_CONDITION_DEFAULTS = {
+    "value": 0,
+    "formatted_value": "",
+    "statistic": "",
+    "parameter": "",
+    "treatment": "",
+}
+
+# Column dtype kinds whose element-wise NumPy semantics match scalar Python
+_VECTORIZABLE_KINDS = frozenset("biufO")
+
+
+class _VectorizedCondition(ast.NodeTransformer):
+    """
+    Rewrite a condition from row scalars to whole-column NumPy arrays.
+
+    Only comparisons of names and constants combined with ``and``, ``or``,
+    ``not``, ``+``, ``-`` and ``*`` are accepted; these behave the same on
+    arrays as row by row once ``and``/``or``/``not`` become ``&``/``|``/``~``
+    and chained comparisons are split. Anything else raises ``ValueError``.
+
+    ``leading_names`` holds the names of the first comparison, which every row
+    evaluates before any ``and``/``or`` can short-circuit.
+    """
+
+    _COMPARE_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+    _ARITHMETIC_OPS = (ast.Add, ast.Sub, ast.Mult)
+
+    def __init__(self):
+        self.leading_names: Optional[frozenset] = None
+
+    def visit_Expression(self, node: ast.Expression) -> ast.Expression:
+        node.body = self._visit_predicate(node.body)
+        return node
+
+    def _visit_predicate(self, node: ast.AST) -> ast.AST:
+        if isinstance(node, ast.BoolOp):
+            op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+            values = [self._visit_predicate(value) for value in node.values]
+            result = values[0]
+            for value in values[1:]:
+                result = ast.BinOp(left=result, op=op, right=value)
+            return result
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._visit_predicate(node.operand)
+            return ast.UnaryOp(op=ast.Invert(), operand=operand)
+
+        if isinstance(node, ast.Compare):
+            operands = [
+                self._visit_operand(operand)
+                for operand in [node.left, *node.comparators]
+            ]
+            if not any(_has_name(operand) for operand in operands):
+                raise ValueError("Comparison does not reference any column")
+            if self.leading_names is None:
+                self.leading_names = frozenset(
+                    child.id
+                    for operand in operands[:2]
+                    for child in ast.walk(operand)
+                    if isinstance(child, ast.Name)
+                )
+            comparisons = []
+            for op, left, right in zip(node.ops, operands, operands[1:]):
+                if not isinstance(op, self._COMPARE_OPS):
+                    raise ValueError(f"Unsupported comparison: {type(op).__name__}")
+                comparisons.append(
+                    ast.Compare(left=left, ops=[op], comparators=[right])
+                )
+            result = comparisons[0]
+            for comparison in comparisons[1:]:
+                result = ast.BinOp(left=result, op=ast.BitAnd(), right=comparison)
+            return result
+
+        raise ValueError(f"Unsupported condition: {type(node).__name__}")
+
+    def _visit_operand(self, node: ast.AST) -> ast.AST:
+        if isinstance(node, (ast.Name, ast.Constant)):
+            return node
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            node.operand = self._visit_operand(node.operand)
+            return node
+        if isinstance(node, ast.BinOp) and isinstance(node.op, self._ARITHMETIC_OPS):
+            node.left = self._visit_operand(node.left)
+            node.right = self._visit_operand(node.right)
+            return node
+        raise ValueError(f"Unsupported operand: {type(node).__name__}")
+
+
+def _has_name(node: ast.AST) -> bool:
+    """Whether an expression references any name."""
+    return any(isinstance(child, ast.Name) for child in ast.walk(node))
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> Optional[Any]:
+    """Compile a condition for row-wise evaluation, or None if it is invalid."""
+    try:
+        return compile(condition, "<condition>", "eval")
+    except SyntaxError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_vectorized_condition(condition: str) -> Optional[Tuple[Any, frozenset]]:
+    """
+    Compile a condition for whole-column evaluation.
+
+    Returns the code object and the names every row evaluates first, or None
+    if the condition is not supported.
+    """
+    transformer = _VectorizedCondition()
+    try:
+        tree = transformer.visit(ast.parse(condition, mode="eval"))
+    except (SyntaxError, ValueError):
+        return None
+    code = compile(ast.fix_missing_locations(tree), "<condition>", "eval")
+    return code, transformer.leading_names
+
+
+@dataclass(**_SLOTS)
 class GroupingSpecification:
     """
     Grouping variable specification (equivalent to SAS RRG %rrg_addgroup).
@@ -37,7 +163,7 @@ class GroupingSpecification:
     custom_order: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConditionalFormat:
     """
     Conditional formatting specification (equivalent to SAS RRG %rrg_addcond).
@@ -53,7 +179,7 @@ class ConditionalFormat:
     description: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CustomLabel:
     """
     Custom label specification (equivalent to SAS RRG %rrg_addlabel).
@@ -161,72 +287,94 @@ class AdvancedGroupingEngine:
         pd.DataFrame
             Grouped and formatted statistics
         """
-        if not grouping_vars:
+        # Only variables with a specification and a data column are grouped
+        active_vars = [
+            group_var
+            for group_var in grouping_vars or []
+            if group_var in self.grouping_specs and group_var in data.columns
+        ]
+        if not active_vars:
             return statistics_df
 
         grouped_results = []
 
         # Process each grouping variable
-        for group_var in grouping_vars:
-            if group_var not in self.grouping_specs:
-                continue
-
+        for group_var in active_vars:
             spec = self.grouping_specs[group_var]
 
             # Get unique group values
-            if group_var in data.columns:
-                group_values = self._get_ordered_group_values(data[group_var], spec)
-
-                for group_value in group_values:
-                    # Filter data for this group
-                    group_data = data[data[group_var] == group_value]
-
-                    if len(group_data) == 0:
-                        continue
-
-                    # Add group header
-                    group_header = self._create_group_header(group_value, spec)
-                    grouped_results.append(group_header)
-
-                    # Add statistics for this group
-                    group_stats = statistics_df.copy()
-                    group_stats["GROUP_VALUE"] = group_value
-                    group_stats["GROUP_VAR"] = group_var
-
-                    if spec.indent_subgroups:
-                        group_stats["INDENT"] = group_stats.get("INDENT", 0) + 1
-
-                    grouped_results.append(group_stats)
-
-                    # Add page break if specified
-                    if spec.page_break:
-                        page_break_row = pd.DataFrame(
-                            [
-                                {
-                                    "PARAMETER": "__PAGE_BREAK__",
-                                    "STATISTIC": "",
-                                    "FORMATTED_VALUE": "",
-                                }
-                            ]
-                        )
-                        grouped_results.append(page_break_row)
-
-                # Add total if specified
-                if spec.show_total:
-                    total_header = self._create_group_header(
-                        spec.total_text, spec, is_total=True
-                    )
-                    grouped_results.append(total_header)
-
-                    total_stats = statistics_df.copy()
-                    total_stats["GROUP_VALUE"] = "Total"
-                    total_stats["GROUP_VAR"] = group_var
-                    grouped_results.append(total_stats)
-
-        if grouped_results:
-            return pd.concat(grouped_results, ignore_index=True)
-        else:
+            group_values = self._get_ordered_group_values(data[group_var], spec)
+
+            # Values come from the column itself, so only missing ones
+            # have no matching rows
+            group_values = [value for value in group_values if not pd.isna(value)]
+
+            if group_values:
+                grouped_results.append(
+                    self._grouped_statistics(statistics_df, group_values, spec)
+                )
+
+            # Add total if specified
+            if spec.show_total:
+                total_header = self._create_group_header(
+                    spec.total_text, spec, is_total=True
+                )
+                grouped_results.append(total_header)
+
+                total_stats = statistics_df.assign(
+                    GROUP_VALUE="Total", GROUP_VAR=group_var
+                )
+                grouped_results.append(total_stats)
+
+        if not grouped_results:
             return statistics_df
+        if len(grouped_results) == 1:
+            return grouped_results[0].reset_index(drop=True)
+        return pd.concat(grouped_results, ignore_index=True)
+
+    def _grouped_statistics(
+        self,
+        statistics_df: pd.DataFrame,
+        group_values: List,
+        spec: GroupingSpecification,
+    ) -> pd.DataFrame:
+        """Header, statistics and optional page break rows of every group."""
+        n_groups = len(group_values)
+        n_stats = len(statistics_df)
+
+        headers = pd.DataFrame.from_records(
+            [self._group_header_record(value, spec) for value in group_values]
+        )
+
+        # Tile the statistics once for all groups instead of copying per group
+        group_stats = statistics_df.assign(GROUP_VALUE=None, GROUP_VAR=spec.name)
+        if spec.indent_subgroups:
+            group_stats["INDENT"] = group_stats.get("INDENT", 0) + 1
+        group_stats = group_stats.iloc[np.tile(np.arange(n_stats), n_groups)]
+        group_stats["GROUP_VALUE"] = np.repeat(
+            pd.Series(group_values).to_numpy(), n_stats
+        )
+
+        pieces = [headers, group_stats]
+        layout = [
+            np.arange(n_groups)[:, None],
+            n_groups + np.arange(n_groups * n_stats).reshape(n_groups, n_stats),
+        ]
+        if spec.page_break:
+            pieces.append(
+                pd.DataFrame(
+                    {
+                        "PARAMETER": ["__PAGE_BREAK__"] * n_groups,
+                        "STATISTIC": "",
+                        "FORMATTED_VALUE": "",
+                    }
+                )
+            )
+            layout.append(n_groups * (n_stats + 1) + np.arange(n_groups)[:, None])
+
+        # Concatenate once, then interleave the rows group by group
+        combined = pd.concat(pieces, ignore_index=True)
+        return combined.iloc[np.hstack(layout).ravel()]
 
     def _get_ordered_group_values(
         self, series: pd.Series, spec: GroupingSpecification
@@ -236,22 +384,24 @@ class AdvancedGroupingEngine:
 
         if spec.custom_order:
             # Use custom order, then add any remaining values
-            ordered_values = []
-            for value in spec.custom_order:
-                if value in unique_values:
-                    ordered_values.append(value)
+            present = set(unique_values)
+            ordered_values = [value for value in spec.custom_order if value in present]
 
             # Add remaining values
-            for value in unique_values:
-                if value not in ordered_values:
-                    ordered_values.append(value)
+            listed = set(ordered_values)
+            ordered_values.extend(
+                value for value in unique_values if value not in listed
+            )
 
             return ordered_values
 
-        elif spec.sort_order == "ascending":
-            return sorted(unique_values)
-        elif spec.sort_order == "descending":
-            return sorted(unique_values, reverse=True)
+        elif spec.sort_order in ("ascending", "descending"):
+            # Sort the plain values, then take from the unique array so
+            # extension types (e.g. Timestamps) come back unchanged
+            order = np.argsort(np.asarray(unique_values), kind="stable")
+            if spec.sort_order == "descending":
+                order = order[::-1]
+            return list(unique_values[order])
         else:
             return list(unique_values)
 
@@ -259,22 +409,24 @@ class AdvancedGroupingEngine:
         self, group_value: str, spec: GroupingSpecification, is_total: bool = False
     ) -> pd.DataFrame:
         """Create group header row."""
+        return pd.DataFrame([self._group_header_record(group_value, spec, is_total)])
+
+    def _group_header_record(
+        self, group_value: Any, spec: GroupingSpecification, is_total: bool = False
+    ) -> Dict[str, Any]:
+        """Column values of a group header row."""
         label = spec.label if spec.label else spec.name
         display_value = f"{label}: {group_value}" if not is_total else group_value
 
-        return pd.DataFrame(
-            [
-                {
-                    "PARAMETER": display_value,
-                    "STATISTIC": "__GROUP_HEADER__",
-                    "FORMATTED_VALUE": "",
-                    "GROUP_VAR": spec.name,
-                    "GROUP_VALUE": group_value,
-                    "IS_TOTAL": is_total,
-                    "INDENT": 0,
-                }
-            ]
-        )
+        return {
+            "PARAMETER": display_value,
+            "STATISTIC": "__GROUP_HEADER__",
+            "FORMATTED_VALUE": "",
+            "GROUP_VAR": spec.name,
+            "GROUP_VALUE": group_value,
+            "IS_TOTAL": is_total,
+            "INDENT": 0,
+        }
 
 
 class ConditionalFormattingEngine:
@@ -308,65 +460,150 @@ class ConditionalFormattingEngine:
             Data with formatting applied
         """
         formatted_data = data.copy()
+        n_rows = len(formatted_data)
+
+        # Formatting columns, filled rule by rule and added at the end
+        cell_format = np.full(n_rows, "", dtype=object)
+        cell_style = np.full(n_rows, "", dtype=object)
+        cell_color = np.full(n_rows, "", dtype=object)
+        format_columns = {
+            "CELL_FORMAT": cell_format,
+            "CELL_STYLE": cell_style,
+            "CELL_COLOR": cell_color,
+        }
+        for col, values in format_columns.items():
+            formatted_data[col] = values
 
-        # Add formatting columns
-        formatted_data["CELL_FORMAT"] = ""
-        formatted_data["CELL_STYLE"] = ""
-        formatted_data["CELL_COLOR"] = ""
+        # Conditions see whole columns at once; the formatting arrays are
+        # bound directly so later rules see the formats set by earlier ones
+        context = self._column_context(formatted_data, format_columns)
 
         for rule_name, rule in self.format_rules.items():
-            # Apply rule to each row
-            for idx, row in formatted_data.iterrows():
-                if self._evaluate_condition(rule.condition, row):
-                    # Apply formatting based on rule type
-                    if rule.format_type == "highlight":
-                        formatted_data.at[idx, "CELL_COLOR"] = rule.format_value
-                    elif rule.format_type == "bold":
-                        formatted_data.at[idx, "CELL_STYLE"] += "bold;"
-                    elif rule.format_type == "italic":
-                        formatted_data.at[idx, "CELL_STYLE"] += "italic;"
-                    elif rule.format_type == "color":
-                        formatted_data.at[idx, "CELL_COLOR"] = rule.format_value
-                    elif rule.format_type == "custom":
-                        formatted_data.at[idx, "CELL_FORMAT"] = rule.format_value
+            mask = self._evaluate_mask(rule.condition, context)
+            if mask is None:
+                # Evaluate the condition row by row instead
+                mask = self._evaluate_rows(
+                    rule.condition, formatted_data, format_columns
+                )
+
+            # Apply formatting based on rule type
+            if rule.format_type in ("highlight", "color"):
+                cell_color[mask] = rule.format_value
+            elif rule.format_type in ("bold", "italic"):
+                cell_style[mask] = cell_style[mask] + f"{rule.format_type};"
+            elif rule.format_type == "custom":
+                cell_format[mask] = rule.format_value
+
+        for col, values in format_columns.items():
+            formatted_data[col] = values
 
         return formatted_data
 
-    def _evaluate_condition(self, condition: str, row: pd.Series) -> bool:
+    def _column_context(
+        self, data: pd.DataFrame, format_columns: Dict[str, np.ndarray]
+    ) -> Dict[str, Optional[np.ndarray]]:
         """
-        Evaluate conditional formatting condition.
+        Build the whole-column equivalent of the row context.
 
-        Parameters
-        ----------
-        condition : str
-            Python expression to evaluate
-        row : pd.Series
-            Data row
+        Columns whose element-wise semantics differ from the row values (e.g.
+        datetimes or nullable extension types) are bound to None.
+        """
+        context = {
+            name: np.full(len(data), default, dtype=object)
+            for name, default in _CONDITION_DEFAULTS.items()
+        }
+        context.update(np=np, pd=pd)
+        for col in data.columns:
+            if isinstance(col, str) and col.isidentifier():
+                if col in format_columns:
+                    context[col.lower()] = format_columns[col]
+                elif isinstance(data[col].dtype, np.dtype) and (
+                    data[col].dtype.kind in _VECTORIZABLE_KINDS
+                ):
+                    context[col.lower()] = data[col].to_numpy()
+                else:
+                    context[col.lower()] = None
+        return context
 
-        Returns
-        -------
-        bool
-            Whether condition is met
+    def _evaluate_mask(
+        self, condition: str, context: Dict[str, Optional[np.ndarray]]
+    ) -> Optional[np.ndarray]:
+        """
+        Evaluate a condition for all rows at once.
+
+        Returns None when the condition cannot be evaluated on whole columns
+        and has to be evaluated row by row.
         """
+        compiled = _compile_vectorized_condition(condition)
+        if compiled is None:
+            return None
+        code, leading_names = compiled
+
+        # An unknown leading name fails every row; other unknown names may be
+        # skipped row by row through and/or short-circuits
+        if not leading_names <= context.keys():
+            return np.zeros(len(context["value"]), dtype=bool)
+        if any(context.get(name) is None for name in code.co_names):
+            return None
+
         try:
-            # Create safe evaluation context
-            context = {
-                "value": row.get("VALUE", 0),
-                "formatted_value": row.get("FORMATTED_VALUE", ""),
-                "statistic": row.get("STATISTIC", ""),
-                "parameter": row.get("PARAMETER", ""),
-                "treatment": row.get("TREATMENT", ""),
-                "np": np,
-                "pd": pd,
-            }
-
-            # Add all row values to context
-            for col, val in row.items():
-                if isinstance(col, str) and col.isidentifier():
-                    context[col.lower()] = val
-
-            return bool(eval(condition, {"__builtins__": {}}, context))
+            mask = eval(code, {"__builtins__": {}}, context)
+        except Exception:
+            return None
+
+        if not isinstance(mask, np.ndarray) or mask.dtype != bool:
+            return None
+        return mask
+
+    def _evaluate_rows(
+        self,
+        condition: str,
+        data: pd.DataFrame,
+        format_columns: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Evaluate a condition row by row.
 
+        Each row's context holds the ``_CONDITION_DEFAULTS`` names, ``np`` and
+        ``pd``, overridden by the lower-cased identifier columns the condition
+        names; conditions that fail to compile or raise are not met.
+        """
+        n_rows = len(data)
+        code = _compile_condition(condition)
+        if code is None:
+            return np.zeros(n_rows, dtype=bool)
+
+        # Context names of the identifier columns; later columns win
+        names = {}
+        for col in data.columns:
+            if isinstance(col, str) and col.isidentifier():
+                names[col.lower()] = col
+
+        referenced = [name for name in dict.fromkeys(code.co_names) if name in names]
+        columns = [
+            format_columns[names[name]]
+            if names[name] in format_columns
+            else data[names[name]].tolist()
+            for name in referenced
+        ]
+
+        base_context = dict(_CONDITION_DEFAULTS, np=np, pd=pd)
+        if not referenced:
+            # The context is the same for every row
+            return np.full(n_rows, self._eval_context(code, base_context))
+
+        mask = np.zeros(n_rows, dtype=bool)
+        for i, row_values in enumerate(zip(*columns)):
+            context = dict(base_context)
+            context.update(zip(referenced, row_values))
+            mask[i] = self._eval_context(code, context)
+        return mask
+
+    @staticmethod
+    def _eval_context(code: Any, context: Dict[str, Any]) -> bool:
+        """Evaluate compiled condition code; errors count as not met."""
+        try:
+            return bool(eval(code, {"__builtins__": {}}, context))
         except Exception:
             return False
 
@@ -401,61 +638,102 @@ class CustomLabelEngine:
         pd.DataFrame
             Data with custom labels applied
         """
-        result_data = []
-
-        for idx, row in data.iterrows():
-            # Check if any custom labels apply to this row
-            applicable_labels = self._get_applicable_labels(row)
+        # Work out the output layout first: the source row of every output row
+        # and the label it shows (None for the original row itself)
+        if "PARAMETER" in data.columns:
+            parameters = [str(value) for value in data["PARAMETER"].tolist()]
+        else:
+            parameters = [""] * len(data)
+
+        labels_by_parameter = self._labels_by_parameter(parameters)
+        if not labels_by_parameter:
+            return data.reset_index(drop=True)
+
+        positions = []
+        row_labels = []
+        for position, parameter in enumerate(parameters):
+            applicable_labels = labels_by_parameter.get(parameter)
+            if not applicable_labels:
+                positions.append(position)
+                row_labels.append(None)
+                continue
 
             # Add "before" labels
             for label in applicable_labels:
                 if label.position == "before":
-                    label_row = self._create_label_row(label, row)
-                    result_data.append(label_row)
+                    positions.append(position)
+                    row_labels.append(label)
 
-            # Add original row (or replace if specified)
+            # Add original row (or replace if specified); the last replace
+            # label wins
             replace_labels = [l for l in applicable_labels if l.position == "replace"]
-            if replace_labels:
-                # Use the last replace label
-                label_row = self._create_label_row(replace_labels[-1], row)
-                result_data.append(label_row)
-            else:
-                result_data.append(row.to_dict())
+            positions.append(position)
+            row_labels.append(replace_labels[-1] if replace_labels else None)
 
             # Add "after" labels
             for label in applicable_labels:
                 if label.position == "after":
-                    label_row = self._create_label_row(label, row)
-                    result_data.append(label_row)
-
-        return pd.DataFrame(result_data)
+                    positions.append(position)
+                    row_labels.append(label)
+
+        # Build the result column-wise from the source rows, then overwrite
+        # the label columns of the label rows
+        result_data = data.iloc[positions].reset_index(drop=True)
+        label_rows = [i for i, label in enumerate(row_labels) if label is not None]
+        if not label_rows:
+            return result_data
+
+        label_values = [self._label_values(row_labels[i]) for i in label_rows]
+        label_columns = {}
+        for col in label_values[0]:
+            if col in result_data.columns:
+                values = result_data[col].to_numpy(dtype=object, copy=True)
+            else:
+                values = np.full(len(result_data), np.nan, dtype=object)
+            values[label_rows] = [row_values[col] for row_values in label_values]
+            label_columns[col] = pd.Series(values).infer_objects()
+
+        return result_data.assign(**label_columns)
+
+    def _labels_by_parameter(
+        self, parameters: List[str]
+    ) -> Dict[str, List[CustomLabel]]:
+        """Applicable labels of every distinct PARAMETER value with any label."""
+        if not self.custom_labels:
+            return {}
+
+        # One regex scan per distinct value finds those containing any label
+        # name; only these need the per-label substring checks
+        pattern = re.compile("|".join(re.escape(name) for name in self.custom_labels))
+        return {
+            parameter: self._get_applicable_labels(parameter)
+            for parameter in dict.fromkeys(parameters)
+            if pattern.search(parameter)
+        }
 
-    def _get_applicable_labels(self, row: pd.Series) -> List[CustomLabel]:
-        """Get custom labels that apply to this row."""
+    def _get_applicable_labels(self, parameter: str) -> List[CustomLabel]:
+        """Get custom labels that apply to a row with this PARAMETER value."""
         applicable = []
 
         for label in self.custom_labels.values():
             # Simple matching - could be enhanced with more sophisticated logic
-            if label.name in str(row.get("PARAMETER", "")):
+            if label.name in parameter:
                 applicable.append(label)
 
         return applicable
 
-    def _create_label_row(
-        self, label: CustomLabel, original_row: pd.Series
-    ) -> Dict[str, Any]:
-        """Create a row for a custom label."""
-        label_row = original_row.to_dict()
-        label_row["PARAMETER"] = label.label
-        label_row["STATISTIC"] = "__CUSTOM_LABEL__"
-        label_row["FORMATTED_VALUE"] = ""
-        label_row["INDENT"] = label.indent
-        label_row["SKIP_LINE"] = label.skip_line
-        label_row["BOLD"] = label.bold
-        label_row["ITALIC"] = label.italic
-        label_row["CUSTOM_STYLE"] = label.custom_style
-
-        return label_row
+    def _label_values(self, label: CustomLabel) -> Dict[str, Any]:
+        """Values a label row shows instead of those of its source row."""
+        return {
+            "PARAMETER": label.label,
+            "STATISTIC": "__CUSTOM_LABEL__",
+            "FORMATTED_VALUE": "",
+            "INDENT": label.indent,
+            "SKIP_LINE": label.skip_line,
+            "BOLD": label.bold,
+            "ITALIC": label.italic,
+            "CUSTOM_STYLE": label.custom_style,
+        }
 
 
 class CodeHookManager:
@@ -517,10 +795,7 @@ class CodeHookManager:
         dict
             Updated context
         """
-        if hook_point not in self.hooks:
-            return context
-
-        for hook in self.hooks[hook_point]:
+        for hook in self.hooks.get(hook_point, ()):
             try:
                 context = hook.execute(context)
             except Exception as e:
@@ -228,7 +228,7 @@ class BaseTableGenerator(ABC):
         if pd.isna(value):
             return ""
 
-        stat_config = config.get_statistic(stat_name)
+        stat_config = config.statistics.get(stat_name)
         if stat_config:
             return stat_config.format_value(value)
 
@@ -559,6 +559,26 @@ class TestHelperMethods:
         # Check that table has columns
         assert len(result.columns) > 0
 
+    def test_format_for_display_fills_missing_cells(self):
+        """Test display formatting fills treatments without results."""
+        session = ClinicalSession(uri="test")
+        stats_data = pd.DataFrame({
+            "treatment": ["1", "2", "1"],
+            "variable_id": [1, 1, 1],
+            "variable_label": ["Sex, n (%)"] * 3,
+            "variable_type": ["categorical"] * 3,
+            "indent": [0, 0, 0],
+            "statistic": ["npct"] * 3,
+            "category": ["F", "F", "M"],
+            "formatted_value": ["3 (60.0%)", "4 (80.0%)", "2 (40.0%)"],
+        })
+
+        result = session._format_for_display(stats_data)
+
+        assert list(result["Parameter"]) == ["Sex, n (%)", "  F", "  M"]
+        assert list(result["1"]) == ["", "3 (60.0%)", "2 (40.0%)"]
+        assert list(result["2"]) == ["", "4 (80.0%)", "0 (0.0%)"]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
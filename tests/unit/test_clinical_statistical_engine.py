@@ -109,6 +109,33 @@ class TestCalculateContinuousStats:
         assert isinstance(result, pd.DataFrame)
         assert len(result) > 0
 
+    def test_continuous_stats_wide_format(self, engine, sample_continuous_data):
+        """Test wide results match the long formatted values."""
+        long = engine.calculate_continuous_stats(
+            sample_continuous_data, "AGE", "TRT01P", "n mean+sd"
+        )
+        wide = engine.calculate_continuous_stats(
+            sample_continuous_data, "AGE", "TRT01P", "n mean+sd", return_format="wide"
+        )
+
+        assert list(wide.columns) == ["N", "Mean (SD)"]
+        assert list(wide.index) == ["Drug A", "Drug B", "Placebo", "Total"]
+        expected = long.pivot(
+            index="treatment", columns="statistic", values="formatted_value"
+        )
+        pd.testing.assert_frame_equal(
+            wide, expected.loc[wide.index, wide.columns], check_names=False
+        )
+
+    def test_continuous_stats_invalid_return_format(
+        self, engine, sample_continuous_data
+    ):
+        """Test an unknown return format raises ValueError."""
+        with pytest.raises(ValueError, match="return_format"):
+            engine.calculate_continuous_stats(
+                sample_continuous_data, "AGE", "TRT01P", "n", return_format="tall"
+            )
+
 
 class TestCalculateCategoricalStats:
     """Test calculate_categorical_stats method."""
@@ -208,6 +235,21 @@ class TestStatisticalTests:
         assert "f_stat" in result or "f_statistic" in result
         assert "p_value" in result
 
+    def test_perform_anova_ignores_unused_categories(
+        self, engine, sample_continuous_data
+    ):
+        """Test unused treatment categories are not counted as groups."""
+        data = sample_continuous_data.copy()
+        data["TRT01P"] = pd.Categorical(
+            data["TRT01P"], categories=["Placebo", "Drug A", "Drug B", "Drug C"]
+        )
+
+        result = engine.perform_anova(data, "WEIGHT", "TRT01P")
+        expected = engine.perform_anova(sample_continuous_data, "WEIGHT", "TRT01P")
+
+        assert result["error"] is None
+        assert result["p_value"] == pytest.approx(expected["p_value"])
+
     def test_perform_chi_square(self, engine, sample_categorical_data):
         """Test chi-square calculation."""
         result = engine.perform_chi_square(
@@ -303,6 +345,27 @@ class TestEdgeCases:
         assert isinstance(result, pd.DataFrame)
         assert len(result) > 0
 
+    def test_continuous_stats_does_not_modify_input(self, engine):
+        """Test numeric coercion does not write back into the input data."""
+        data = pd.DataFrame({
+            "TRT01P": ["Placebo"] * 3 + ["Drug A"] * 3,
+            "AGE": ["25", "30", "x", "40", "45", "50"],
+        })
+        original = data.copy()
+
+        result = engine.calculate_continuous_stats(
+            data=data,
+            variable="AGE",
+            treatment_var="TRT01P",
+            stats_spec="n"
+        )
+
+        pd.testing.assert_frame_equal(data, original)
+        placebo_n = result[
+            (result["treatment"] == "Placebo") & (result["statistic"] == "N")
+        ]
+        assert placebo_n["formatted_value"].iloc[0] == "2"
+
     def test_categorical_stats_with_empty_categories(self, engine):
         """Test categorical stats with empty categories."""
         data = pd.DataFrame({
@@ -322,6 +385,87 @@ class TestEdgeCases:
         assert len(result) > 0
 
 
+class TestGroupCache:
+    """Test reuse of filtered data and treatment groupings."""
+
+    def test_grouping_reused_across_variables(self, engine, sample_continuous_data):
+        """Test repeated calls in one block share one cached grouping."""
+        with engine.cached_groupings():
+            engine.calculate_continuous_stats(
+                sample_continuous_data, "AGE", "TRT01P", "n", "AGE > 30"
+            )
+            engine.calculate_continuous_stats(
+                sample_continuous_data, "WEIGHT", "TRT01P", "n", "AGE > 30"
+            )
+
+            assert len(engine._group_cache) == 1
+
+        assert len(engine._group_cache) == 0
+
+    def test_no_caching_outside_block(self, engine, sample_continuous_data):
+        """Test in-place changes between direct calls are picked up."""
+        data = sample_continuous_data.copy()
+        first = engine.calculate_continuous_stats(
+            data, "AGE", "TRT01P", "mean", "AGE > 0"
+        )
+        data.loc[data["TRT01P"] == "Placebo", "AGE"] = 99
+        data["BMI"] = 25.0
+
+        second = engine.calculate_continuous_stats(
+            data, "AGE", "TRT01P", "mean", "AGE > 0"
+        )
+        bmi = engine.calculate_continuous_stats(
+            data, "BMI", "TRT01P", "mean", "AGE > 0"
+        )
+
+        assert len(engine._group_cache) == 0
+        assert not first["value"].equals(second["value"])
+        assert second.loc[second["treatment"] == "Placebo", "value"].iloc[0] == 99
+        assert len(bmi) > 0
+
+    def test_clear_cache(self, engine, sample_continuous_data):
+        """Test clear_cache drops cached groupings."""
+        with engine.cached_groupings():
+            engine.calculate_continuous_stats(
+                sample_continuous_data, "AGE", "TRT01P", "n"
+            )
+
+            engine.clear_cache()
+
+            assert len(engine._group_cache) == 0
+
+
+class TestCompiledKernels:
+    """Test the optional numba kernels against the NumPy implementation."""
+
+    def test_continuous_stats_match_numpy(self, monkeypatch):
+        """Test compiled and NumPy summaries produce identical output."""
+        pytest.importorskip("numba")
+        from py4csr.clinical import statistical_engine
+
+        rng = np.random.default_rng(0)
+        n = statistical_engine.NUMBA_MIN_ROWS + 100
+        values = rng.normal(70, 10, n)
+        values[::50] = np.nan
+        data = pd.DataFrame({
+            "TRT01P": rng.choice(["Placebo", "Drug A", "Drug B"], n),
+            "WEIGHT": values,
+        })
+        spec = "n mean+sd median q1q3 min+max var"
+
+        compiled = ClinicalStatisticalEngine().calculate_continuous_stats(
+            data, "WEIGHT", "TRT01P", spec
+        )
+        monkeypatch.setattr(statistical_engine, "NUMBA_AVAILABLE", False)
+        fallback = ClinicalStatisticalEngine().calculate_continuous_stats(
+            data, "WEIGHT", "TRT01P", spec
+        )
+
+        pd.testing.assert_series_equal(
+            compiled["formatted_value"], fallback["formatted_value"]
+        )
+
+
 class TestConditionStats:
     """Test calculate_condition_stats method."""
 
@@ -42,6 +42,58 @@ class TestStatisticConfig:
         assert hasattr(config, "name")
         assert config.name == "n"
 
+    def test_format_value(self):
+        """Test numeric values use the configured precision."""
+        config = StatisticConfig(name="mean", display="Mean", label="Mean", precision=2)
+        assert config.format_value(3.14159) == "3.14"
+        assert config.format_value(3) == "3.00"
+        assert config.format_value("NA") == "NA"
+
+    def test_format_value_with_registered_function(self, monkeypatch):
+        """Test format_func resolves to a registered formatting function."""
+        from py4csr.config import report_config
+
+        monkeypatch.setitem(
+            report_config.FORMAT_FUNCTIONS, "format_pct", lambda v: f"{v:.0%}"
+        )
+        config = StatisticConfig(
+            name="pct", display="%", label="Percent", precision=1,
+            format_func="format_pct",
+        )
+        unregistered = StatisticConfig(
+            name="ci", display="CI", label="CI", precision=1,
+            format_func="format_unknown",
+        )
+
+        assert config.format_value(0.25) == "25%"
+        assert unregistered.format_value(0.25) == "0.25"
+
+    def test_registered_function_applies_to_standard_config(self, monkeypatch):
+        """Test a function registered after import is used by built-in stats."""
+        from py4csr.config import report_config
+
+        config = get_clinical_standard_config()
+        mean_sd = next(
+            stat for stat in config.statistics.values()
+            if stat.format_func == "format_mean_sd"
+        )
+        monkeypatch.setitem(
+            report_config.FORMAT_FUNCTIONS,
+            "format_mean_sd",
+            lambda v: f"{v[0]:.1f} ({v[1]:.2f})",
+        )
+
+        assert mean_sd.format_value((1.0, 2.0)) == "1.0 (2.00)"
+
+    def test_immutable_and_hashable(self):
+        """Test StatisticConfig is frozen and can be used as a cache key."""
+        config = StatisticConfig(name="n", display="n", label="n", precision=0)
+        with pytest.raises(AttributeError):
+            config.precision = 1
+        assert hash(config) == hash(
+            StatisticConfig(name="n", display="n", label="n", precision=0)
+        )
+
 
 class TestPageSettings:
     """Test PageSettings class."""
@@ -71,6 +123,98 @@ class TestReportConfig:
         # Check for common attributes
         assert hasattr(config, "__dict__") or hasattr(config, "__dataclass_fields__")
 
+    def test_lookups_follow_reassigned_mappings(self):
+        """Test get_statistic/get_format see added and reassigned entries."""
+        config = ReportConfig()
+        stat = StatisticConfig(name="n", display="n", label="n", precision=0)
+        config.add_statistic(stat)
+        config.add_format("percent", "({:.1f}%)")
+
+        assert config.get_statistic("n") is stat
+        assert config.get_format("percent") == "({:.1f}%)"
+
+        config.formats = {"pvalue": "{:.4f}"}
+        assert config.get_format("percent") is None
+        assert config.get_format("pvalue") == "{:.4f}"
+        assert config == ReportConfig(statistics={"n": stat}, formats=config.formats)
+
+    def test_get_format_callable(self):
+        """Test formats can be retrieved as ready-to-call formatters."""
+        config = ReportConfig(formats={"n_percent": "{} ({:.1f}%)"})
+
+        assert config.get_format_callable("n_percent")(5, 41.666) == "5 (41.7%)"
+        assert config.get_format_callable("missing") is None
+
+    def test_yaml_round_trip(self, tmp_path):
+        """Test a configuration saved to YAML loads back unchanged."""
+        config = get_oncology_config()
+        config_file = tmp_path / "config.yaml"
+
+        config.to_yaml(str(config_file))
+        loaded = ReportConfig.from_yaml(str(config_file))
+
+        assert loaded == config
+
+    def test_filter_population(self):
+        """Test simple and general population expressions filter rows."""
+        import pandas as pd
+
+        data = pd.DataFrame({"SAFFL": ["Y", "N", "Y"], "AGE": [30, 70, 80]})
+        config = ReportConfig(
+            populations={
+                "safety": "SAFFL=='Y'",
+                "elderly": "SAFFL == \"Y\" and AGE > 65",
+            }
+        )
+
+        assert list(config.filter_population(data, "safety").index) == [0, 2]
+        assert list(config.filter_population(data, "elderly").index) == [2]
+        with pytest.raises(ValueError, match="Unknown population"):
+            config.filter_population(data, "itt")
+
+    def test_filter_population_compound_and_quoted(self):
+        """Test compound and quoted-value expressions match DataFrame.query."""
+        import pandas as pd
+
+        data = pd.DataFrame({
+            "SAFFL": ["Y", "Y", "N"],
+            "ITTFL": ["Y", "N", "Y"],
+            "SITE": ["O'Hare", "Main", "O'Hare"],
+        })
+        config = ReportConfig(
+            populations={
+                "safety_itt": "SAFFL=='Y' and ITTFL=='Y'",
+                "ohare": "SITE == \"O'Hare\"",
+            }
+        )
+
+        for name, expression in config.populations.items():
+            expected = data.query(expression)
+            pd.testing.assert_frame_equal(
+                config.filter_population(data, name), expected
+            )
+        assert list(config.filter_population(data, "safety_itt").index) == [0]
+        assert list(config.filter_population(data, "ohare").index) == [0, 2]
+
+    def test_lookups_are_methods(self):
+        """Test lookups stay class methods and do not validate at construction."""
+        config = ReportConfig(statistics=None)
+
+        assert "get_statistic" not in vars(config)
+        assert "get_format" not in vars(config)
+        assert config.get_format("missing") is None
+
+    def test_deepcopy_lookups_use_copied_mappings(self):
+        """Test a deep copy's lookups refer to its own mappings."""
+        import copy
+
+        config = ReportConfig(formats={"percent": "({:.1f}%)"})
+        copied = copy.deepcopy(config)
+        copied.formats.pop("percent")
+
+        assert copied.get_format("percent") is None
+        assert config.get_format("percent") == "({:.1f}%)"
+
 
 class TestClinicalStandardConfig:
     """Test clinical standard configuration functions."""
@@ -90,6 +234,19 @@ class TestClinicalStandardConfig:
         config = get_oncology_config()
         assert isinstance(config, ReportConfig)
 
+    def test_configs_are_independent_copies(self):
+        """Test modifying a returned configuration does not affect later calls."""
+        config = get_clinical_standard_config()
+        config.statistics.pop("n")
+        config.formats["percent"] = "{:.2f}%"
+        config.page_settings.margins["top"] = 2.0
+
+        fresh = get_clinical_standard_config()
+        assert "n" in fresh.statistics
+        assert fresh.formats["percent"] == "({:.1f}%)"
+        assert fresh.page_settings.margins["top"] == 1.0
+        assert "n" in get_oncology_config().statistics
+
 
 class TestConfigWorkflow:
     """Test complete configuration workflow."""
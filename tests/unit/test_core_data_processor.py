@@ -0,0 +1,163 @@
+"""
+Unit tests for py4csr.core.data_processor module.
+
+Tests the DataProcessor validation, cleaning and pipeline helpers.
+"""
+
+import pandas as pd
+import pytest
+
+from py4csr.core.data_processor import DataProcessor
+
+
+@pytest.fixture
+def processor():
+    """Create DataProcessor instance."""
+    return DataProcessor()
+
+
+@pytest.fixture
+def raw_data():
+    """Create raw data with duplicates, missing values and text columns."""
+    return pd.DataFrame({
+        "USUBJID": ["S001", "S001", "S002", "S003", "S004"],
+        "AGE": ["65", "65", "72", None, "bad"],
+        "SEX": ["M", "M", None, "F", "F"],
+        "TRTSDT": ["2020-01-01", "2020-01-01", "2020-02-01", None, "bad"],
+    })
+
+
+class TestCleanData:
+    """Test clean_data method."""
+
+    def test_clean_data_applies_all_steps(self, processor, raw_data):
+        """Test duplicates, missing values, formats and filters are applied."""
+        result = processor.clean_data(
+            raw_data,
+            {
+                "fill_values": {"SEX": "U"},
+                "numeric_columns": ["AGE"],
+                "date_columns": ["TRTSDT"],
+                "filters": ["AGE > 60"],
+            },
+        )
+
+        assert list(result["USUBJID"]) == ["S001", "S002"]
+        assert list(result["SEX"]) == ["M", "U"]
+        assert pd.api.types.is_numeric_dtype(result["AGE"])
+        assert pd.api.types.is_datetime64_any_dtype(result["TRTSDT"])
+
+    def test_clean_data_does_not_modify_input(self, processor, raw_data):
+        """Test the input frame is left unchanged."""
+        original = raw_data.copy()
+
+        processor.clean_data(
+            raw_data,
+            {"fill_values": {"SEX": "U"}, "numeric_columns": ["AGE"]},
+        )
+
+        pd.testing.assert_frame_equal(raw_data, original)
+
+    def test_duplicate_subset(self, processor, raw_data):
+        """Test duplicates are identified on the subset columns only."""
+        raw_data.loc[2, "USUBJID"] = "S001"
+
+        result = processor.clean_data(raw_data, {"duplicate_subset": ["USUBJID"]})
+
+        assert list(result["USUBJID"]) == ["S001", "S003", "S004"]
+        assert list(result.index) == [0, 3, 4]
+
+    def test_failed_filter_is_skipped(self, processor, raw_data):
+        """Test an invalid filter expression is logged and skipped."""
+        result = processor.clean_data(raw_data, {"filters": ["UNKNOWN_COL > 1"]})
+
+        assert len(result) == 4
+
+    def test_multiple_filters_combined(self, processor, raw_data):
+        """Test several filters are all applied, skipping an invalid one."""
+        rules = {"numeric_columns": ["AGE"], "filters": ["AGE > 60", "SEX == 'M'"]}
+        result = processor.clean_data(raw_data, rules)
+        assert list(result["USUBJID"]) == ["S001"]
+
+        rules["filters"].append("UNKNOWN_COL > 1")
+        result = processor.clean_data(raw_data, rules)
+        assert list(result["USUBJID"]) == ["S001"]
+
+
+class TestValidateData:
+    """Test validate_data method."""
+
+    def test_missing_required_columns(self, processor, raw_data):
+        """Test missing required columns make the data invalid."""
+        result = processor.validate_data(raw_data, {"required_columns": ["USUBJID", "ARM"]})
+
+        assert result["is_valid"] is False
+        assert "ARM" in result["errors"][0]
+
+    def test_type_mismatch_warning(self, processor, raw_data):
+        """Test column type mismatches are reported as warnings."""
+        result = processor.validate_data(
+            raw_data, {"column_types": {"AGE": "float64", "USUBJID": "object"}}
+        )
+
+        assert result["is_valid"] is True
+        assert len(result["warnings"]) == 1
+        assert "AGE" in result["warnings"][0]
+
+    def test_missing_value_summary(self, processor, raw_data):
+        """Test the summary counts missing values per column."""
+        result = processor.validate_data(raw_data, {})
+
+        assert result["summary"]["missing_values"] == {
+            "USUBJID": 0, "AGE": 1, "SEX": 1, "TRTSDT": 1
+        }
+
+
+class TestTransformData:
+    """Test transform_data method."""
+
+    def test_transform_copies_input_by_default(self, processor, raw_data):
+        """Test in-place transformations do not modify the input by default."""
+        def add_flag(df):
+            df["FLAG"] = "Y"
+            return df
+
+        result = processor.transform_data(raw_data, [add_flag])
+
+        assert "FLAG" in result.columns
+        assert "FLAG" not in raw_data.columns
+
+    def test_transform_without_copy(self, processor, raw_data):
+        """Test copy=False passes the input straight to the transformations."""
+        result = processor.transform_data(raw_data, [lambda df: df], copy=False)
+
+        assert result is raw_data
+
+
+class TestCreatePipeline:
+    """Test create_pipeline method."""
+
+    def test_pipeline_runs_operations_in_order(self, processor, raw_data):
+        """Test validate, clean and transform steps are applied in order."""
+        pipeline = processor.create_pipeline([
+            {"type": "validate", "params": {"required_columns": ["USUBJID"]}},
+            {"type": "clean", "params": {"numeric_columns": ["AGE"]}},
+            {"type": "transform", "params": {"functions": [
+                lambda df: df.assign(AGEGR=df["AGE"] >= 70)
+            ]}},
+            {"type": "unknown"},
+        ])
+
+        result = pipeline(raw_data)
+
+        assert len(result) == 4
+        assert list(result["AGEGR"]) == [False, True, False, False]
+
+    def test_pipeline_validation_failure(self, processor, raw_data):
+        """Test a failed validation step raises ValueError."""
+        pipeline = processor.create_pipeline([
+            {"type": "validate", "params": {"required_columns": ["ARM"]}},
+        ])
+
+        with pytest.raises(ValueError, match="Validation failed"):
+            pipeline(raw_data)
@@ -0,0 +1,46 @@
+"""
+Unit tests for py4csr.core.pipeline module.
+
+Tests the CSRPipeline dataset handling.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+
+from py4csr.core.pipeline import CSRPipeline
+
+
+class TestLoadData:
+    """Test load_data method."""
+
+    def test_dataset_read_once_on_first_access(self, tmp_path):
+        """Test datasets are read lazily and cached after the first read."""
+        csv_file = tmp_path / "adsl.csv"
+        pd.DataFrame({"USUBJID": ["S001", "S002"]}).to_csv(csv_file, index=False)
+
+        pipeline = CSRPipeline(output_dir=str(tmp_path / "output"))
+        with patch("py4csr.data.io.load_dataset", wraps=pd.read_csv) as mock_load:
+            pipeline.load_data(str(csv_file), "adsl")
+            assert mock_load.call_count == 0
+
+            first = pipeline.datasets["adsl"].df()
+            second = pipeline.datasets["adsl"].df()
+
+        assert mock_load.call_count == 1
+        assert first is second
+        assert list(first["USUBJID"]) == ["S001", "S002"]
+
+
+class TestOutputDirectory:
+    """Test output directory handling."""
+
+    def test_output_dir_created_on_first_write(self, tmp_path):
+        """Test the output directory is only created when writing output."""
+        output_dir = tmp_path / "output"
+
+        pipeline = CSRPipeline(output_dir=str(output_dir))
+        assert not output_dir.exists()
+
+        pipeline.generate_report()
+        assert output_dir.is_dir()
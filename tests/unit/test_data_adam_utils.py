@@ -75,6 +75,16 @@ class TestDeriveTreatmentVariables:
 
         assert result["TRT01PN"].tolist() == [99]  # Should not be overwritten
 
+    def test_input_not_modified(self):
+        """Test derived columns are added to a new frame only."""
+        adsl = pd.DataFrame({"USUBJID": ["001"], "TRT01P": ["Placebo"]})
+
+        result = derive_treatment_variables(adsl)
+        result.loc[0, "TRT01P"] = "Changed"
+
+        assert list(adsl.columns) == ["USUBJID", "TRT01P"]
+        assert adsl.loc[0, "TRT01P"] == "Placebo"
+
 
 class TestDeriveAnalysisFlags:
     """Test derive_analysis_flags function."""
@@ -137,6 +147,17 @@ class TestDeriveDispositionVariables:
         assert "DCREASCD" in result.columns
         assert result["DCREASCD"].tolist() == ["COMPLETED", "AE", "WITHDREW"]
 
+    def test_unknown_dcsreas_coded_other(self):
+        """Test unmapped and missing reasons are coded as OTHER."""
+        adsl = pd.DataFrame({
+            "USUBJID": ["001", "002", "003"],
+            "DCSREAS": ["LOST TO FOLLOW-UP", "SPONSOR DECISION", None],
+        })
+
+        result = derive_disposition_variables(adsl)
+
+        assert result["DCREASCD"].tolist() == ["LTFU", "OTHER", "OTHER"]
+
 
 class TestDeriveDemographicCategories:
     """Test derive_demographic_categories function."""
@@ -153,6 +174,20 @@ class TestDeriveDemographicCategories:
         assert "AGEGR1" in result.columns
         assert result["AGEGR1"].tolist() == ["<65", "65-74", ">=75", "65-74"]
 
+    def test_agegr1_matches_cut(self):
+        """Test AGEGR1 matches pd.cut, including bin edges and missing ages."""
+        adsl = pd.DataFrame({"AGE": [0, 64.9, 65, 75, 998, 999, -1, np.nan]})
+
+        result = derive_demographic_categories(adsl)
+
+        expected = pd.cut(
+            adsl["AGE"],
+            bins=[0, 65, 75, 999],
+            labels=["<65", "65-74", ">=75"],
+            right=False,
+        )
+        pd.testing.assert_series_equal(result["AGEGR1"], expected, check_names=False)
+
     def test_derive_bmi(self):
         """Test deriving BMI."""
         adsl = pd.DataFrame({
@@ -170,6 +205,22 @@ class TestDeriveDemographicCategories:
         assert abs(result["BMI"].iloc[0] - expected_bmi_1) < 0.01
         assert abs(result["BMI"].iloc[1] - expected_bmi_2) < 0.01
 
+    def test_bmi_numexpr_matches_pandas(self, monkeypatch):
+        """Test BMI evaluated with numexpr equals the pandas arithmetic."""
+        pytest.importorskip("numexpr")
+        from py4csr.data import adam_utils
+
+        adsl = pd.DataFrame({
+            "HEIGHT": [170.0, 155.5, 0.0, np.nan],
+            "WEIGHT": [70, 48, 60, 80],
+        })
+        expected = adsl["WEIGHT"] / (adsl["HEIGHT"] / 100) ** 2
+
+        monkeypatch.setattr(adam_utils, "NUMEXPR_MIN_ROWS", 0)
+        result = derive_demographic_categories(adsl)
+
+        pd.testing.assert_series_equal(result["BMI"], expected, check_names=False)
+
     def test_derive_bmigr1(self):
         """Test deriving BMIGR1."""
         adsl = pd.DataFrame({
@@ -221,6 +272,23 @@ class TestMergeAdamDatasets:
         assert "other" in result
         assert "TRT01P" not in result["other"].columns
 
+    def test_merge_matches_left_merge(self):
+        """Test results match a left merge, including unmatched subjects."""
+        adsl = pd.DataFrame({
+            "USUBJID": ["001", "002"],
+            "TRT01P": ["Placebo", "Active"],
+            "TRT01PN": [0, 54],
+        })
+        adlb = pd.DataFrame(
+            {"USUBJID": ["002", "009", "001"], "AVAL": [1.0, 2.0, 3.0]},
+            index=[10, 11, 12],
+        )
+
+        result = merge_adam_datasets(adsl, {"adlb": adlb})
+
+        expected = adlb.merge(adsl, on="USUBJID", how="left")
+        pd.testing.assert_frame_equal(result["adlb"], expected)
+
 
 class TestCreateAnalysisDataset:
     """Test create_analysis_dataset function."""
@@ -257,6 +325,30 @@ class TestCreateAnalysisDataset:
 
         assert len(result) == 3
 
+    def test_polars_engine_matches_pandas(self):
+        """Test the polars engine returns the same counts as pandas."""
+        pytest.importorskip("polars")
+        data = pd.DataFrame({
+            "AGE": [65, 70, 65, 70, 65],
+            "SEX": ["M", "F", "M", "M", None],
+            "SAFFL": ["Y", "Y", "Y", "N", "Y"],
+            "TRT01P": ["Placebo", "Active", "Placebo", "Active", "Active"],
+        })
+
+        expected = create_analysis_dataset(data, "SEX", ["TRT01P", "AGE"])
+        result = create_analysis_dataset(
+            data, "SEX", ["TRT01P", "AGE"], engine="polars"
+        )
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_invalid_engine(self):
+        """Test an unknown engine raises ValueError."""
+        data = pd.DataFrame({"AGE": [65], "TRT01P": ["Placebo"]})
+
+        with pytest.raises(ValueError, match="engine"):
+            create_analysis_dataset(data, "AGE", ["TRT01P"], engine="spark")
+
 
 class TestFormatAEData:
     """Test format_ae_data function."""
@@ -303,6 +395,49 @@ class TestFormatAEData:
         assert "SERIOUS" in result.columns
         assert "FATAL" in result.columns
 
+    def test_ae_flag_values(self):
+        """Test flag values, title-cased terms and missing source columns."""
+        adsl = pd.DataFrame({
+            "USUBJID": ["001", "002"],
+            "TRT01A": ["Placebo", "Active"],
+            "TRT01AN": [0, 54],
+            "SAFFL": ["Y", "Y"],
+        })
+        adae = pd.DataFrame({
+            "USUBJID": ["001", "002", "002"],
+            "AEDECOD": ["HEADACHE", "NAUSEA", None],
+            "AEREL": ["RELATED", None, "NOT RELATED"],
+        })
+
+        result = format_ae_data(adae, adsl)
+
+        assert result["AEDECOD"].tolist()[:2] == ["Headache", "Nausea"]
+        assert result["DRUG_RELATED"].tolist() == [True, False, False]
+        assert not result["SERIOUS"].any()
+        assert not result["FATAL"].any()
+
+    def test_polars_engine_matches_pandas(self):
+        """Test the polars engine returns the same frame as pandas."""
+        pytest.importorskip("polars")
+        adsl = pd.DataFrame({
+            "USUBJID": ["001", "002", "003"],
+            "TRT01A": ["Placebo", "Active", "Active"],
+            "TRT01AN": [0, 54, 54],
+            "SAFFL": ["Y", "Y", "N"],
+        })
+        adae = pd.DataFrame({
+            "USUBJID": ["002", "001", "003", "002"],
+            "AEDECOD": ["NAUSEA", "HEADACHE", "RASH", None],
+            "AEREL": ["RELATED", None, "POSSIBLE", "NONE"],
+            "AESER": ["N", "Y", "N", None],
+            "AEOUT": ["FATAL", "RECOVERED", "RECOVERED", "FATAL"],
+        })
+
+        expected = format_ae_data(adae, adsl)
+        result = format_ae_data(adae, adsl, engine="polars")
+
+        pd.testing.assert_frame_equal(result, expected)
+
 
 class TestFormatLabData:
     """Test format_lab_data function."""
@@ -340,6 +475,26 @@ class TestFormatLabData:
         assert result["AVAL"].dtype in [np.float64, np.float32, float, np.int64, int]
         assert result["BASE"].dtype in [np.float64, np.float32, float, np.int64, int]
 
+    def test_change_from_baseline(self):
+        """Test CHG and PCHG are derived from the converted values."""
+        adsl = pd.DataFrame({
+            "USUBJID": ["001", "002"],
+            "TRT01P": ["Placebo", "Active"],
+            "TRT01PN": [0, 54],
+            "EFFFL": ["Y", "Y"],
+        })
+        adlb = pd.DataFrame({
+            "USUBJID": ["001", "002", "002"],
+            "AVAL": ["12", "30", "bad"],
+            "BASE": ["10", "20", "20"],
+        })
+
+        result = format_lab_data(adlb, adsl)
+
+        assert result["CHG"].tolist()[:2] == [2.0, 10.0]
+        assert result["PCHG"].tolist()[:2] == [20.0, 50.0]
+        assert np.isnan(result["CHG"].iloc[2])
+
 
 class TestCreateSummaryStatistics:
     """Test create_summary_statistics function."""
@@ -358,6 +513,34 @@ class TestCreateSummaryStatistics:
         assert "TRT01P" in result.columns
         assert "mean" in result.columns
 
+    def test_summary_stats_match_groupby(self):
+        """Test statistics match a pandas groupby aggregation."""
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({
+            "AVAL": rng.normal(50, 10, 500),
+            "TRT01P": rng.choice(["Placebo", "Active", "High"], 500),
+        })
+        data.loc[::17, "AVAL"] = np.nan
+
+        result = create_summary_statistics(data, "AVAL", "TRT01P")
+
+        grouped = data.dropna(subset=["AVAL"]).groupby("TRT01P")["AVAL"]
+        expected = grouped.agg(["count", "mean", "std", "min", "max", "median"])
+        expected = expected.round(2)
+        expected["q1"] = grouped.quantile(0.25)
+        expected["q3"] = grouped.quantile(0.75)
+        pd.testing.assert_frame_equal(result, expected.reset_index())
+
+    def test_summary_stats_single_value_group(self):
+        """Test a single-value group has a missing standard deviation."""
+        data = pd.DataFrame({"AGE": [65.0, 70.0, 75.0], "TRT01P": ["A", "A", "B"]})
+
+        result = create_summary_statistics(data, "AGE", "TRT01P")
+
+        assert result["count"].tolist() == [2, 1]
+        assert np.isnan(result.loc[1, "std"])
+        assert result.loc[1, "q1"] == 75.0
+
 
 class TestCreateFrequencyTable:
     """Test create_frequency_table function."""
@@ -374,6 +557,35 @@ class TestCreateFrequencyTable:
         assert isinstance(result, pd.DataFrame)
         assert "Category" in result.columns
 
+    def test_frequency_table_counts_and_percentages(self):
+        """Test counts, percentages and totals, ignoring missing values."""
+        data = pd.DataFrame({
+            "SEX": ["M", "F", "M", "F", "M", None],
+            "TRT01P": ["Placebo", "Placebo", "Active", "Active", "Placebo", "Active"],
+        })
+
+        result = create_frequency_table(data, "SEX", "TRT01P").set_index("Category")
+
+        assert list(result.index) == ["F", "M", "Total"]
+        assert result.loc["M", "Placebo_n"] == 2
+        assert result.loc["M", "Placebo_npct"] == "2 (66.7%)"
+        assert result.loc["F", "Total_pct"] == "40.0"
+        assert result.loc["Total", "Placebo_n"] == 3
+        assert result.loc["Total", "Total_npct"] == "5 (100.0%)"
+
+    def test_frequency_table_without_total(self):
+        """Test the total row and column are omitted when not requested."""
+        data = pd.DataFrame({
+            "SEX": ["M", "F", "M"],
+            "TRT01P": ["Placebo", "Placebo", "Active"],
+        })
+
+        result = create_frequency_table(data, "SEX", "TRT01P", include_total=False)
+
+        assert "Total" not in result["Category"].tolist()
+        assert "Total_n" not in result.columns
+        assert result["Active_npct"].tolist() == ["0 (0.0%)", "1 (100.0%)"]
+
 
 class TestApplyCDISCFormats:
     """Test apply_cdisc_formats function."""
@@ -434,6 +646,19 @@ class TestValidateAdamStructure:
         assert result["valid"] is False
         assert len(result["errors"]) > 0
 
+    def test_validate_adsl_duplicate_subjects(self):
+        """Test duplicate subject IDs are counted, including repeated missing IDs."""
+        data = pd.DataFrame({
+            "USUBJID": ["001", "001", "002", None, None],
+            "STUDYID": "STUDY1",
+            "SUBJID": ["1", "1", "2", "3", "4"],
+        })
+
+        result = validate_adam_structure(data, "ADSL")
+
+        assert result["valid"] is False
+        assert result["errors"] == ["Found 2 duplicate subject IDs"]
+
     def test_validate_adae_valid(self):
         """Test validating valid ADAE."""
         data = pd.DataFrame({
@@ -8,13 +8,15 @@ import pandas as pd
 import pytest
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
 from py4csr.data.io import (
     read_sas,
     read_xpt,
     load_dataset,
     get_dataset_info,
-    load_adam_data
+    load_adam_data,
+    clear_read_cache,
 )
 from py4csr.exceptions import DataValidationError
 
@@ -77,6 +79,120 @@ class TestReadSAS:
         with pytest.raises(FileNotFoundError):
             read_sas("nonexistent.sas7bdat")
 
+    @pytest.fixture
+    def sas_file(self, tmp_path, monkeypatch):
+        """Write a small dataset and read it back through the SAS reader."""
+        pyreadstat = pytest.importorskip("pyreadstat")
+        data = pd.DataFrame({
+            "USUBJID": [f"S{i:03d}" for i in range(10)],
+            "AGE": [float(60 + i) for i in range(10)],
+            "SAFFL": ["Y", "N"] * 5,
+        })
+        file_path = tmp_path / "adsl.sas7bdat"
+        pyreadstat.write_xport(data, str(file_path))
+        monkeypatch.setattr(pyreadstat, "read_sas7bdat", pyreadstat.read_xport)
+        return file_path, data
+
+    def test_read_sas_in_chunks(self, sas_file):
+        """Test a chunked read returns the same rows as a single read."""
+        file_path, data = sas_file
+
+        result = read_sas(file_path, chunksize=3)
+
+        pd.testing.assert_frame_equal(result, data)
+        assert result.attrs["source_file"] == str(file_path)
+
+    def test_read_sas_pyarrow_backend(self, sas_file):
+        """Test the pyarrow backend dictionary-encodes flag variables."""
+        pa = pytest.importorskip("pyarrow")
+        file_path, data = sas_file
+
+        result = read_sas(file_path, chunksize=4, dtype_backend="pyarrow")
+
+        assert result["SAFFL"].dtype.pyarrow_dtype == pa.dictionary(
+            pa.int32(), pa.string()
+        )
+        assert result["SAFFL"].tolist() == data["SAFFL"].tolist()
+        assert result["AGE"].tolist() == data["AGE"].tolist()
+
+    def test_read_sas_pyarrow_backend_all_null_chunk(self, sas_file, monkeypatch):
+        """Test a chunk with an all-missing column combines with the others."""
+        import pyreadstat
+
+        pytest.importorskip("pyarrow")
+        file_path, _ = sas_file
+        chunks = [
+            pd.DataFrame({"USUBJID": ["S001", "S002"], "DTHDTC": [None, None]}),
+            pd.DataFrame({"USUBJID": ["S003", "S004"], "DTHDTC": ["2020-01-01", None]}),
+        ]
+        meta = SimpleNamespace(column_labels=None, variable_value_labels=None)
+        monkeypatch.setattr(
+            pyreadstat,
+            "read_file_in_chunks",
+            lambda *args, **kwargs: ((chunk, meta) for chunk in chunks),
+        )
+
+        result = read_sas(file_path, chunksize=2, dtype_backend="pyarrow")
+
+        assert result["USUBJID"].tolist() == ["S001", "S002", "S003", "S004"]
+        assert result["DTHDTC"].iloc[2] == "2020-01-01"
+        assert result["DTHDTC"].isna().sum() == 3
+
+    def test_read_sas_caches_unchanged_file(self, sas_file, monkeypatch):
+        """Test cached reads reuse the parsed frame until the file changes."""
+        import pyreadstat
+
+        file_path, data = sas_file
+        calls = []
+        read_xport = pyreadstat.read_xport
+
+        def counting_reader(*args, **kwargs):
+            calls.append(args)
+            return read_xport(*args, **kwargs)
+
+        monkeypatch.setattr(pyreadstat, "read_sas7bdat", counting_reader)
+        clear_read_cache()
+
+        first = read_sas(file_path, cache=True)
+        first.loc[0, "AGE"] = -1.0
+        second = read_sas(file_path, cache=True)
+
+        assert len(calls) == 1
+        assert second.loc[0, "AGE"] == data.loc[0, "AGE"]
+
+        pyreadstat.write_xport(data.head(5), str(file_path))
+        os.utime(file_path, ns=(0, 0))
+
+        assert len(read_sas(file_path, cache=True)) == 5
+        assert len(calls) == 2
+        clear_read_cache()
+
+    def test_read_sas_not_cached_by_default(self, sas_file, monkeypatch):
+        """Test files are parsed on every read unless caching is requested."""
+        import pyreadstat
+
+        file_path, _ = sas_file
+        calls = []
+        read_xport = pyreadstat.read_xport
+
+        def counting_reader(*args, **kwargs):
+            calls.append(args)
+            return read_xport(*args, **kwargs)
+
+        monkeypatch.setattr(pyreadstat, "read_sas7bdat", counting_reader)
+
+        read_sas(file_path)
+        read_sas(file_path)
+
+        assert len(calls) == 2
+
+    def test_read_sas_invalid_dtype_backend(self, sas_file):
+        """Test an unsupported dtype_backend raises ValueError."""
+        file_path, _ = sas_file
+
+        with pytest.raises(ValueError, match="dtype_backend"):
+            read_sas(file_path, dtype_backend="numpy")
+
 
 class TestReadXPT:
     """Test read_xpt function."""
@@ -121,6 +237,57 @@ class TestLoadAdamData:
         # Should return empty dict or raise error
         assert isinstance(result, dict) or result is None
 
+    def test_load_adam_data_from_directory(self, tmp_path):
+        """Test datasets are loaded in the requested order, skipping missing ones."""
+        pd.DataFrame({"USUBJID": ["001", "002"]}).to_csv(
+            tmp_path / "adsl.csv", index=False
+        )
+        pd.DataFrame({"USUBJID": ["001"], "AEDECOD": ["Headache"]}).to_csv(
+            tmp_path / "adae.csv", index=False
+        )
+
+        result = load_adam_data(str(tmp_path), ["adae", "adlb", "adsl"])
+
+        assert list(result) == ["ADAE", "ADSL"]
+        assert len(result["ADSL"]) == 2
+        assert result["ADAE"]["AEDECOD"].tolist() == ["Headache"]
+
+    def test_load_adam_data_ignores_file_name_case(self, tmp_path):
+        """Test upper-case file names are found for lower-case dataset names."""
+        pd.DataFrame({"USUBJID": ["001", "002"]}).to_csv(
+            tmp_path / "ADSL.CSV", index=False
+        )
+
+        result = load_adam_data(str(tmp_path), ["adsl"])
+
+        assert len(result["ADSL"]) == 2
+
+    def test_load_adam_data_parquet_cache(self, tmp_path, monkeypatch):
+        """Test SAS/XPT datasets are cached as Parquet and re-read when stale."""
+        pyreadstat = pytest.importorskip("pyreadstat")
+        pytest.importorskip("pyarrow")
+        import py4csr.data.io as data_io
+
+        data = pd.DataFrame({"USUBJID": ["001", "002"], "AGE": [65.0, 70.0]})
+        xpt_path = tmp_path / "adsl.xpt"
+        pyreadstat.write_xport(data, str(xpt_path))
+
+        first = load_adam_data(str(tmp_path), ["adsl"], parquet_cache=True)
+        assert (tmp_path / "adsl.parquet").exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source file should not be read")
+
+        monkeypatch.setattr(data_io, "read_xpt", fail)
+        cached = load_adam_data(str(tmp_path), ["adsl"], parquet_cache=True)
+        pd.testing.assert_frame_equal(cached["ADSL"], first["ADSL"])
+
+        monkeypatch.undo()
+        pyreadstat.write_xport(data.head(1), str(xpt_path))
+        os.utime(xpt_path, ns=(0, (tmp_path / "adsl.parquet").stat().st_mtime_ns + 1))
+        refreshed = load_adam_data(str(tmp_path), ["adsl"], parquet_cache=True)
+        assert len(refreshed["ADSL"]) == 1
+
 
 class TestDataIOIntegration:
     """Integration tests for data I/O operations."""
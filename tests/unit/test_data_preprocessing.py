@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 import numpy as np
 
+from py4csr.data import preprocessing
 from py4csr.data.preprocessing import (
     apply_formats,
     handle_missing_data,
@@ -31,6 +32,17 @@ class TestApplyFormats:
 
         assert pd.api.types.is_datetime64_any_dtype(result["RFSTDTC"])
 
+    def test_date_format_already_datetime(self):
+        """Test datetime columns, including tz-aware ones, are kept as they are."""
+        data = pd.DataFrame({
+            "ADT": pd.to_datetime(["2023-01-15", None]),
+            "ADTM": pd.to_datetime(["2023-01-15 08:00", None]).tz_localize("UTC"),
+        })
+
+        result = apply_formats(data, {"ADT": "date", "ADTM": "date"})
+
+        pd.testing.assert_frame_equal(result, data)
+
     def test_numeric_format(self):
         """Test applying numeric format."""
         data = pd.DataFrame({
@@ -56,6 +68,21 @@ class TestApplyFormats:
 
         assert pd.api.types.is_categorical_dtype(result["SEX"])
 
+    def test_auto_categorical_format(self):
+        """Test only low-cardinality text columns become categorical."""
+        data = pd.DataFrame({
+            "USUBJID": [f"{i:03d}" for i in range(100)],
+            "SEX": ["M", "F"] * 50,
+            "AGE": [65, 70] * 50,
+        })
+
+        format_dict = {col: "auto_categorical" for col in ["USUBJID", "SEX", "AGE"]}
+        result = apply_formats(data, format_dict)
+
+        assert isinstance(result["SEX"].dtype, pd.CategoricalDtype)
+        assert result["USUBJID"].dtype == object
+        assert result["AGE"].dtype == "int64"
+
     def test_multiple_formats(self):
         """Test applying multiple formats."""
         data = pd.DataFrame({
@@ -163,6 +190,23 @@ class TestHandleMissingData:
 
         assert result["AGE"].iloc[1] == 65  # Forward filled from row 0
 
+    def test_forward_fill_mixed_columns(self):
+        """Test forward fill keeps leading gaps and matches pandas ffill."""
+        data = pd.DataFrame(
+            {
+                "AGE": [np.nan, 65, np.nan, np.nan],
+                "SEX": [None, "M", None, "F"],
+                "VISITNUM": pd.array([1, None, 3, None], dtype="Int64"),
+            },
+            index=[3, 1, 4, 2],
+        )
+
+        result = handle_missing_data(data, strategy="forward_fill")
+
+        pd.testing.assert_frame_equal(result, data.ffill())
+        assert np.isnan(result["AGE"].iloc[0])
+        assert result["SEX"].tolist() == [None, "M", "M", "F"]
+
     def test_invalid_strategy(self):
         """Test invalid strategy raises error."""
         data = pd.DataFrame({"USUBJID": ["001"]})
@@ -170,6 +214,31 @@ class TestHandleMissingData:
         with pytest.raises(ValueError, match="Unknown missing data strategy"):
             handle_missing_data(data, strategy="invalid_strategy")
 
+    def test_invalid_engine(self):
+        """Test an unsupported engine raises error."""
+        data = pd.DataFrame({"USUBJID": ["001"]})
+
+        with pytest.raises(ValueError, match="Unsupported engine"):
+            handle_missing_data(data, engine="spark")
+
+    @pytest.mark.parametrize("strategy", ["listwise", "impute", "forward_fill"])
+    def test_polars_engine_matches_pandas(self, strategy):
+        """Test the polars engine returns the same values and index as pandas."""
+        pytest.importorskip("polars")
+        data = pd.DataFrame(
+            {
+                "USUBJID": ["001", "002", "003", "004"],
+                "AGE": [65, np.nan, 70, 75],
+                "SEX": ["M", np.nan, "F", "M"],
+            },
+            index=[10, 20, 30, 40],
+        )
+
+        expected = handle_missing_data(data, strategy=strategy)
+        result = handle_missing_data(data, strategy=strategy, engine="polars")
+
+        pd.testing.assert_frame_equal(result, expected)
+
 
 class TestDeriveVariables:
     """Test derive_variables function."""
@@ -219,6 +288,37 @@ class TestDeriveVariables:
         assert "AGEGR1" in result.columns
         assert result["AGEGR1"].tolist() == [False, True, True]
 
+    def test_chained_derivations(self):
+        """Test derivations can use variables derived earlier in the same call."""
+        data = pd.DataFrame({"USUBJID": ["001", "002"], "AGE": [65, 70]})
+
+        derivations = {"AGE_MONTHS": "AGE * 12", "AGE_DAYS": "AGE_MONTHS * 30"}
+        result = derive_variables(data, derivations)
+
+        assert result["AGE_DAYS"].tolist() == [23400, 25200]
+        assert list(data.columns) == ["USUBJID", "AGE"]
+
+    def test_numexpr_matches_eval(self, monkeypatch):
+        """Test numexpr evaluation matches DataFrame.eval, with fallbacks."""
+        pytest.importorskip("numexpr")
+        data = pd.DataFrame({
+            "AGE": [60, 70, 80],
+            "WEIGHT": [70.5, np.nan, 90.0],
+            "SEX": ["M", "F", "M"],
+        })
+        derivations = {
+            "RATIO": "WEIGHT / AGE",
+            "OLD": "(AGE >= 65) & (WEIGHT > 80)",
+            "OLD_MALE": "AGE >= 65 and SEX == 'M'",
+            "RATIO2": "RATIO * 2",
+        }
+        expected = derive_variables(data, derivations)
+
+        monkeypatch.setattr(preprocessing, "NUMEXPR_MIN_ROWS", 0)
+        result = derive_variables(data, derivations)
+
+        pd.testing.assert_frame_equal(result, expected)
+
     def test_invalid_derivation(self, capsys):
         """Test invalid derivation expression."""
         data = pd.DataFrame({"USUBJID": ["001"]})
@@ -306,6 +406,30 @@ class TestCleanData:
         captured = capsys.readouterr()
         assert "Removed 1 duplicate rows" in captured.out
 
+    def test_input_not_modified(self):
+        """Test cleaning returns a new frame and leaves the input unchanged."""
+        data = pd.DataFrame({"usubjid": ["001", "002"], "sex": ["M", "NA"]})
+        original = data.copy()
+
+        result = clean_data(data)
+
+        assert result is not data
+        pd.testing.assert_frame_equal(data, original)
+
+    def test_polars_engine_matches_pandas(self):
+        """Test the polars engine removes the same rows and values as pandas."""
+        pytest.importorskip("polars")
+        data = pd.DataFrame({
+            "usubjid": ["001", "001", "002", "003"],
+            "sex": ["M", "M", "NA", "F"],
+        })
+
+        expected = clean_data(data)
+        result = clean_data(data, engine="polars")
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert list(result.index) == [0, 2, 3]
+
     def test_no_duplicates(self):
         """Test when there are no duplicates."""
         data = pd.DataFrame({
@@ -226,6 +226,45 @@ class TestAdvancedGroupingEngine:
             # Expected to fail without proper setup, just ensure method exists
             pass
 
+    def test_apply_grouping_layout(
+        self, sample_config, sample_data, sample_statistics_df
+    ):
+        """Test every group gets a header, its statistics and a page break."""
+        engine = AdvancedGroupingEngine(sample_config)
+        engine.add_grouping(
+            GroupingSpecification(
+                name="AGEGR1", label="Age Group", page_break=True, indent_subgroups=True
+            )
+        )
+
+        result = engine.apply_grouping(sample_data, sample_statistics_df, ["AGEGR1"])
+
+        n_stats = len(sample_statistics_df)
+        assert len(result) == 2 * (n_stats + 2) + 1 + n_stats
+        assert list(result.index) == list(range(len(result)))
+        assert result["PARAMETER"].iloc[0] == "Age Group: <65"
+        assert list(result["GROUP_VALUE"].iloc[1 : n_stats + 1]) == ["<65"] * n_stats
+        assert list(result["INDENT"].iloc[1 : n_stats + 1]) == [1] * n_stats
+        assert result["PARAMETER"].iloc[n_stats + 1] == "__PAGE_BREAK__"
+        assert result["PARAMETER"].iloc[n_stats + 2] == "Age Group: >=65"
+        assert list(result["GROUP_VALUE"].iloc[-n_stats:]) == ["Total"] * n_stats
+
+    def test_ordered_group_values(self, sample_config):
+        """Test custom, ascending and descending group value ordering."""
+        engine = AdvancedGroupingEngine(sample_config)
+        series = pd.Series(["b", "c", "a", "c", "d"])
+
+        custom = GroupingSpecification(name="G", custom_order=["c", "x", "a"])
+        descending = GroupingSpecification(name="G", sort_order="descending")
+
+        assert engine._get_ordered_group_values(series, custom) == ["c", "a", "b", "d"]
+        assert engine._get_ordered_group_values(
+            series, GroupingSpecification(name="G")
+        ) == ["a", "b", "c", "d"]
+        assert engine._get_ordered_group_values(series, descending) == [
+            "d", "c", "b", "a"
+        ]
+
 
 class TestConditionalFormattingEngine:
     """Test ConditionalFormattingEngine class."""
@@ -268,6 +307,53 @@ class TestConditionalFormattingEngine:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == len(sample_data)
 
+    def test_apply_formatting_rule_types(self, sample_config, sample_data):
+        """Test each rule type formats exactly the rows matching its condition."""
+        engine = ConditionalFormattingEngine(sample_config)
+        engine.add_format_rule(ConditionalFormat(
+            name="high", condition="value > 25", format_type="highlight",
+            format_value="yellow",
+        ))
+        engine.add_format_rule(ConditionalFormat(
+            name="old_male", condition="age >= 60 and sex == 'M'",
+            format_type="bold", format_value="",
+        ))
+        engine.add_format_rule(ConditionalFormat(
+            name="young", condition="not 30 <= age < 65", format_type="italic",
+            format_value="",
+        ))
+
+        result = engine.apply_formatting(sample_data)
+
+        high = sample_data["VALUE"] > 25
+        old_male = (sample_data["AGE"] >= 60) & (sample_data["SEX"] == "M")
+        young = ~sample_data["AGE"].between(30, 64)
+        expected_style = (
+            np.where(old_male, "bold;", "").astype(object)
+            + np.where(young, "italic;", "").astype(object)
+        )
+        assert list(result["CELL_COLOR"]) == list(np.where(high, "yellow", ""))
+        assert list(result["CELL_STYLE"]) == list(expected_style)
+        assert list(result["CELL_FORMAT"]) == [""] * len(sample_data)
+
+    def test_apply_formatting_row_fallback(self, sample_config, sample_data):
+        """Test conditions that need row-wise evaluation give the same result."""
+        engine = ConditionalFormattingEngine(sample_config)
+        engine.add_format_rule(ConditionalFormat(
+            name="placebo", condition="'Placebo' in trt01p", format_type="custom",
+            format_value="grey",
+        ))
+        engine.add_format_rule(ConditionalFormat(
+            name="unknown", condition="VALUE > 25", format_type="color",
+            format_value="red",
+        ))
+
+        result = engine.apply_formatting(sample_data)
+
+        expected = np.where(sample_data["TRT01P"] == "Placebo", "grey", "")
+        assert list(result["CELL_FORMAT"]) == list(expected)
+        assert list(result["CELL_COLOR"]) == [""] * len(sample_data)
+
 
 class TestCustomLabelEngine:
     """Test CustomLabelEngine class."""
@@ -307,6 +393,52 @@ class TestCustomLabelEngine:
 
         assert isinstance(result, pd.DataFrame)
 
+    def test_apply_labels_positions(self, sample_config):
+        """Test label rows are placed before, after or instead of matching rows."""
+        engine = CustomLabelEngine(sample_config)
+        engine.add_label(CustomLabel(name="Age", label="AGE HDR", position="before"))
+        engine.add_label(CustomLabel(name="years", label="END", position="after"))
+        engine.add_label(
+            CustomLabel(name="Sex", label="Gender", position="replace", bold=True)
+        )
+        data = pd.DataFrame({
+            "PARAMETER": ["Age (years)", "Sex", "Race"],
+            "STATISTIC": ["N", "n (%)", "n (%)"],
+            "N": [10, 20, 30],
+        })
+
+        result = engine.apply_labels(data)
+
+        assert list(result["PARAMETER"]) == [
+            "AGE HDR", "Age (years)", "END", "Gender", "Race"
+        ]
+        assert list(result["STATISTIC"]) == [
+            "__CUSTOM_LABEL__", "N", "__CUSTOM_LABEL__", "__CUSTOM_LABEL__", "n (%)"
+        ]
+        assert list(result["N"]) == [10, 10, 10, 20, 30]
+        assert bool(result["BOLD"].iloc[3]) is True
+        assert pd.isna(result["BOLD"].iloc[4])
+
+    def test_apply_labels_overlapping_names(self, sample_config):
+        """Test every label whose name occurs in PARAMETER applies."""
+        engine = CustomLabelEngine(sample_config)
+        engine.add_label(CustomLabel(name="Age", label="H1", position="before"))
+        engine.add_label(CustomLabel(name="Age (years)", label="H2", position="before"))
+        data = pd.DataFrame({"PARAMETER": ["Race", "Age (years)"], "N": [1, 2]})
+
+        result = engine.apply_labels(data)
+
+        assert list(result["PARAMETER"]) == ["Race", "H1", "H2", "Age (years)"]
+
+    def test_apply_labels_no_matches(self, sample_config, sample_statistics_df):
+        """Test data without matching rows is returned unchanged."""
+        engine = CustomLabelEngine(sample_config)
+        engine.add_label(CustomLabel(name="Age", label="H1", position="before"))
+
+        result = engine.apply_labels(sample_statistics_df)
+
+        pd.testing.assert_frame_equal(result, sample_statistics_df)
+
 
 class TestCodeHookManager:
     """Test CodeHookManager class."""
@@ -11,6 +11,7 @@ from py4csr.data.validation import (
     validate_adsl,
     validate_adae,
     validate_adlb,
+    validate_adlb_stream,
     run_full_validation,
 )
 from py4csr.exceptions import validate_required_columns, DataValidationError
@@ -70,6 +71,33 @@ class TestValidateAdsl:
         if "issues" in result:
             assert len(result["issues"]) > 0
 
+    def test_duplicate_subjects(self):
+        """Test repeated subject IDs, including missing IDs, are counted."""
+        df = pd.DataFrame({
+            "USUBJID": ["001", "002", "001", None, None],
+            "STUDYID": ["S1"] * 5,
+            "SUBJID": ["1", "2", "1", "4", "5"],
+        })
+        result = validate_adsl(df)
+
+        assert "Found 2 duplicate subject IDs" in result["issues"]
+        assert result["passed"] is False
+
+    def test_invalid_coded_values(self):
+        """Test invalid SEX and flag values are reported once each."""
+        df = pd.DataFrame({
+            "USUBJID": ["001", "002", "003", "004"],
+            "STUDYID": ["S1"] * 4,
+            "SUBJID": ["1", "2", "3", "4"],
+            "SEX": ["M", "X", "X", None],
+            "SAFFL": ["Y", "N", "Q", None],
+        })
+        result = validate_adsl(df)
+
+        assert "Invalid sex values found: ['X']" in result["warnings"]
+        assert "Invalid SAFFL values found: ['Q']" in result["warnings"]
+        assert "Missing sex for 1 subjects" in result["warnings"]
+
 
 class TestValidateAdae:
     """Test validate_adae function."""
@@ -93,6 +121,51 @@ class TestValidateAdlb:
         result = validate_adlb(sample_adlb)
         assert isinstance(result, dict)
 
+    def test_non_numeric_aval(self):
+        """Test non-numeric AVAL records are counted, ignoring missing values."""
+        df = pd.DataFrame({"AVAL": ["1.5", "high", None, "low"]})
+        result = validate_adlb(df)
+
+        assert "Found 2 records with non-numeric AVAL" in result["issues"]
+        assert result["passed"] is False
+
+
+class TestValidateAdlbStream:
+    """Test validate_adlb_stream function."""
+
+    @pytest.fixture
+    def adlb(self):
+        """Create ADLB records with invalid subjects, codes and values."""
+        return pd.DataFrame({
+            "USUBJID": ["001", "", "002", None, "003", "004"],
+            "PARAMCD": ["ALT", "XYZ", "AST", "ALT", None, "ABC"],
+            "AVAL": ["1.5", "high", None, "3", "low", "2"],
+        })
+
+    def test_chunks_match_in_memory(self, adlb):
+        """Test counts accumulated over chunks match validate_adlb."""
+        chunks = [adlb.iloc[:2], adlb.iloc[2:5], adlb.iloc[5:]]
+
+        result = validate_adlb_stream(iter(chunks))
+
+        assert result == validate_adlb(adlb)
+        assert "Found 2 records with invalid USUBJID" in result["issues"]
+
+    def test_parquet_matches_in_memory(self, adlb, tmp_path):
+        """Test a Parquet file read in batches matches validate_adlb."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "adlb.parquet"
+        adlb.to_parquet(path)
+
+        result = validate_adlb_stream(path, chunk_rows=4)
+
+        assert result == validate_adlb(adlb)
+
+    def test_invalid_chunk_rows(self, adlb):
+        """Test a non-positive chunk size raises error."""
+        with pytest.raises(ValueError, match="chunk_rows"):
+            validate_adlb_stream([adlb], chunk_rows=0)
+
 
 class TestRunFullValidation:
     """Test run_full_validation function."""
@@ -115,6 +188,22 @@ class TestRunFullValidation:
         result = run_full_validation({})
         assert isinstance(result, dict)
 
+    def test_concurrent_matches_serial(self, sample_adsl, sample_adae, sample_adlb):
+        """Test threaded validation keeps dataset order and matches one worker."""
+        datasets = {
+            "ADLB": sample_adlb,
+            "ADSL": sample_adsl,
+            "ADAE": sample_adae,
+            "ADXX": sample_adsl,
+        }
+
+        result = run_full_validation(datasets)
+        serial = run_full_validation(datasets, max_workers=1)
+
+        assert list(result["dataset_reports"]) == ["ADLB", "ADSL", "ADAE", "ADXX"]
+        assert result["dataset_reports"] == serial["dataset_reports"]
+        assert result["overall_passed"] == serial["overall_passed"]
+
 
 class TestValidationWorkflow:
     """Test complete validation workflow."""